@@ -7,21 +7,73 @@ messaging, task management, and conversation management.
 
 import time
 import logging
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Literal, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, Depends, Header, Request
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from hermes.api.responses import ORJSONResponse
+from hermes.utils.ids import new_message_id
 
 logger = logging.getLogger(__name__)
 
+# Services used by the endpoints, set once at application startup
+_A2A_SERVICE = None
+_MESSAGE_BATCHER = None
+
+
+def set_a2a_service(a2a_service, message_batcher=None) -> None:
+    """
+    Set the A2A service and message batcher used by the endpoints.
+    
+    Args:
+        a2a_service: Initialized A2A service
+        message_batcher: Optional batcher for outgoing messages
+    """
+    global _A2A_SERVICE, _MESSAGE_BATCHER
+    _A2A_SERVICE = a2a_service
+    _MESSAGE_BATCHER = message_batcher
+
+
+# Dependency to get the A2A service
+def get_a2a_service():
+    """
+    Get the A2A service.
+    
+    The service is initialized once in the application startup event,
+    so this dependency only checks that it is available. It runs once per
+    request for the whole router; endpoints then use the service directly.
+    """
+    if _A2A_SERVICE is None:
+        raise HTTPException(status_code=500, detail="A2A service not initialized")
+    
+    return _A2A_SERVICE
+
+
+# Dependency to get the outgoing message batcher
+def get_message_batcher():
+    """Get the A2A message batcher."""
+    if _MESSAGE_BATCHER is None:
+        raise HTTPException(status_code=500, detail="Message batcher not initialized")
+    
+    return _MESSAGE_BATCHER
+
+
 # Create router
 a2a_router = APIRouter(
     prefix="/a2a",
     tags=["a2a"],
-    responses={404: {"description": "Not found"}}
+    dependencies=[Depends(get_a2a_service)],
+    responses={404: {"description": "Not found"}},
+    default_response_class=ORJSONResponse
 )
 
+# Allowed message/task priorities and task statuses
+Priority = Literal["low", "normal", "high", "critical"]
+TaskStatus = Literal["created", "assigned", "in_progress", "completed", "failed", "cancelled"]
+
 # Pydantic models for API
 
 class AgentCard(BaseModel):
@@ -44,17 +96,32 @@ class AgentRegistrationResponse(BaseModel):
     message: Optional[str] = None
 
 
-class MessageRequest(BaseModel):
-    """Model for message requests."""
+class Recipient(BaseModel):
+    """Model for message recipients."""
+    model_config = ConfigDict(extra="allow", frozen=True)
+    
+    type: Literal["direct", "capability", "broadcast"]
+    id: Optional[str] = None
+    capability: Optional[str] = None
+
+
+class MessageRouting(BaseModel):
+    """Model for the routing fields of message requests."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
     id: Optional[str] = None
     sender: Dict[str, Any]
-    recipients: List[Dict[str, Any]]
+    recipients: List[Recipient]
     type: str
-    content: Dict[str, Any]
     conversation_id: Optional[str] = None
     reply_to: Optional[str] = None
     intent: Optional[str] = None
-    priority: str = "normal"
+    priority: Priority = "normal"
+
+
+class MessageRequest(MessageRouting):
+    """Model for message requests."""
+    content: Dict[str, Any]
     metadata: Optional[Dict[str, Any]] = None
     security: Optional[Dict[str, Any]] = None
 
@@ -69,6 +136,8 @@ class MessageResponse(BaseModel):
 
 class TaskSpec(BaseModel):
     """Model for task specifications."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
     id: Optional[str] = None
     name: str
     description: str
@@ -76,21 +145,21 @@ class TaskSpec(BaseModel):
     preferred_agent: Optional[str] = None
     parameters: Optional[Dict[str, Any]] = None
     deadline: Optional[float] = None
-    priority: str = "normal"
+    priority: Priority = "normal"
     metadata: Optional[Dict[str, Any]] = None
 
 
 class TaskResponse(BaseModel):
     """Model for task responses."""
     task_id: str
-    status: str
+    status: TaskStatus
     assigned_to: Optional[str] = None
     error: Optional[str] = None
 
 
 class TaskStatusUpdate(BaseModel):
     """Model for task status updates."""
-    status: str
+    status: TaskStatus
     agent_id: Optional[str] = None
     message: Optional[str] = None
     result: Optional[Dict[str, Any]] = None
@@ -112,34 +181,17 @@ class ConversationResponse(BaseModel):
     created_at: float
 
 
-# Dependency to get A2A service from request state
-async def get_a2a_service(request: Request):
-    """Get the A2A service from request state."""
-    if not hasattr(request.app.state, "a2a_service"):
-        raise HTTPException(status_code=500, detail="A2A service not initialized")
-    
-    a2a_service = request.app.state.a2a_service
-    
-    # Ensure service is initialized
-    await a2a_service.initialize()
-    
-    return a2a_service
-
-
 # API endpoints
 
 @a2a_router.post("/register", response_model=AgentRegistrationResponse)
-async def register_agent(
-    agent_card: AgentCard,
-    a2a_service = Depends(get_a2a_service)
-):
+async def register_agent(agent_card: AgentCard):
     """
     Register an agent with the A2A service.
     
     This endpoint allows agents to register their presence,
     capabilities, and connection information.
     """
-    success = await a2a_service.register_agent(agent_card.dict())
+    success = await _A2A_SERVICE.register_agent(agent_card.model_dump(exclude_none=True))
     
     if not success:
         raise HTTPException(status_code=400, detail="Registration failed")
@@ -152,17 +204,14 @@ async def register_agent(
 
 
 @a2a_router.post("/unregister")
-async def unregister_agent(
-    agent_id: str,
-    a2a_service = Depends(get_a2a_service)
-):
+async def unregister_agent(agent_id: str):
     """
     Unregister an agent from the A2A service.
     
     This endpoint allows agents to cleanly remove themselves
     from the registry when shutting down.
     """
-    success = await a2a_service.unregister_agent(agent_id)
+    success = await _A2A_SERVICE.unregister_agent(agent_id)
     
     if not success:
         raise HTTPException(status_code=404, detail="Agent not found")
@@ -170,78 +219,169 @@ async def unregister_agent(
     return {"success": True, "message": "Agent unregistered successfully"}
 
 
-@a2a_router.post("/message", response_model=MessageResponse)
+def _invalid_body_field(field: str, value: Any, missing: bool = False) -> RequestValidationError:
+    """
+    Build a validation error for a message payload field.
+    
+    Args:
+        field: Field name
+        value: Invalid value
+        missing: Whether the field was absent
+        
+    Returns:
+        Validation error to raise
+    """
+    return RequestValidationError([{
+        "type": "missing" if missing else "dict_type",
+        "loc": ("body", field),
+        "msg": "Field required" if missing else "Input should be a valid dictionary",
+        "input": value
+    }])
+
+
+def _parse_message_body(body: bytes) -> Tuple[MessageRouting, Dict[str, Any]]:
+    """
+    Parse a message request body, validating only its routing fields.
+    
+    The opaque payload fields (content, metadata, security) are forwarded
+    as parsed by orjson instead of being rebuilt by the model and dumped
+    again.
+    
+    Args:
+        body: Raw request body
+        
+    Returns:
+        Tuple of (validated routing fields, message dictionary)
+    """
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        raise RequestValidationError([{
+            "type": "json_invalid",
+            "loc": ("body",),
+            "msg": f"JSON decode error: {e}",
+            "input": {}
+        }])
+    
+    if not isinstance(data, dict):
+        raise RequestValidationError([{
+            "type": "dict_type",
+            "loc": ("body",),
+            "msg": "Input should be a valid dictionary",
+            "input": data
+        }])
+    
+    try:
+        routing = MessageRouting.model_validate(data)
+    except ValidationError as e:
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ])
+    
+    msg_dict = routing.model_dump(exclude_none=True)
+    
+    # Only check the payload fields' top-level types; nested values are not walked
+    content = data.get("content")
+    if not isinstance(content, dict):
+        raise _invalid_body_field("content", content, missing="content" not in data)
+    msg_dict["content"] = content
+    
+    for field in ("metadata", "security"):
+        value = data.get(field)
+        if value is None:
+            continue
+        if not isinstance(value, dict):
+            raise _invalid_body_field(field, value)
+        msg_dict[field] = value
+    
+    return routing, msg_dict
+
+
+@a2a_router.post(
+    "/message",
+    responses={200: {"model": MessageResponse}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": "#/components/schemas/MessageRequest"}
+                }
+            }
+        }
+    }
+)
 async def send_message(
-    message: MessageRequest,
-    a2a_service = Depends(get_a2a_service)
+    request: Request,
+    message_batcher = Depends(get_message_batcher)
 ):
     """
     Send a message to one or more agents.
     
     This endpoint allows agents to send messages to other agents
-    based on agent ID or capabilities.
+    based on agent ID or capabilities. Messages are delivered in
+    batches by the message batcher. The body is a MessageRequest; only
+    its routing fields are validated as a model.
     """
-    msg_dict = message.dict()
+    message, msg_dict = _parse_message_body(await request.body())
     
     # Add message ID if not provided
     if not message.id:
-        msg_dict["id"] = f"msg-{int(time.time() * 1000)}"
+        msg_dict["id"] = new_message_id()
     
-    success = await a2a_service.send_message(msg_dict)
+    success = await message_batcher.enqueue(msg_dict)
     
     if not success:
         raise HTTPException(status_code=400, detail="Message sending failed")
     
-    # Get recipient IDs
-    recipient_ids = []
-    for recipient in message.recipients:
-        if recipient.get("type") == "direct":
-            recipient_ids.append(recipient.get("id", "unknown"))
-        # Other recipient types would be resolved by the service
+    # Get direct recipient IDs; other recipient types are resolved by the service
+    recipient_ids = [
+        recipient.id or "unknown"
+        for recipient in message.recipients
+        if recipient.type == "direct"
+    ]
     
-    return MessageResponse(
-        success=True,
-        message_id=msg_dict["id"],
-        timestamp=time.time(),
-        recipients=recipient_ids
-    )
+    return ORJSONResponse(content={
+        "success": True,
+        "message_id": msg_dict["id"],
+        "timestamp": time.time(),
+        "recipients": recipient_ids
+    })
 
 
-@a2a_router.post("/tasks", response_model=TaskResponse)
-async def create_task(
-    task_spec: TaskSpec,
-    a2a_service = Depends(get_a2a_service)
-):
+@a2a_router.post("/tasks", responses={200: {"model": TaskResponse}})
+async def create_task(task_spec: TaskSpec):
     """
     Create a new task.
     
     This endpoint allows agents to create tasks that can be
     assigned to other agents based on capabilities.
     """
-    result = await a2a_service.create_task(task_spec.dict())
+    result = await _A2A_SERVICE.create_task(task_spec.model_dump(exclude_none=True))
     
     if "error" in result:
         raise HTTPException(status_code=400, detail=result["error"])
     
-    return TaskResponse(
-        task_id=result["task_id"],
-        status=result["status"],
-        assigned_to=None  # Task will be assigned asynchronously if needed
-    )
+    return ORJSONResponse(content={
+        "task_id": result["task_id"],
+        "status": result["status"],
+        "assigned_to": None,  # Task will be assigned asynchronously if needed
+        "error": None
+    })
 
 
 @a2a_router.post("/tasks/{task_id}/assign")
 async def assign_task(
     task_id: str,
-    agent_id: str,
-    a2a_service = Depends(get_a2a_service)
+    agent_id: str
 ):
     """
     Assign a task to a specific agent.
     
     This endpoint allows manual assignment of tasks to specific agents.
     """
-    success = await a2a_service.assign_task(task_id, agent_id)
+    success = await _A2A_SERVICE.assign_task(task_id, agent_id)
     
     if not success:
         raise HTTPException(status_code=400, detail="Task assignment failed")
@@ -252,8 +392,7 @@ async def assign_task(
 @a2a_router.post("/tasks/{task_id}/status")
 async def update_task_status(
     task_id: str,
-    status_update: TaskStatusUpdate,
-    a2a_service = Depends(get_a2a_service)
+    status_update: TaskStatusUpdate
 ):
     """
     Update a task's status.
@@ -261,7 +400,7 @@ async def update_task_status(
     This endpoint allows agents to update the status of tasks
     they are working on, including providing results.
     """
-    success = await a2a_service.update_task_status(
+    success = await _A2A_SERVICE.update_task_status(
         task_id=task_id,
         status=status_update.status,
         agent_id=status_update.agent_id,
@@ -272,20 +411,21 @@ async def update_task_status(
     if not success:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    return {"success": True, "task_id": task_id, "status": status_update.status}
+    return ORJSONResponse(content={
+        "success": True,
+        "task_id": task_id,
+        "status": status_update.status
+    })
 
 
 @a2a_router.get("/tasks/{task_id}")
-async def get_task(
-    task_id: str,
-    a2a_service = Depends(get_a2a_service)
-):
+async def get_task(task_id: str):
     """
     Get task information.
     
     This endpoint allows retrieval of information about a specific task.
     """
-    task = await a2a_service.get_task(task_id)
+    task = await _A2A_SERVICE.get_task(task_id)
     
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -294,16 +434,13 @@ async def get_task(
 
 
 @a2a_router.post("/conversations", response_model=ConversationResponse)
-async def start_conversation(
-    conversation_req: ConversationRequest,
-    a2a_service = Depends(get_a2a_service)
-):
+async def start_conversation(conversation_req: ConversationRequest):
     """
     Start a new conversation.
     
     This endpoint creates a new conversation between multiple agents.
     """
-    conversation_id = await a2a_service.start_conversation(
+    conversation_id = await _A2A_SERVICE.start_conversation(
         participants=conversation_req.participants,
         topic=conversation_req.topic,
         context=conversation_req.context,
@@ -314,7 +451,7 @@ async def start_conversation(
         raise HTTPException(status_code=400, detail="Failed to start conversation")
     
     # Get the created conversation
-    conversation = await a2a_service.get_conversation(conversation_id)
+    conversation = await _A2A_SERVICE.get_conversation(conversation_id)
     
     return ConversationResponse(
         conversation_id=conversation_id,
@@ -327,8 +464,7 @@ async def start_conversation(
 @a2a_router.post("/conversations/{conversation_id}/messages")
 async def add_to_conversation(
     conversation_id: str,
-    message: MessageRequest,
-    a2a_service = Depends(get_a2a_service)
+    message: MessageRequest
 ):
     """
     Add a message to a conversation.
@@ -336,32 +472,33 @@ async def add_to_conversation(
     This endpoint adds a message to an existing conversation.
     """
     # Ensure message has the conversation ID
-    msg_dict = message.dict()
+    msg_dict = message.model_dump(exclude_none=True)
     msg_dict["conversation_id"] = conversation_id
     
-    success = await a2a_service.add_to_conversation(conversation_id, msg_dict)
+    # Add message ID if not provided
+    if not message.id:
+        msg_dict["id"] = new_message_id()
+    
+    success = await _A2A_SERVICE.add_to_conversation(conversation_id, msg_dict)
     
     if not success:
         raise HTTPException(status_code=404, detail="Conversation not found")
     
-    return {
+    return ORJSONResponse(content={
         "success": True,
         "conversation_id": conversation_id,
         "message_id": msg_dict.get("id")
-    }
+    })
 
 
 @a2a_router.get("/conversations/{conversation_id}")
-async def get_conversation(
-    conversation_id: str,
-    a2a_service = Depends(get_a2a_service)
-):
+async def get_conversation(conversation_id: str):
     """
     Get conversation information.
     
     This endpoint retrieves information about a specific conversation.
     """
-    conversation = await a2a_service.get_conversation(conversation_id)
+    conversation = await _A2A_SERVICE.get_conversation(conversation_id)
     
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
@@ -370,16 +507,13 @@ async def get_conversation(
 
 
 @a2a_router.get("/agents/{agent_id}")
-async def get_agent(
-    agent_id: str,
-    a2a_service = Depends(get_a2a_service)
-):
+async def get_agent(agent_id: str):
     """
     Get agent information.
     
     This endpoint retrieves information about a specific agent.
     """
-    agent = await a2a_service.get_agent(agent_id)
+    agent = await _A2A_SERVICE.get_agent(agent_id)
     
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
@@ -8,14 +8,14 @@ integrating all API endpoints and initializing required services.
 import os
 import sys
 import logging
-import uvicorn
 import asyncio
-import subprocess
 import signal
-import atexit
+import socket
+import subprocess
 import time
+import orjson
 from pathlib import Path
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from hermes.core.service_discovery import ServiceRegistry
@@ -23,26 +23,30 @@ from hermes.core.message_bus import MessageBus
 from hermes.core.registration import RegistrationManager
 from hermes.core.database.manager import DatabaseManager
 from hermes.utils.port_config import get_hermes_port, get_db_mcp_port
+from hermes.api.responses import ORJSONResponse, TimestampedJSONBody
+from hermes.utils.logging_helper import setup_queue_logging
+from hermes.utils.server_helper import get_server_backends
+from hermes.utils import clock
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+# Configure logging; records are written to stderr by a background thread
+setup_queue_logging(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Import API endpoints
-from hermes.api.endpoints import app as api_app
+from hermes.api.endpoints import app as api_app, set_registration_manager
 from hermes.api.database import api_router as database_router
-from hermes.api.llm_endpoints import llm_router
-from hermes.api.a2a_endpoints import a2a_router
-from hermes.api.mcp_endpoints import mcp_router
+# The LLM endpoints' adapter is shared by the whole app, so it uses one
+# LLM connection pool
+from hermes.api.llm_endpoints import llm_router, llm_adapter
+from hermes.api.a2a_endpoints import a2a_router, set_a2a_service
+from hermes.api.mcp_endpoints import mcp_router, set_mcp_service
 
 # Main FastAPI application
 app = FastAPI(
     title="Hermes API",
     description="Unified Registration Protocol and Database Services API",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -69,9 +73,24 @@ api_app.include_router(a2a_router)
 # Add MCP API routes
 api_app.include_router(mcp_router)
 
-# Create service registry and message bus instances
-service_registry = ServiceRegistry()
-message_bus = MessageBus()
+# Create service registry and message bus instances. With HERMES_REDIS_URL
+# set, registrations and messages are shared with other workers via Redis.
+redis_url = os.environ.get("HERMES_REDIS_URL")
+redis_pool = None
+
+if redis_url:
+    from hermes.core.redis_backend import (
+        RedisServiceRegistry, RedisMessageBus, create_connection_pool
+    )
+    redis_pool = create_connection_pool(
+        redis_url,
+        max_connections=int(os.environ.get("HERMES_REDIS_MAX_CONNECTIONS", "64"))
+    )
+    service_registry = RedisServiceRegistry(redis_pool)
+    message_bus = RedisMessageBus(redis_pool)
+else:
+    service_registry = ServiceRegistry()
+    message_bus = MessageBus()
 
 # Create registration manager
 registration_manager = RegistrationManager(
@@ -80,10 +99,6 @@ registration_manager = RegistrationManager(
     secret_key=os.environ.get("HERMES_SECRET_KEY", "tekton-secret-key"),
 )
 
-# Create LLM adapter
-from hermes.core.llm_adapter import LLMAdapter
-llm_adapter = LLMAdapter()
-
 # Create database manager
 database_manager = DatabaseManager(
     base_path=os.environ.get("HERMES_DATA_DIR", "~/.tekton/data")
@@ -92,6 +107,7 @@ database_manager = DatabaseManager(
 # Create A2A and MCP services
 from hermes.core.a2a_service import A2AService
 from hermes.core.mcp_service import MCPService
+from hermes.core.message_batcher import MessageBatcher
 
 a2a_service = A2AService(
     service_registry=service_registry,
@@ -105,9 +121,22 @@ mcp_service = MCPService(
     registration_manager=registration_manager
 )
 
+# Create the batcher for outgoing A2A messages
+message_batcher = MessageBatcher(
+    a2a_service=a2a_service,
+    batch_size=int(os.environ.get("HERMES_A2A_BATCH_SIZE", "50")),
+    flush_interval=float(os.environ.get("HERMES_A2A_FLUSH_INTERVAL", "0.005"))
+)
+
 # Track the database MCP server process
 database_mcp_process = None
 
+# Tasks started from signal handlers, kept referenced until they finish
+_shutdown_tasks = set()
+
+# Task refreshing the cached clock used for response timestamps
+_clock_task = None
+
 # Add application state
 app.state.service_registry = service_registry
 app.state.message_bus = message_bus
@@ -116,17 +145,25 @@ app.state.database_manager = database_manager
 app.state.llm_adapter = llm_adapter
 app.state.a2a_service = a2a_service
 app.state.mcp_service = mcp_service
+app.state.message_batcher = message_batcher
 
-async def start_database_mcp_server():
-    """Start the Database MCP server as a separate process."""
-    global database_mcp_process
+# Hand the services to the endpoints mounted under /api, which do not see
+# this application's state
+set_registration_manager(registration_manager)
+set_a2a_service(a2a_service, message_batcher)
+set_mcp_service(mcp_service)
+
+def _database_mcp_command():
+    """
+    Build the command that runs the Database MCP server.
     
+    Returns:
+        Tuple of (command, host, port), or None if the server script is missing
+    """
     # Get configuration from environment
-    from hermes.utils.port_config import get_db_mcp_port
     db_mcp_port = str(get_db_mcp_port())
     db_mcp_host = os.environ.get("DB_MCP_HOST", "127.0.0.1")
     debug_mode = os.environ.get("DEBUG", "False").lower() == "true"
-    data_dir = os.environ.get("HERMES_DATA_DIR", "~/.tekton/data")
     
     # Find the script path
     project_root = Path(__file__).parent.parent.parent.parent
@@ -134,7 +171,7 @@ async def start_database_mcp_server():
     
     if not script_path.exists():
         logger.error(f"Database MCP server script not found at {script_path}")
-        return False
+        return None
     
     # Build command arguments
     cmd = [
@@ -147,40 +184,76 @@ async def start_database_mcp_server():
     if debug_mode:
         cmd.append("--debug")
     
+    return cmd, db_mcp_host, int(db_mcp_port)
+
+async def start_database_mcp_server():
+    """Start the Database MCP server as a separate process."""
+    global database_mcp_process
+    
+    command = _database_mcp_command()
+    if command is None:
+        return False
+    cmd, db_mcp_host, db_mcp_port = command
+    
     try:
         # Start the process
         logger.info(f"Starting Database MCP server: {' '.join(cmd)}")
-        database_mcp_process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+        database_mcp_process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
         )
         
-        # Register cleanup function
-        atexit.register(stop_database_mcp_server)
-        
-        # Wait a bit for the server to start
-        await asyncio.sleep(2)
-        
-        # Check if the process is still running
-        if database_mcp_process.poll() is None:
+        # Wait until the server accepts connections or the process exits
+        if await _wait_for_port(db_mcp_host, db_mcp_port, database_mcp_process):
             logger.info("Database MCP server started successfully")
             return True
-        else:
+        
+        if database_mcp_process.returncode is not None:
             # Process has terminated
-            stdout, stderr = database_mcp_process.communicate()
-            logger.error(f"Database MCP server failed to start: {stderr}")
-            return False
+            _, stderr = await database_mcp_process.communicate()
+            logger.error(f"Database MCP server failed to start: {stderr.decode(errors='replace')}")
+        else:
+            logger.error("Database MCP server did not become ready in time")
+        return False
     except Exception as e:
         logger.error(f"Error starting Database MCP server: {e}")
         return False
 
-def stop_database_mcp_server():
+async def _wait_for_port(host: str, port: int, process, timeout: float = 10.0) -> bool:
+    """
+    Wait until a TCP port accepts connections.
+    
+    Args:
+        host: Host to connect to
+        port: Port to connect to
+        process: Server process; waiting stops early if it exits
+        timeout: Maximum time to wait in seconds
+        
+    Returns:
+        True if the port became reachable
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    
+    while loop.time() < deadline and process.returncode is None:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            await asyncio.sleep(0.05)
+            continue
+        
+        writer.close()
+        await writer.wait_closed()
+        return True
+    
+    return False
+
+async def stop_database_mcp_server():
     """Stop the Database MCP server process."""
     global database_mcp_process
     
-    if database_mcp_process:
+    if database_mcp_process and database_mcp_process.returncode is None:
         logger.info("Stopping Database MCP server")
         
         try:
@@ -189,119 +262,171 @@ def stop_database_mcp_server():
             
             # Wait for graceful shutdown (max 5 seconds)
             try:
-                database_mcp_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
+                await asyncio.wait_for(database_mcp_process.wait(), timeout=5)
+            except asyncio.TimeoutError:
                 # Force kill if not responding
                 database_mcp_process.kill()
             
             logger.info("Database MCP server stopped")
+        except ProcessLookupError:
+            pass
         except Exception as e:
             logger.error(f"Error stopping Database MCP server: {e}")
+    
+    database_mcp_process = None
+
+def _install_shutdown_signal_handlers():
+    """
+    Stop the Database MCP server as soon as a termination signal arrives.
+    
+    The server's own handlers (e.g. uvicorn's) are chained, so a signal both
+    starts stopping the child process and triggers the normal graceful
+    shutdown. Nothing is installed when no such handler is present, since
+    the shutdown event then takes care of the child process.
+    """
+    loop = asyncio.get_running_loop()
+    
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        # A handler registered through the loop (uvicorn < 0.29) can't be
+        # chained and would be overwritten, so leave it in place
+        if sig in getattr(loop, "_signal_handlers", {}):
+            continue
         
-        database_mcp_process = None
+        previous = signal.getsignal(sig)
+        if not callable(previous) or previous is signal.default_int_handler:
+            continue
+        
+        def handle(sig=sig, previous=previous):
+            task = loop.create_task(stop_database_mcp_server())
+            _shutdown_tasks.add(task)
+            task.add_done_callback(_shutdown_tasks.discard)
+            previous(sig, None)
+        
+        try:
+            loop.add_signal_handler(sig, handle)
+        except (NotImplementedError, RuntimeError, ValueError):
+            # Signal handlers are unavailable on this platform or thread
+            pass
+
+def _worker_count() -> int:
+    """Get the number of server worker processes configured by HERMES_WORKERS."""
+    return max(1, int(os.environ.get("HERMES_WORKERS", "1")))
+
+def _register_hermes_components():
+    """Register the API server, database MCP server and services in one batch."""
+    db_port = os.environ.get("DB_MCP_PORT", "8002")
+    components = [
+        {
+            "component_id": "hermes-api",
+            "name": "Hermes API Server",
+            "version": "0.1.0",
+            "component_type": "hermes",
+            "endpoint": f"http://localhost:{get_hermes_port()}/api",
+            "capabilities": [
+                "registration", 
+                "service_discovery", 
+                "message_bus", 
+                "database", 
+                "a2a", 
+                "mcp"
+            ],
+            "metadata": {
+                "description": "Central registration and messaging service for Tekton ecosystem"
+            }
+        },
+        {
+            "component_id": "hermes-database-mcp",
+            "name": "Hermes Database MCP Server",
+            "version": "0.1.0",
+            "component_type": "hermes",
+            "endpoint": f"http://localhost:{db_port}",
+            "capabilities": ["database", "mcp"],
+            "metadata": {
+                "description": "Database services provider for Tekton ecosystem",
+                "supported_databases": ["vector", "graph", "key_value", "document", "cache", "relation"]
+            }
+        },
+        {
+            "component_id": "hermes-a2a-service",
+            "name": "Hermes A2A Service",
+            "version": "0.1.0",
+            "component_type": "hermes",
+            "endpoint": f"http://localhost:{get_hermes_port()}/api/a2a",
+            "capabilities": ["a2a", "agent_registry", "task_management", "conversation_management"],
+            "metadata": {
+                "description": "Agent-to-Agent communication service for Tekton ecosystem"
+            }
+        },
+        {
+            "component_id": "hermes-mcp-service",
+            "name": "Hermes MCP Service",
+            "version": "0.1.0",
+            "component_type": "hermes",
+            "endpoint": f"http://localhost:{get_hermes_port()}/api/mcp",
+            "capabilities": ["mcp", "tool_registry", "message_processing", "context_management"],
+            "metadata": {
+                "description": "Multimodal Cognitive Protocol service for Tekton ecosystem"
+            }
+        }
+    ]
+    
+    results = registration_manager.register_components_bulk(components)
+    
+    for component, (success, _) in zip(components, results):
+        if success:
+            logger.info(f"{component['name']} registered with ID: {component['component_id']}")
+        else:
+            logger.warning(f"Failed to register {component['name']}")
+
+async def _register_shared_components():
+    """Register the Hermes components once in the registry shared through Redis."""
+    # Registrations made before connecting are pushed to Redis on connect
+    _register_hermes_components()
+    try:
+        await service_registry.connect_redis()
+        await service_registry.close_redis()
+    finally:
+        await redis_pool.disconnect()
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
+    global _clock_task
     logger.info("Hermes API server starting up")
     
     # Start service registry health check monitoring
     service_registry.start()
     
+    # Join the registry and message bus shared with other workers
+    if redis_pool is not None:
+        await service_registry.connect_redis()
+        await message_bus.connect_redis()
+    
     # Initialize A2A and MCP services
     await a2a_service.initialize()
     await mcp_service.initialize()
     
-    # Start database MCP server in a separate process
-    await start_database_mcp_server()
-    
-    # Register the API server itself
-    component_id = "hermes-api"
-    success, _ = registration_manager.register_component(
-        component_id=component_id,
-        name="Hermes API Server",
-        version="0.1.0",
-        component_type="hermes",
-        endpoint=f"http://localhost:{get_hermes_port()}/api",
-        capabilities=[
-            "registration", 
-            "service_discovery", 
-            "message_bus", 
-            "database", 
-            "a2a", 
-            "mcp"
-        ],
-        metadata={
-            "description": "Central registration and messaging service for Tekton ecosystem"
-        }
-    )
-    
-    if success:
-        logger.info(f"Hermes API server registered with ID: {component_id}")
-    else:
-        logger.warning("Failed to register Hermes API server")
-    
-    # Register the database MCP server
-    db_component_id = "hermes-database-mcp"
-    db_port = os.environ.get("DB_MCP_PORT", "8002")
+    # Start batched delivery of outgoing A2A messages
+    message_batcher.start()
     
-    success, _ = registration_manager.register_component(
-        component_id=db_component_id,
-        name="Hermes Database MCP Server",
-        version="0.1.0",
-        component_type="hermes",
-        endpoint=f"http://localhost:{db_port}",
-        capabilities=["database", "mcp"],
-        metadata={
-            "description": "Database services provider for Tekton ecosystem",
-            "supported_databases": ["vector", "graph", "key_value", "document", "cache", "relation"]
-        }
-    )
-    
-    if success:
-        logger.info(f"Database MCP server registered with ID: {db_component_id}")
-    else:
-        logger.warning("Failed to register Database MCP server")
-    
-    # Register the A2A service
-    a2a_component_id = "hermes-a2a-service"
-    
-    success, _ = registration_manager.register_component(
-        component_id=a2a_component_id,
-        name="Hermes A2A Service",
-        version="0.1.0",
-        component_type="hermes",
-        endpoint=f"http://localhost:{get_hermes_port()}/api/a2a",
-        capabilities=["a2a", "agent_registry", "task_management", "conversation_management"],
-        metadata={
-            "description": "Agent-to-Agent communication service for Tekton ecosystem"
-        }
+    # Start the cached clock used for response timestamps. Its 50 ms default
+    # is well within the 100 ms the health body re-renders at.
+    _clock_task = asyncio.create_task(
+        clock.run_clock(float(os.environ.get("HERMES_CLOCK_INTERVAL", "0.05")))
     )
     
-    if success:
-        logger.info(f"A2A service registered with ID: {a2a_component_id}")
-    else:
-        logger.warning("Failed to register A2A service")
-    
-    # Register the MCP service
-    mcp_component_id = "hermes-mcp-service"
-    
-    success, _ = registration_manager.register_component(
-        component_id=mcp_component_id,
-        name="Hermes MCP Service",
-        version="0.1.0",
-        component_type="hermes",
-        endpoint=f"http://localhost:{get_hermes_port()}/api/mcp",
-        capabilities=["mcp", "tool_registry", "message_processing", "context_management"],
-        metadata={
-            "description": "Multimodal Cognitive Protocol service for Tekton ecosystem"
-        }
-    )
+    # Start database MCP server in a separate process. With several workers,
+    # run_server starts the one server they share.
+    if _worker_count() == 1:
+        await start_database_mcp_server()
+        _install_shutdown_signal_handlers()
     
-    if success:
-        logger.info(f"MCP service registered with ID: {mcp_component_id}")
-    else:
-        logger.warning("Failed to register MCP service")
+    # Register the API server, database MCP server and services in one
+    # batch. Registrations in a shared registry are made once by run_server.
+    # This runs on the loop: registration events reach subscribers
+    # synchronously and the registry indexes are not locked.
+    if _worker_count() == 1 or redis_pool is None:
+        _register_hermes_components()
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -311,46 +436,139 @@ async def shutdown_event():
     # Stop service registry monitoring
     service_registry.stop()
     
+    # Deliver queued A2A messages and stop the batcher
+    await message_batcher.stop()
+    
+    # Publish queued MCP events
+    await mcp_service.close()
+    
+    # Stop the cached clock
+    if _clock_task is not None:
+        _clock_task.cancel()
+    
     # Close all database connections
     await database_manager.close_all_connections()
     
+    # Close the LLM client's connections
+    await llm_adapter.aclose()
+    
+    # Leave the shared registry and message bus
+    if redis_pool is not None:
+        await message_bus.close_redis()
+        await service_registry.close_redis()
+        await redis_pool.disconnect()
+    
     # Stop the database MCP server
-    stop_database_mcp_server()
+    await stop_database_mcp_server()
+
+# Static response bodies, encoded once at import time
+_ROOT_BYTES = orjson.dumps(
+    {"message": "Welcome to Hermes API. Visit /docs for API documentation."}
+)
+_HEALTH_BODY = TimestampedJSONBody({
+    "status": "healthy",
+    "components": {
+        "service_registry": True,
+        "message_bus": True,
+        "registration_manager": True,
+        "database_manager": True,
+        "a2a_service": True,
+        "mcp_service": True
+    }
+})
 
 @app.get("/")
 async def root():
     """Root endpoint that redirects to the API documentation."""
-    return {"message": "Welcome to Hermes API. Visit /docs for API documentation."}
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "components": {
-            "service_registry": True,
-            "message_bus": True,
-            "registration_manager": True,
-            "database_manager": True,
-            "a2a_service": True,
-            "mcp_service": True
-        },
-        "timestamp": time.time()
-    }
+    return Response(content=_HEALTH_BODY.render(), media_type="application/json")
+
+def _start_shared_database_mcp_server():
+    """
+    Start the Database MCP server shared by all worker processes.
+    
+    Returns:
+        The server process, or None if it could not be started
+    """
+    command = _database_mcp_command()
+    if command is None:
+        return None
+    cmd, db_mcp_host, db_mcp_port = command
+    
+    logger.info(f"Starting Database MCP server: {' '.join(cmd)}")
+    try:
+        process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL)
+    except Exception as e:
+        logger.error(f"Error starting Database MCP server: {e}")
+        return None
+    
+    # Wait until the server accepts connections or the process exits
+    deadline = time.monotonic() + 10.0
+    while time.monotonic() < deadline and process.poll() is None:
+        try:
+            socket.create_connection((db_mcp_host, db_mcp_port), timeout=1).close()
+        except OSError:
+            time.sleep(0.05)
+            continue
+        
+        logger.info("Database MCP server started successfully")
+        return process
+    
+    if process.poll() is not None:
+        logger.error(f"Database MCP server failed to start (exit code {process.returncode})")
+        return None
+    
+    logger.error("Database MCP server did not become ready in time")
+    return process
 
 def run_server():
     """Run the Hermes API server."""
-    from hermes.utils.port_config import get_hermes_port
+    # Only needed when serving, so keep it out of the import path
+    import uvicorn
+    
     port = get_hermes_port()
     host = os.environ.get("HOST", "0.0.0.0")
     
-    logger.info(f"Starting Hermes API server on {host}:{port}")
-    uvicorn.run(
-        "hermes.api.app:app",
-        host=host,
-        port=port,
-        reload=os.environ.get("DEBUG", "False").lower() == "true"
-    )
+    # A2A and MCP state always lives in-process, and the registry and message
+    # bus are only shared when HERMES_REDIS_URL is set, so run additional
+    # workers only where that split is acceptable
+    workers = _worker_count()
+    reload = os.environ.get("DEBUG", "False").lower() == "true" and workers == 1
+    
+    # Prefer uvloop and httptools when available
+    loop, http = get_server_backends()
+    
+    # Workers share one database MCP server and, with Redis, one set of
+    # registrations, so set those up here rather than in every worker
+    db_mcp_process = None
+    if workers > 1:
+        db_mcp_process = _start_shared_database_mcp_server()
+        if redis_pool is not None:
+            asyncio.run(_register_shared_components())
+    
+    logger.info(f"Starting Hermes API server on {host}:{port} (workers={workers}, loop={loop}, http={http})")
+    try:
+        uvicorn.run(
+            "hermes.api.app:app",
+            host=host,
+            port=port,
+            reload=reload,
+            workers=workers,
+            loop=loop,
+            http=http
+        )
+    finally:
+        if db_mcp_process is not None and db_mcp_process.poll() is None:
+            logger.info("Stopping Database MCP server")
+            db_mcp_process.terminate()
+            try:
+                db_mcp_process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                db_mcp_process.kill()
 
 if __name__ == "__main__":
     run_server()
\ No newline at end of file
@@ -5,6 +5,7 @@ This module provides the base request handler and common functionality
 for all database-specific clients.
 """
 
+import os
 import logging
 import aiohttp
 from typing import Dict, List, Any, Optional, Union
@@ -12,6 +13,13 @@ from typing import Dict, List, Any, Optional, Union
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Connection pool limits for database service requests
+POOL_LIMIT = int(os.environ.get("HERMES_DB_POOL_LIMIT", "200"))
+POOL_LIMIT_PER_HOST = int(os.environ.get("HERMES_DB_POOL_PER_HOST", "100"))
+
+# Seconds to cache resolved database service addresses
+DNS_CACHE_TTL = 300
+
 
 class BaseRequest:
     """
@@ -24,7 +32,8 @@ class BaseRequest:
     def __init__(self,
                 endpoint: str,
                 use_mcp: bool = True,
-                component_id: str = None):
+                component_id: str = None,
+                session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize the request handler.
         
@@ -32,10 +41,40 @@ class BaseRequest:
             endpoint: API endpoint for database services
             use_mcp: Whether to use the MCP protocol
             component_id: Component identifier
+            session: Optional HTTP session to share with other clients
         """
         self.endpoint = endpoint
         self.use_mcp = use_mcp
         self.component_id = component_id
+        
+        # Reused across requests so connections are kept alive
+        self._session = session
+        self._owns_session = session is None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the pooled HTTP session, creating it on first use.
+        
+        Returns:
+            HTTP session
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=POOL_LIMIT,
+                    limit_per_host=POOL_LIMIT_PER_HOST,
+                    ttl_dns_cache=DNS_CACHE_TTL
+                )
+            )
+            self._owns_session = True
+        
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the HTTP session if it was created by this handler."""
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     async def mcp_invoke(self, capability: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -59,14 +98,14 @@ class BaseRequest:
         }
         
         # Make HTTP request to MCP endpoint
-        async with aiohttp.ClientSession() as session:
-            async with session.post(f"{self.endpoint}/invoke", json=payload) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"MCP request failed: {error_text}")
-                    return {"error": f"MCP request failed with status {response.status}: {error_text}"}
-                
-                return await response.json()
+        session = await self._get_session()
+        async with session.post(f"{self.endpoint}/invoke", json=payload) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                logger.error(f"MCP request failed: {error_text}")
+                return {"error": f"MCP request failed with status {response.status}: {error_text}"}
+            
+            return await response.json()
     
     async def api_request(self, method: str, path: str, data: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -87,26 +126,26 @@ class BaseRequest:
             data["client_id"] = self.component_id
         
         # Make HTTP request
-        async with aiohttp.ClientSession() as session:
-            if method == "GET":
-                async with session.get(url, params=data) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"API request failed: {error_text}")
-                        return {"error": f"API request failed with status {response.status}: {error_text}"}
-                    
-                    return await response.json()
-            else:
-                async with session.request(method, url, json=data) as response:
-                    if response.status not in (200, 201, 204):
-                        error_text = await response.text()
-                        logger.error(f"API request failed: {error_text}")
-                        return {"error": f"API request failed with status {response.status}: {error_text}"}
-                    
-                    if response.status == 204:
-                        return {"success": True}
-                    
-                    return await response.json()
+        session = await self._get_session()
+        if method == "GET":
+            async with session.get(url, params=data) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"API request failed: {error_text}")
+                    return {"error": f"API request failed with status {response.status}: {error_text}"}
+                
+                return await response.json()
+        else:
+            async with session.request(method, url, json=data) as response:
+                if response.status not in (200, 201, 204):
+                    error_text = await response.text()
+                    logger.error(f"API request failed: {error_text}")
+                    return {"error": f"API request failed with status {response.status}: {error_text}"}
+                
+                if response.status == 204:
+                    return {"success": True}
+                
+                return await response.json()
     
     async def execute_request(self, 
                             capability: str, 
@@ -10,6 +10,7 @@ from typing import Dict, List, Any, Optional, Union
 import logging
 
 from hermes.core.database.manager import DatabaseManager
+from hermes.api.responses import ORJSONResponse
 from hermes.core.database.database_types import DatabaseType, DatabaseBackend
 from hermes.api.database.models import (
     VectorStoreRequest,
@@ -31,7 +32,7 @@ from hermes.api.database.models import (
 logger = logging.getLogger(__name__)
 
 # Create API router
-router = APIRouter(prefix="/database", tags=["database"])
+router = APIRouter(prefix="/database", tags=["database"], default_response_class=ORJSONResponse)
 
 # Dependency for getting database manager
 async def get_database_manager():
@@ -72,6 +72,16 @@ class DatabaseClient:
         
         logger.info(f"Database client initialized with endpoint {self.endpoint}, MCP mode: {use_mcp}")
     
+    async def close(self) -> None:
+        """Close the client's pooled HTTP connections."""
+        await self.request_handler.close()
+    
+    async def __aenter__(self) -> "DatabaseClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
     # Vector database operations - direct methods for backwards compatibility
     
     async def vector_store(self, **kwargs):
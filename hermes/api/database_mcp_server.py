@@ -30,12 +30,15 @@ logger = logging.getLogger("hermes.database_mcp_server")
 # Import Hermes modules
 from hermes.core.database.manager import DatabaseManager
 from hermes.core.database.mcp_adapter import DatabaseMCPAdapter
+from hermes.api.responses import ORJSONResponse
+from hermes.utils.server_helper import get_server_backends
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Hermes Database MCP Server",
     description="Multi-Capability Provider server for Hermes database services",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -154,7 +157,8 @@ def main():
     logger.info(f"Starting Hermes Database MCP server on {args.host}:{args.port}")
     logger.info(f"Data directory: {os.environ.get('HERMES_DATA_DIR', '~/.tekton/data')}")
     
-    uvicorn.run(app, host=args.host, port=args.port)
+    loop, http = get_server_backends()
+    uvicorn.run(app, host=args.host, port=args.port, loop=loop, http=http)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,12 +5,14 @@ This module provides FastAPI endpoints for component registration,
 heartbeat monitoring, and service discovery.
 """
 
-import time
+import os
 import logging
-from typing import Dict, List, Any, Optional
+from itertools import chain, islice
+from typing import Dict, List, Any, Optional, Iterator, Tuple
 
-from fastapi import FastAPI, HTTPException, Depends, Header, Request
+from fastapi import FastAPI, HTTPException, Header, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from hermes.core.registration import (
@@ -20,6 +22,8 @@ from hermes.core.registration import (
 )
 from hermes.core.service_discovery import ServiceRegistry
 from hermes.core.message_bus import MessageBus
+from hermes.api.responses import ORJSONResponse, TimestampedJSONBody, dumps
+from hermes.utils import clock
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -29,6 +33,7 @@ app = FastAPI(
     title="Hermes Registration API",
     description="API for the Unified Registration Protocol",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -40,22 +45,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Dependency to get registration manager
-def get_registration_manager():
-    """Get the registration manager instance."""
-    # In a real implementation, this would be a singleton or stored in app state
-    # For now, we'll create a new instance each time
-    service_registry = ServiceRegistry()
-    message_bus = MessageBus()
+# Registration manager shared by all requests. The main Hermes application
+# sets it; when this app runs on its own, it is created at startup.
+_REGISTRATION_MANAGER: Optional[RegistrationManager] = None
+_owns_registration_manager = False
+
+def set_registration_manager(manager: RegistrationManager) -> None:
+    """
+    Set the registration manager used by the endpoints.
     
-    # Start health check monitoring
-    service_registry.start()
+    Args:
+        manager: Registration manager instance
+    """
+    global _REGISTRATION_MANAGER
+    _REGISTRATION_MANAGER = manager
+
+# Registration manager lookup; called directly rather than through Depends to
+# keep dependency resolution off the request path
+def get_registration_manager() -> RegistrationManager:
+    """Get the registration manager instance."""
+    if _REGISTRATION_MANAGER is None:
+        raise HTTPException(status_code=500, detail="Registration manager not initialized")
     
-    return RegistrationManager(
-        service_registry=service_registry,
-        message_bus=message_bus,
-        secret_key="tekton-secret-key"  # In production, this would be loaded from environment
-    )
+    return _REGISTRATION_MANAGER
 
 # Pydantic models for request/response validation
 
@@ -111,19 +123,74 @@ class ServiceResponse(BaseModel):
     class Config:
         allow_population_by_field_name = True
 
+# Health check response body, re-rendered at most every 100 ms
+_HEALTH_BODY = TimestampedJSONBody({"status": "healthy", "version": "0.1.0"})
+
+# Query results larger than this are streamed, _QUERY_STREAM_BATCH entries per chunk
+_QUERY_STREAM_THRESHOLD = 500
+_QUERY_STREAM_BATCH = 256
+
+def _format_service(service_id: str, service: Dict[str, Any], healthy: Optional[bool]) -> Dict[str, Any]:
+    """
+    Format a registry entry as a service query result.
+    
+    Args:
+        service_id: Service ID
+        service: Service information from the registry
+        healthy: Last health check result
+        
+    Returns:
+        Service information in the ServiceResponse format
+    """
+    metadata = service.get("metadata", {})
+    return {
+        "component_id": service_id,
+        "name": service.get("name", "Unknown"),
+        "version": service.get("version", "Unknown"),
+        "type": metadata.get("type", "Unknown"),
+        "endpoint": service.get("endpoint", ""),
+        "capabilities": service.get("capabilities", []),
+        "metadata": metadata,
+        "healthy": healthy,
+        "last_heartbeat": service.get("last_heartbeat")
+    }
+
+async def _stream_services(matches: Iterator[Tuple[str, Dict[str, Any], Optional[bool]]]):
+    """
+    Format and encode service query results as a JSON array, one batch at a time.
+    
+    Only one batch of formatted entries is held in memory at once.
+    
+    Args:
+        matches: Matching services, as yielded by ServiceRegistry.iter_services
+        
+    Yields:
+        Chunks of the encoded JSON array
+    """
+    separator = b"["
+    while True:
+        batch = [_format_service(*match) for match in islice(matches, _QUERY_STREAM_BATCH)]
+        if not batch:
+            break
+        
+        # Splice the batch arrays into one array
+        yield separator + dumps(batch)[1:-1]
+        separator = b","
+    
+    yield b"]" if separator == b"," else b"[]"
+
 # API endpoints
 
 @app.post("/register", response_model=ComponentRegistrationResponse)
-async def register_component(
-    registration: ComponentRegistrationRequest,
-    manager: RegistrationManager = Depends(get_registration_manager)
-):
+async def register_component(registration: ComponentRegistrationRequest):
     """
     Register a component with the Tekton ecosystem.
     
     This endpoint allows components to register their presence,
     capabilities, and connection information.
     """
+    manager = get_registration_manager()
+    
     # Generate component ID if not provided
     component_id = registration.component_id
     if not component_id:
@@ -156,8 +223,7 @@ async def register_component(
 @app.post("/heartbeat", response_model=HeartbeatResponse)
 async def send_heartbeat(
     heartbeat: HeartbeatRequest,
-    x_authentication_token: str = Header(...),
-    manager: RegistrationManager = Depends(get_registration_manager)
+    x_authentication_token: str = Header(...)
 ):
     """
     Send a heartbeat to indicate a component is still active.
@@ -165,6 +231,8 @@ async def send_heartbeat(
     This endpoint allows components to maintain their active status
     and update their health information.
     """
+    manager = get_registration_manager()
+    
     # Send heartbeat
     success = manager.send_heartbeat(
         component_id=heartbeat.component_id,
@@ -177,15 +245,14 @@ async def send_heartbeat(
     
     return HeartbeatResponse(
         success=True,
-        timestamp=time.time(),
+        timestamp=clock.now(),
         message="Heartbeat received"
     )
 
 @app.post("/unregister")
 async def unregister_component(
     component_id: str,
-    x_authentication_token: str = Header(...),
-    manager: RegistrationManager = Depends(get_registration_manager)
+    x_authentication_token: str = Header(...)
 ):
     """
     Unregister a component from the Tekton ecosystem.
@@ -193,6 +260,8 @@ async def unregister_component(
     This endpoint allows components to cleanly remove themselves
     from the registry when shutting down.
     """
+    manager = get_registration_manager()
+    
     # Unregister component
     success = manager.unregister_component(
         component_id=component_id,
@@ -204,63 +273,31 @@ async def unregister_component(
     
     return {"success": True, "message": "Component unregistered successfully"}
 
-@app.post("/query", response_model=List[ServiceResponse])
-async def query_services(
-    query: ServiceQueryRequest,
-    manager: RegistrationManager = Depends(get_registration_manager)
-):
+@app.post("/query", responses={200: {"model": List[ServiceResponse]}})
+async def query_services(query: ServiceQueryRequest):
     """
     Query available services based on criteria.
     
     This endpoint allows components to discover other components
     based on capabilities, type, and health status.
     """
-    # Get service registry from manager
-    registry = manager.service_registry
-    
-    # Query services
-    if query.capability:
-        # Find by capability
-        services = registry.find_by_capability(query.capability)
-    else:
-        # Get all services
-        all_services = registry.get_all_services()
-        services = [
-            {"id": service_id, **service_info}
-            for service_id, service_info in all_services.items()
-        ]
+    manager = get_registration_manager()
     
-    # Filter by component type if specified
-    if query.component_type:
-        services = [
-            service for service in services
-            if service.get("metadata", {}).get("type") == query.component_type
-        ]
-    
-    # Filter by health status if requested
-    if query.healthy_only:
-        services = [
-            service for service in services
-            if service.get("healthy", False)
-        ]
+    # Match services straight from the registry indexes; the matching IDs
+    # are snapshotted, so registry changes don't disturb a running stream
+    matches = manager.service_registry.iter_services(
+        capability=query.capability,
+        component_type=query.component_type,
+        healthy_only=query.healthy_only
+    )
+    head = list(islice(matches, _QUERY_STREAM_THRESHOLD + 1))
     
-    # Format response
-    response = []
-    for service in services:
-        component_id = service.get("id")
-        response.append(ServiceResponse(
-            component_id=component_id,
-            name=service.get("name", "Unknown"),
-            version=service.get("version", "Unknown"),
-            type=service.get("metadata", {}).get("type", "Unknown"),
-            endpoint=service.get("endpoint", ""),
-            capabilities=service.get("capabilities", []),
-            metadata=service.get("metadata", {}),
-            healthy=service.get("healthy"),
-            last_heartbeat=service.get("last_heartbeat")
-        ))
+    # Small results are encoded in one go; large ones are formatted and
+    # streamed in batches
+    if len(head) <= _QUERY_STREAM_THRESHOLD:
+        return ORJSONResponse(content=[_format_service(*match) for match in head])
     
-    return response
+    return StreamingResponse(_stream_services(chain(head, matches)), media_type="application/json")
 
 @app.get("/health")
 async def health_check():
@@ -270,25 +307,36 @@ async def health_check():
     This endpoint allows monitoring systems to verify that
     the registration service is operating correctly.
     """
-    return {
-        "status": "healthy",
-        "timestamp": time.time(),
-        "version": "0.1.0"
-    }
+    return Response(content=_HEALTH_BODY.render(), media_type="application/json")
 
 # Startup and shutdown events
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
+    global _owns_registration_manager
     logger.info("Registration API starting up")
-    # In a real implementation, this would initialize the registration manager
-    # and any other required services
-    pass
+    
+    # Create a registration manager unless one was provided
+    if _REGISTRATION_MANAGER is None:
+        service_registry = ServiceRegistry()
+        service_registry.start()
+        
+        set_registration_manager(RegistrationManager(
+            service_registry=service_registry,
+            message_bus=MessageBus(),
+            secret_key=os.environ.get("HERMES_SECRET_KEY", "tekton-secret-key")
+        ))
+        _owns_registration_manager = True
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up on shutdown."""
+    global _owns_registration_manager
     logger.info("Registration API shutting down")
-    # In a real implementation, this would clean up resources
-    pass
\ No newline at end of file
+    
+    # Stop the registration manager created at startup
+    if _owns_registration_manager:
+        _REGISTRATION_MANAGER.service_registry.stop()
+        set_registration_manager(None)
+        _owns_registration_manager = False
\ No newline at end of file
@@ -5,24 +5,37 @@ This module provides FastAPI endpoints for LLM-powered chat and analysis
 through the Rhetor LLM adapter.
 """
 
+import asyncio
 import logging
-import time
-import json
-from typing import Dict, List, Any, Optional
-from fastapi import APIRouter, HTTPException, Request, WebSocket, WebSocketDisconnect
+import orjson
+from typing import Dict, List, Any, Optional, Tuple
+from fastapi import APIRouter, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 from hermes.core.llm_adapter import LLMAdapter
+from hermes.api.responses import ORJSONResponse, dumps
+from hermes.utils import clock
+from hermes.utils.cache import TTLCache
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
 # Create API router
-llm_router = APIRouter(prefix="/llm", tags=["llm"])
+llm_router = APIRouter(prefix="/llm", tags=["llm"], default_response_class=ORJSONResponse)
 
-# Initialize LLM adapter
-llm_adapter = LLMAdapter()
+# Use the process-wide LLM adapter
+llm_adapter = LLMAdapter.instance()
+
+# Serialized /providers responses, keyed by the current provider and model.
+# Provider lists rarely change, so they are fetched at most every 30 seconds.
+_providers_cache = TTLCache(maxsize=16, ttl=30)
+
+# Server-sent event framing for streamed chat responses
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_SSE_DONE = b"data: [DONE]\n\n"
 
 # Pydantic models for request/response validation
 
@@ -67,100 +80,190 @@ class ProvidersResponse(BaseModel):
     current_provider: str
     current_model: str
 
+def _inline_schema(model: type) -> Dict[str, Any]:
+    """
+    Build a model's JSON schema with nested model references inlined.
+    
+    Args:
+        model: Pydantic model class
+        
+    Returns:
+        Self-contained JSON schema
+    """
+    schema = model.model_json_schema(ref_template="{model}")
+    definitions = schema.pop("$defs", {})
+    
+    def resolve(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return resolve(definitions[node["$ref"]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+    
+    return resolve(schema)
+
+# Request body documentation for endpoints that parse ChatRequest themselves
+_CHAT_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": _inline_schema(ChatRequest)}}
+    }
+}
+
+def _request_provider_and_model(provider: Optional[str], model: Optional[str]) -> Tuple[str, str]:
+    """
+    Get the provider and model to use for a single request.
+    
+    A request overrides the configured pair only when it names both; the
+    adapter's configuration is never changed by a chat request.
+    
+    Args:
+        provider: Provider requested by the client
+        model: Model requested by the client
+        
+    Returns:
+        Tuple of (provider_id, model_id)
+    """
+    if provider and model:
+        return provider, model
+    return llm_adapter.get_current_provider_and_model()
+
+async def _read_chat_request(request: Request) -> ChatRequest:
+    """
+    Parse and validate a chat request body in a single pass.
+    
+    The raw body is handed to pydantic-core, which parses and validates
+    the JSON (including long histories) without building intermediate
+    Python objects first.
+    
+    Args:
+        request: Incoming HTTP request
+        
+    Returns:
+        Validated chat request
+    """
+    try:
+        return ChatRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ])
+
 # API endpoints
 
-@llm_router.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest):
+@llm_router.post("/chat", responses={200: {"model": ChatResponse}}, openapi_extra=_CHAT_REQUEST_BODY)
+async def chat(http_request: Request):
     """
     Send a message to the LLM and get a response.
     
     This endpoint allows components to interact with the LLM
     for text generation.
     """
+    request = await _read_chat_request(http_request)
+    
     try:
         # Convert history format
-        chat_history = []
-        if request.history:
-            chat_history = [
-                {"role": msg.role, "content": msg.content}
-                for msg in request.history
-            ]
-        
-        # If provider/model specified, set it for this request
-        if request.provider and request.model:
-            llm_adapter.set_provider_and_model(request.provider, request.model)
+        chat_history = [
+            {"role": msg.role, "content": msg.content}
+            for msg in request.history or []
+        ]
         
-        # Get provider and model info
-        provider, model = llm_adapter.get_current_provider_and_model()
+        # Use the requested provider/model for this request only
+        provider, model = _request_provider_and_model(request.provider, request.model)
         
         # Send chat message to LLM
-        response = await llm_adapter.chat(request.message, chat_history)
+        response = await llm_adapter.chat(request.message, chat_history, provider=provider, model=model)
         
-        return ChatResponse(
-            message=response["message"],
-            model=model,
-            provider=provider,
-            timestamp=time.time()
-        )
+        return ORJSONResponse(content={
+            "message": response["message"],
+            "model": model,
+            "provider": provider,
+            "timestamp": clock.now()
+        })
     except Exception as e:
         logger.error(f"Error in chat endpoint: {e}")
         raise HTTPException(status_code=500, detail=f"Error processing chat: {str(e)}")
 
-@llm_router.post("/chat/stream")
-async def chat_stream(request: ChatRequest):
+@llm_router.post("/chat/stream", openapi_extra=_CHAT_REQUEST_BODY)
+async def chat_stream(http_request: Request):
     """
     Send a message to the LLM and get a streaming response.
     
     This endpoint allows components to interact with the LLM
     for streaming text generation.
     """
+    request = await _read_chat_request(http_request)
+    
     try:
         # Convert history format
-        chat_history = []
-        if request.history:
-            chat_history = [
-                {"role": msg.role, "content": msg.content}
-                for msg in request.history
-            ]
+        chat_history = [
+            {"role": msg.role, "content": msg.content}
+            for msg in request.history or []
+        ]
         
-        # If provider/model specified, set it for this request
-        if request.provider and request.model:
-            llm_adapter.set_provider_and_model(request.provider, request.model)
+        # Use the requested provider/model for this request only
+        provider, model = _request_provider_and_model(request.provider, request.model)
         
         # Create async generator for streaming response
         async def generate():
-            # Buffer for collecting chunks
-            buffer = []
+            # Chunks are handed from the LLM callback to this generator
+            queue: asyncio.Queue = asyncio.Queue()
             
             # Callback to handle streaming chunks
             async def handle_chunk(chunk):
-                # Format the chunk
-                chunk_text = chunk.get("chunk", "")
-                done = chunk.get("done", False)
-                error = chunk.get("error", None)
-                
-                if error:
-                    # Send error as event
-                    data = json.dumps({"error": error, "done": True})
-                    yield f"data: {data}\n\n"
-                    return
-                
-                if done:
-                    # Signal the end of streaming
-                    yield "data: [DONE]\n\n"
-                    return
-                
-                if chunk_text:
-                    # Send chunk as event
-                    data = json.dumps({"chunk": chunk_text, "done": False})
-                    yield f"data: {data}\n\n"
+                queue.put_nowait(chunk)
+            
+            async def stream():
+                try:
+                    await llm_adapter.streaming_chat(
+                        request.message,
+                        handle_chunk,
+                        chat_history,
+                        provider=provider,
+                        model=model
+                    )
+                except Exception as e:
+                    logger.error(f"Error in chat stream: {e}")
+                    queue.put_nowait({"error": str(e)})
+                finally:
+                    queue.put_nowait(None)
             
             # Start streaming
-            await llm_adapter.streaming_chat(
-                request.message,
-                handle_chunk,
-                chat_history
-            )
+            stream_task = asyncio.create_task(stream())
+            
+            try:
+                while True:
+                    chunk = await queue.get()
+                    
+                    if chunk is None:
+                        # Stream ended without an explicit done chunk
+                        yield _SSE_DONE
+                        break
+                    
+                    # Format the chunk
+                    chunk_text = chunk.get("chunk", "")
+                    done = chunk.get("done", False)
+                    error = chunk.get("error", None)
+                    
+                    if error:
+                        # Send error as event
+                        yield _SSE_PREFIX + orjson.dumps({"error": error, "done": True}) + _SSE_SUFFIX
+                        break
+                    
+                    if chunk_text:
+                        # Send chunk as event
+                        yield _SSE_PREFIX + orjson.dumps({"chunk": chunk_text, "done": False}) + _SSE_SUFFIX
+                    
+                    if done:
+                        # Signal the end of streaming
+                        yield _SSE_DONE
+                        break
+            finally:
+                # Stop the LLM request if the client went away
+                stream_task.cancel()
         
         # Return streaming response
         return StreamingResponse(
@@ -176,7 +279,7 @@ async def chat_stream(request: ChatRequest):
         logger.error(f"Error in chat stream endpoint: {e}")
         raise HTTPException(status_code=500, detail=f"Error processing streaming chat: {str(e)}")
 
-@llm_router.post("/analyze/message", response_model=AnalysisResponse)
+@llm_router.post("/analyze/message", responses={200: {"model": AnalysisResponse}})
 async def analyze_message(request: AnalyzeMessageRequest):
     """
     Analyze a message using the LLM.
@@ -190,15 +293,15 @@ async def analyze_message(request: AnalyzeMessageRequest):
             request.message_type
         )
         
-        return AnalysisResponse(
-            analysis=analysis,
-            timestamp=time.time()
-        )
+        return ORJSONResponse(content={
+            "analysis": analysis,
+            "timestamp": clock.now()
+        })
     except Exception as e:
         logger.error(f"Error in analyze message endpoint: {e}")
         raise HTTPException(status_code=500, detail=f"Error analyzing message: {str(e)}")
 
-@llm_router.post("/analyze/service", response_model=AnalysisResponse)
+@llm_router.post("/analyze/service", responses={200: {"model": AnalysisResponse}})
 async def analyze_service(request: AnalyzeServiceRequest):
     """
     Analyze a service registration using the LLM.
@@ -209,15 +312,15 @@ async def analyze_service(request: AnalyzeServiceRequest):
     try:
         analysis = await llm_adapter.analyze_service(request.service_data)
         
-        return AnalysisResponse(
-            analysis=analysis,
-            timestamp=time.time()
-        )
+        return ORJSONResponse(content={
+            "analysis": analysis,
+            "timestamp": clock.now()
+        })
     except Exception as e:
         logger.error(f"Error in analyze service endpoint: {e}")
         raise HTTPException(status_code=500, detail=f"Error analyzing service: {str(e)}")
 
-@llm_router.get("/providers", response_model=ProvidersResponse)
+@llm_router.get("/providers", responses={200: {"model": ProvidersResponse}})
 async def get_providers():
     """
     Get available LLM providers and models.
@@ -226,14 +329,29 @@ async def get_providers():
     LLM providers and models.
     """
     try:
-        providers = await llm_adapter.get_available_providers()
         provider, model = llm_adapter.get_current_provider_and_model()
         
-        return ProvidersResponse(
-            providers=providers,
-            current_provider=provider,
-            current_model=model
-        )
+        body = _providers_cache.get((provider, model))
+        if body is None:
+            try:
+                providers = await llm_adapter.get_available_providers(fallback=False)
+                cacheable = True
+            except Exception as e:
+                # Serve the default providers, but don't cache them, so the
+                # next request asks the LLM adapter again
+                logger.error(f"Error getting providers: {e}")
+                providers = llm_adapter.get_default_providers()
+                cacheable = False
+            
+            body = dumps({
+                "providers": providers,
+                "current_provider": provider,
+                "current_model": model
+            })
+            if cacheable:
+                _providers_cache.set((provider, model), body)
+        
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error(f"Error in get providers endpoint: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting providers: {str(e)}")
@@ -248,6 +366,7 @@ async def set_provider(provider: str, model: str):
     """
     try:
         llm_adapter.set_provider_and_model(provider, model)
+        _providers_cache.clear()
         
         return {
             "success": True,
@@ -259,6 +378,93 @@ async def set_provider(provider: str, model: str):
         logger.error(f"Error in set provider endpoint: {e}")
         raise HTTPException(status_code=500, detail=f"Error setting provider: {str(e)}")
 
+# Marks the end of a streamed WebSocket chat response
+_END_OF_STREAM = object()
+
+# Maximum text size coalesced into one WebSocket frame
+_WS_COALESCE_LIMIT = 16 * 1024
+
+async def _send_json_frame(websocket: WebSocket, data: Dict[str, Any]) -> None:
+    """
+    Send a JSON text frame encoded with orjson.
+    
+    Args:
+        websocket: WebSocket connection
+        data: Frame content
+    """
+    await websocket.send_text(orjson.dumps(data).decode())
+
+async def _send_chat_chunks(websocket: WebSocket,
+                           queue: asyncio.Queue,
+                           provider: str,
+                           model: str) -> None:
+    """
+    Send streamed chat chunks to a WebSocket client.
+    
+    Text chunks that queued up while the previous frame was being sent are
+    coalesced into one frame, so a fast LLM stream does not cost one
+    WebSocket write per token.
+    
+    Args:
+        websocket: WebSocket connection
+        queue: Queue of chunks, terminated by _END_OF_STREAM
+        provider: Provider reported when the response is done
+        model: Model reported when the response is done
+    """
+    pending = None
+    
+    while True:
+        chunk = pending if pending is not None else await queue.get()
+        pending = None
+        
+        if chunk is _END_OF_STREAM:
+            return
+        
+        chunk_text = chunk.get("chunk", "")
+        done = chunk.get("done", False)
+        error = chunk.get("error", None)
+        
+        if error:
+            await _send_json_frame(websocket, {
+                "error": error,
+                "success": False,
+                "done": True
+            })
+            continue
+        
+        if chunk_text:
+            parts = [chunk_text]
+            size = len(chunk_text)
+            
+            # Coalesce text chunks that are already waiting
+            while not done and size < _WS_COALESCE_LIMIT:
+                try:
+                    next_chunk = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                
+                if next_chunk is _END_OF_STREAM or next_chunk.get("error") or not next_chunk.get("chunk"):
+                    pending = next_chunk
+                    break
+                
+                parts.append(next_chunk["chunk"])
+                size += len(next_chunk["chunk"])
+                done = next_chunk.get("done", False)
+            
+            await _send_json_frame(websocket, {
+                "chunk": "".join(parts),
+                "done": False,
+                "success": True
+            })
+        
+        if done:
+            await _send_json_frame(websocket, {
+                "done": True,
+                "success": True,
+                "provider": provider,
+                "model": model
+            })
+
 # WebSocket endpoint for chat
 @llm_router.websocket("/ws/chat")
 async def websocket_chat(websocket: WebSocket):
@@ -272,13 +478,16 @@ async def websocket_chat(websocket: WebSocket):
     
     try:
         while True:
-            # Receive message from client
-            data = await websocket.receive_text()
+            # Receive message from client; binary frames are parsed without decoding them first
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
+            data = frame.get("bytes") or frame.get("text") or ""
             
             try:
-                # Parse client message
-                request_data = json.loads(data)
-                message = request_data.get("message", "")
+                # Parse and validate client message
+                request = ChatRequest.model_validate_json(data)
+                message = request.message
                 
                 if not message:
                     await websocket.send_json({
@@ -288,56 +497,51 @@ async def websocket_chat(websocket: WebSocket):
                     continue
                 
                 # Extract options
-                chat_history = request_data.get("history", [])
-                provider = request_data.get("provider")
-                model = request_data.get("model")
+                chat_history = [
+                    {"role": msg.role, "content": msg.content}
+                    for msg in request.history or []
+                ]
+                provider = request.provider
+                model = request.model
                 
-                # Set provider/model if specified
-                if provider and model:
-                    llm_adapter.set_provider_and_model(provider, model)
+                # Use the requested provider/model for this request only
+                current_provider, current_model = _request_provider_and_model(provider, model)
                 
-                # Get current provider/model
-                current_provider, current_model = llm_adapter.get_current_provider_and_model()
+                # Chunks are handed from the LLM callback to a writer task
+                queue: asyncio.Queue = asyncio.Queue()
                 
                 # Callback for streaming response
                 async def handle_chunk(chunk):
-                    chunk_text = chunk.get("chunk", "")
-                    done = chunk.get("done", False)
-                    error = chunk.get("error", None)
-                    
-                    if error:
-                        await websocket.send_json({
-                            "error": error,
-                            "success": False,
-                            "done": True
-                        })
-                        return
-                    
-                    if chunk_text:
-                        await websocket.send_json({
-                            "chunk": chunk_text,
-                            "done": False,
-                            "success": True
-                        })
-                    
-                    if done:
-                        await websocket.send_json({
-                            "done": True,
-                            "success": True,
-                            "provider": current_provider,
-                            "model": current_model
-                        })
+                    queue.put_nowait(chunk)
                 
-                # Start streaming response
-                await llm_adapter.streaming_chat(
-                    message,
-                    handle_chunk,
-                    chat_history
+                writer = asyncio.create_task(
+                    _send_chat_chunks(websocket, queue, current_provider, current_model)
                 )
                 
-            except json.JSONDecodeError:
+                # Start streaming response
+                try:
+                    await llm_adapter.streaming_chat(
+                        message,
+                        handle_chunk,
+                        chat_history,
+                        provider=current_provider,
+                        model=current_model
+                    )
+                finally:
+                    queue.put_nowait(_END_OF_STREAM)
+                    await writer
+                
+            except ValidationError as e:
+                errors = e.errors(include_url=False)
+                if any(error["type"] == "json_invalid" for error in errors):
+                    error_message = "Invalid JSON format"
+                elif any(error["type"] == "missing" and error["loc"] == ("message",) for error in errors):
+                    error_message = "No message provided"
+                else:
+                    error_message = f"Invalid chat request: {errors[0]['msg']}"
+                
                 await websocket.send_json({
-                    "error": "Invalid JSON format",
+                    "error": error_message,
                     "success": False
                 })
             except Exception as e:
@@ -7,19 +7,54 @@ tool registration and execution, and context management.
 
 import time
 import logging
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional
 
-from fastapi import APIRouter, HTTPException, Depends, Header, Request, Body
+from fastapi import APIRouter, HTTPException, Depends
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
+
+from hermes.api.responses import ORJSONResponse
+from hermes.utils.ids import new_message_id
 
 logger = logging.getLogger(__name__)
 
+# Service used by the endpoints, set once at application startup
+_MCP_SERVICE = None
+
+
+def set_mcp_service(mcp_service) -> None:
+    """
+    Set the MCP service used by the endpoints.
+    
+    Args:
+        mcp_service: Initialized MCP service
+    """
+    global _MCP_SERVICE
+    _MCP_SERVICE = mcp_service
+
+
+# Dependency to get the MCP service
+def get_mcp_service():
+    """
+    Get the MCP service.
+    
+    The service is initialized once in the application startup event,
+    so this dependency only checks that it is available. It runs once per
+    request for the whole router; endpoints then use the service directly.
+    """
+    if _MCP_SERVICE is None:
+        raise HTTPException(status_code=500, detail="MCP service not initialized")
+    
+    return _MCP_SERVICE
+
+
 # Create router
 mcp_router = APIRouter(
     prefix="/mcp",
     tags=["mcp"],
-    responses={404: {"description": "Not found"}}
+    dependencies=[Depends(get_mcp_service)],
+    responses={404: {"description": "Not found"}},
+    default_response_class=ORJSONResponse
 )
 
 # Pydantic models for API
@@ -101,27 +136,10 @@ class ContextUpdateRequest(BaseModel):
     operation: str = "update"
 
 
-# Dependency to get MCP service from request state
-async def get_mcp_service(request: Request):
-    """Get the MCP service from request state."""
-    if not hasattr(request.app.state, "mcp_service"):
-        raise HTTPException(status_code=500, detail="MCP service not initialized")
-    
-    mcp_service = request.app.state.mcp_service
-    
-    # Ensure service is initialized
-    await mcp_service.initialize()
-    
-    return mcp_service
-
-
 # API endpoints
 
 @mcp_router.post("/process")
-async def process_message(
-    message: MCPMessage,
-    mcp_service = Depends(get_mcp_service)
-):
+async def process_message(message: MCPMessage):
     """
     Process an MCP message.
     
@@ -132,13 +150,13 @@ async def process_message(
     
     # Add message ID if not provided
     if not message.id:
-        msg_dict["id"] = f"msg-{int(time.time() * 1000)}"
+        msg_dict["id"] = new_message_id()
     
     # Add timestamp
     msg_dict["timestamp"] = time.time()
     
     # Process message
-    result = await mcp_service.process_message(msg_dict)
+    result = await _MCP_SERVICE.process_message(msg_dict)
     
     if "error" in result:
         return JSONResponse(
@@ -150,16 +168,13 @@ async def process_message(
 
 
 @mcp_router.post("/tools", response_model=ToolRegistrationResponse)
-async def register_tool(
-    tool_spec: ToolSpec,
-    mcp_service = Depends(get_mcp_service)
-):
+async def register_tool(tool_spec: ToolSpec):
     """
     Register a tool with the MCP service.
     
     This endpoint allows registration of tools that can be used via MCP.
     """
-    tool_id = await mcp_service.register_tool(tool_spec.dict())
+    tool_id = await _MCP_SERVICE.register_tool(tool_spec.dict())
     
     if not tool_id:
         raise HTTPException(status_code=400, detail="Tool registration failed")
@@ -172,16 +187,13 @@ async def register_tool(
 
 
 @mcp_router.delete("/tools/{tool_id}")
-async def unregister_tool(
-    tool_id: str,
-    mcp_service = Depends(get_mcp_service)
-):
+async def unregister_tool(tool_id: str):
     """
     Unregister a tool from the MCP service.
     
     This endpoint allows tools to be removed from the registry.
     """
-    success = await mcp_service.unregister_tool(tool_id)
+    success = await _MCP_SERVICE.unregister_tool(tool_id)
     
     if not success:
         raise HTTPException(status_code=404, detail="Tool not found")
@@ -192,15 +204,14 @@ async def unregister_tool(
 @mcp_router.post("/tools/{tool_id}/execute")
 async def execute_tool(
     tool_id: str,
-    execution: ToolExecutionRequest,
-    mcp_service = Depends(get_mcp_service)
+    execution: ToolExecutionRequest
 ):
     """
     Execute a tool.
     
     This endpoint executes a registered tool with the provided parameters.
     """
-    result = await mcp_service.execute_tool(
+    result = await _MCP_SERVICE.execute_tool(
         tool_id=tool_id,
         parameters=execution.parameters,
         context=execution.context
@@ -214,16 +225,13 @@ async def execute_tool(
 
 
 @mcp_router.get("/tools/{tool_id}")
-async def get_tool(
-    tool_id: str,
-    mcp_service = Depends(get_mcp_service)
-):
+async def get_tool(tool_id: str):
     """
     Get tool information.
     
     This endpoint retrieves information about a specific tool.
     """
-    tool = await mcp_service.get_tool(tool_id)
+    tool = await _MCP_SERVICE.get_tool(tool_id)
     
     if not tool:
         raise HTTPException(status_code=404, detail="Tool not found")
@@ -232,16 +240,13 @@ async def get_tool(
 
 
 @mcp_router.post("/processors", response_model=ProcessorRegistrationResponse)
-async def register_processor(
-    processor_spec: ProcessorSpec,
-    mcp_service = Depends(get_mcp_service)
-):
+async def register_processor(processor_spec: ProcessorSpec):
     """
     Register a processor with the MCP service.
     
     This endpoint allows registration of processors that can handle MCP messages.
     """
-    processor_id = await mcp_service.register_processor(processor_spec.dict())
+    processor_id = await _MCP_SERVICE.register_processor(processor_spec.dict())
     
     if not processor_id:
         raise HTTPException(status_code=400, detail="Processor registration failed")
@@ -254,16 +259,13 @@ async def register_processor(
 
 
 @mcp_router.get("/processors/{processor_id}")
-async def get_processor(
-    processor_id: str,
-    mcp_service = Depends(get_mcp_service)
-):
+async def get_processor(processor_id: str):
     """
     Get processor information.
     
     This endpoint retrieves information about a specific processor.
     """
-    processor = await mcp_service.get_processor(processor_id)
+    processor = await _MCP_SERVICE.get_processor(processor_id)
     
     if not processor:
         raise HTTPException(status_code=404, detail="Processor not found")
@@ -272,16 +274,13 @@ async def get_processor(
 
 
 @mcp_router.post("/contexts")
-async def create_context(
-    context_request: ContextCreationRequest,
-    mcp_service = Depends(get_mcp_service)
-):
+async def create_context(context_request: ContextCreationRequest):
     """
     Create a new context.
     
     This endpoint creates a new context for multimodal processing.
     """
-    context_id = await mcp_service.create_context(
+    context_id = await _MCP_SERVICE.create_context(
         data=context_request.data,
         source=context_request.source,
         context_id=context_request.context_id
@@ -296,15 +295,14 @@ async def create_context(
 @mcp_router.patch("/contexts/{context_id}")
 async def update_context(
     context_id: str,
-    update_request: ContextUpdateRequest,
-    mcp_service = Depends(get_mcp_service)
+    update_request: ContextUpdateRequest
 ):
     """
     Update a context.
     
     This endpoint updates an existing context with new information.
     """
-    success = await mcp_service.update_context(
+    success = await _MCP_SERVICE.update_context(
         context_id=context_id,
         updates=update_request.updates,
         source=update_request.source,
@@ -318,16 +316,13 @@ async def update_context(
 
 
 @mcp_router.get("/contexts/{context_id}")
-async def get_context(
-    context_id: str,
-    mcp_service = Depends(get_mcp_service)
-):
+async def get_context(context_id: str):
     """
     Get a context.
     
     This endpoint retrieves information about a specific context.
     """
-    context = await mcp_service.get_context(context_id)
+    context = await _MCP_SERVICE.get_context(context_id)
     
     if not context:
         raise HTTPException(status_code=404, detail="Context not found")
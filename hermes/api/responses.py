@@ -0,0 +1,84 @@
+"""
+API Responses - Shared response classes for the Hermes API.
+
+This module provides response classes used across the Hermes API
+endpoints, including a JSON response rendered with orjson.
+"""
+
+from typing import Any, Dict
+
+import orjson
+from fastapi.responses import JSONResponse
+
+from hermes.utils import clock
+
+# orjson options for API payloads. Payloads hold only orjson-native types, so
+# no default= callback is passed; registry metadata may use non-string keys.
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode an API payload to JSON bytes.
+
+    Args:
+        content: Payload of JSON-compatible values
+
+    Returns:
+        Encoded JSON bytes
+    """
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the standard library encoder."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """
+        Render content to JSON bytes.
+
+        Args:
+            content: Content to render
+
+        Returns:
+            Encoded JSON bytes
+        """
+        return dumps(content)
+
+
+class TimestampedJSONBody:
+    """
+    Pre-encoded JSON body whose trailing "timestamp" field is refreshed periodically.
+
+    The body is re-rendered at most once per interval, so frequently polled
+    endpoints such as health checks return the same bytes object without
+    encoding anything per request.
+    """
+
+    def __init__(self, content: Dict[str, Any], interval: float = 0.1):
+        """
+        Initialize the body.
+
+        Args:
+            content: Static payload fields; a "timestamp" field is appended
+            interval: Minimum seconds between timestamp refreshes
+        """
+        # Strip the placeholder timestamp value and closing brace
+        self._prefix = dumps({**content, "timestamp": 0})[:-2]
+        self.interval = interval
+        self._rendered_at = float("-inf")
+        self._body = b""
+
+    def render(self) -> bytes:
+        """
+        Get the encoded body with a recent timestamp.
+
+        Returns:
+            Encoded JSON bytes
+        """
+        now = clock.now()
+        if now - self._rendered_at >= self.interval:
+            self._body = self._prefix + repr(now).encode() + b"}"
+            self._rendered_at = now
+        return self._body
@@ -8,16 +8,42 @@ communicate with each other.
 
 import time
 import uuid
+import sys
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Callable, Union, Set
+import functools
+from collections import deque
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Callable, Union, Set, Mapping, Tuple
 
 from hermes.core.service_discovery import ServiceRegistry
 from hermes.core.message_bus import MessageBus
 from hermes.core.registration import RegistrationManager
+from hermes.utils import clock
 
 logger = logging.getLogger(__name__)
 
+# Number of status changes kept in a task's history. The history is a ring
+# buffer: once full, the oldest entries are dropped as new ones are added.
+TASK_HISTORY_SIZE = 256
+
+# Fields that must be present in agent cards, messages and task specifications
+_AGENT_REQUIRED_FIELDS = frozenset(("agent_id", "name", "version", "capabilities"))
+_MESSAGE_REQUIRED_FIELDS = frozenset(("id", "sender", "recipients", "type", "content"))
+_TASK_REQUIRED_FIELDS = frozenset(("name", "description", "required_capabilities"))
+
+# Shared read-only default for lookups into optional nested mappings
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Sender of messages emitted by the A2A service itself; shared by all of
+# them, so it must not be modified
+_A2A_SENDER: Dict[str, str] = {
+    "id": "hermes.a2a",
+    "name": "Hermes A2A Service",
+    "version": "1.0.0"
+}
+
+
 class A2AService:
     """
     Service for agent-to-agent communication in Hermes.
@@ -26,6 +52,24 @@ class A2AService:
     enabling agents to register, discover, and communicate with each other.
     """
     
+    __slots__ = (
+        # Accessed on every message and task operation
+        "agents",
+        "tasks",
+        "conversations",
+        "message_bus",
+        "_capability_index",
+        "_agent_channel",
+        "_event_tasks",
+        "_own_handlers",
+        # Set up once or only touched on registration changes
+        "service_registry",
+        "registration_manager",
+        "_agent_capabilities",
+        "_channels_initialized",
+        "_init_lock",
+    )
+    
     def __init__(
         self,
         service_registry: ServiceRegistry,
@@ -49,26 +93,65 @@ class A2AService:
         self.tasks: Dict[str, Dict[str, Any]] = {}
         self.conversations: Dict[str, Dict[str, Any]] = {}
         
+        # Flattened capabilities per agent, and the inverted index built from them
+        self._agent_capabilities: Dict[str, List[str]] = {}
+        self._capability_index: Dict[str, Set[str]] = {}
+        
+        # Interned per-agent channel names, so publishing doesn't format them
+        self._agent_channel: Dict[str, str] = {}
+        
+        # Background publishes of event notifications still in flight
+        self._event_tasks: Set[asyncio.Task] = set()
+        
+        # The service's own subscriptions to its event channels, which don't
+        # count as subscribers to the events it publishes there
+        self._own_handlers = frozenset((
+            self._handle_registration,
+            self._handle_task,
+            self._handle_conversation
+        ))
+        
         # Initialize channels
         self._channels_initialized = False
+        self._init_lock = asyncio.Lock()
         
         logger.info("A2A service initialized")
     
-    async def initialize(self):
-        """Initialize the service and set up channels."""
+    async def initialize(self) -> None:
+        """
+        Initialize the service and set up channels.
+        
+        This is called once from the application startup event and is safe
+        to call concurrently; only the first caller sets up the channels.
+        """
         if self._channels_initialized:
             return
+        
+        async with self._init_lock:
+            if self._channels_initialized:
+                return
             
+            await self._setup_channels()
+    
+    async def _setup_channels(self) -> None:
+        """Create and subscribe to the A2A channels."""
         # Create agent registration channel
         await self.message_bus.create_channel(
             'a2a.registration',
             description='Channel for agent registration'
         )
         
-        # Create message channel
+        # Create message channels; submitted messages arrive on the inbound
+        # channel and copies of delivered messages go out on the outbound one,
+        # so delivery never feeds back into the inbound handler
         await self.message_bus.create_channel(
-            'a2a.messages',
-            description='Channel for agent messages'
+            'a2a.messages.in',
+            description='Channel for agent messages submitted for delivery'
+        )
+        
+        await self.message_bus.create_channel(
+            'a2a.messages.out',
+            description='Channel for copies of delivered agent messages'
         )
         
         # Create task channel
@@ -90,7 +173,7 @@ class A2AService:
         )
         
         await self.message_bus.subscribe_async(
-            'a2a.messages',
+            'a2a.messages.in',
             self._handle_message
         )
         
@@ -118,35 +201,38 @@ class A2AService:
             True if registration successful
         """
         # Validate agent card
-        required_fields = ["agent_id", "name", "version", "capabilities"]
-        for field in required_fields:
-            if field not in agent_card:
-                logger.error(f"Agent card missing required field: {field}")
-                return False
+        missing = _AGENT_REQUIRED_FIELDS.difference(agent_card)
+        if missing:
+            logger.error("Agent card missing required fields: %s", ", ".join(sorted(missing)))
+            return False
         
         agent_id = agent_card["agent_id"]
+        capabilities = self._extract_capabilities(agent_card)
+        
+        # Drop index entries from a previous registration
+        self._unindex_agent(agent_id)
+        
+        now = time.time()
         
         # Store agent information
         self.agents[agent_id] = {
             "card": agent_card,
-            "registered_at": time.time(),
-            "last_seen": time.time()
+            "registered_at": now,
+            "last_seen": now
         }
         
+        self._agent_channel[agent_id] = sys.intern(f'agent.{agent_id}')
+        self._agent_capabilities[agent_id] = capabilities
+        for capability in capabilities:
+            self._capability_index.setdefault(capability, set()).add(agent_id)
+        
         # Register with service registry if available
         # This allows the agent to be discovered through standard Hermes mechanisms too
         if self.registration_manager:
-            capabilities = []
-            # Extract capabilities from agent card
-            for category, category_capabilities in agent_card.get("capabilities", {}).items():
-                if isinstance(category_capabilities, list):
-                    capabilities.extend(category_capabilities)
-                elif isinstance(category_capabilities, dict):
-                    for domain, domain_capabilities in category_capabilities.items():
-                        if isinstance(domain_capabilities, list):
-                            capabilities.extend(domain_capabilities)
-            
-            # Register with service registry
+            # Register with service registry. This stays on the loop, as in
+            # unregister_agent: the registration event is delivered to
+            # subscribers synchronously and the registry indexes are not
+            # locked, and token signing is cheap.
             self.registration_manager.register_component(
                 component_id=f"a2a.agent.{agent_id}",
                 name=agent_card["name"],
@@ -161,7 +247,7 @@ class A2AService:
             )
         
         # Publish registration event
-        await self.message_bus.publish(
+        self._publish_event(
             'a2a.registration',
             {
                 'type': 'agent_registered',
@@ -170,7 +256,7 @@ class A2AService:
             }
         )
         
-        logger.info(f"Agent registered: {agent_card['name']} ({agent_id})")
+        logger.info("Agent registered: %s (%s)", agent_card["name"], agent_id)
         return True
     
     async def unregister_agent(self, agent_id: str) -> bool:
@@ -184,11 +270,13 @@ class A2AService:
             True if unregistration successful
         """
         if agent_id not in self.agents:
-            logger.warning(f"Agent not found for unregistration: {agent_id}")
+            logger.warning("Agent not found for unregistration: %s", agent_id)
             return False
             
         # Remove agent information
-        agent_info = self.agents.pop(agent_id)
+        self.agents.pop(agent_id)
+        self._agent_channel.pop(agent_id, None)
+        self._unindex_agent(agent_id)
         
         # Unregister from service registry if available
         if self.registration_manager:
@@ -198,7 +286,7 @@ class A2AService:
             )
         
         # Publish unregistration event
-        await self.message_bus.publish(
+        self._publish_event(
             'a2a.registration',
             {
                 'type': 'agent_unregistered',
@@ -206,7 +294,7 @@ class A2AService:
             }
         )
         
-        logger.info(f"Agent unregistered: {agent_id}")
+        logger.info("Agent unregistered: %s", agent_id)
         return True
     
     async def send_message(self, message: Dict[str, Any]) -> bool:
@@ -219,20 +307,43 @@ class A2AService:
         Returns:
             True if message sent successfully
         """
+        publications = self._message_publications(message)
+        if publications is None:
+            return False
+        
+        # Publish to each agent-specific channel and, if anyone listens, the
+        # outbound message channel at once
+        await self.message_bus.publish_many_async(publications)
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Message published to %d channels", len(publications))
+        return True
+    
+    def _message_publications(self, message: Dict[str, Any]) -> Optional[List[Tuple[str, Dict[str, Any]]]]:
+        """
+        Validate a message and resolve the (channel, message) pairs to publish.
+        
+        Args:
+            message: A2A message to send
+            
+        Returns:
+            List of (channel, message) pairs, or None if the message is
+            invalid or has no valid recipients
+        """
         # Validate message
-        required_fields = ["id", "sender", "recipients", "type", "content"]
-        for field in required_fields:
-            if field not in message:
-                logger.error(f"Message missing required field: {field}")
-                return False
+        missing = _MESSAGE_REQUIRED_FIELDS.difference(message)
+        if missing:
+            logger.error("Message missing required fields: %s", ", ".join(sorted(missing)))
+            return None
         
         # Add timestamp if not present
         if "timestamp" not in message:
             message["timestamp"] = time.time()
             
-        # Process recipients
+        # Process recipients; keyed by agent ID so an agent addressed both
+        # directly and by capability receives the message once
         recipients = message.get("recipients", [])
-        direct_recipients = []
+        direct_recipients: Dict[str, Any] = {}
         
         for recipient in recipients:
             recipient_type = recipient.get("type")
@@ -241,39 +352,62 @@ class A2AService:
                 # Direct message to specific agent
                 recipient_id = recipient.get("id")
                 if recipient_id in self.agents:
-                    direct_recipients.append(recipient_id)
+                    direct_recipients[recipient_id] = None
                     
             elif recipient_type == "capability":
                 # Message to agents with specific capability
                 capability = recipient.get("capability")
-                matching_agents = await self._find_agents_by_capability(capability)
-                direct_recipients.extend(matching_agents)
+                matching_agents = self._find_agents_by_capability(capability)
+                direct_recipients.update(dict.fromkeys(matching_agents))
                 
             elif recipient_type == "broadcast":
-                # Broadcast to all agents
-                direct_recipients = list(self.agents.keys())
+                # Broadcast to all agents; iterated directly below, without a copy
+                direct_recipients = self.agents
                 break
         
-        # Publish message for each recipient
         if not direct_recipients:
             logger.warning("No valid recipients for message")
-            return False
-            
-        for recipient_id in direct_recipients:
-            # Publish to agent-specific channel
-            await self.message_bus.publish(
-                f'agent.{recipient_id}',
-                message
-            )
+            return None
             
-        # Also publish to general message channel
-        await self.message_bus.publish(
-            'a2a.messages',
-            message
-        )
+        publications = [(self._agent_channel[recipient_id], message) for recipient_id in direct_recipients]
+        if self.message_bus.has_subscribers('a2a.messages.out'):
+            publications.append(('a2a.messages.out', message))
+        return publications
+    
+    async def send_messages_batch(self, messages: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Send a batch of messages.
         
-        logger.info(f"Message sent to {len(direct_recipients)} recipients")
-        return True
+        Args:
+            messages: A2A messages to send
+            
+        Returns:
+            List of per-message success flags, in the same order as the input
+        """
+        # Resolve recipients for every message first, then publish the whole
+        # batch in a single call
+        results = []
+        publications = []
+        for message in messages:
+            try:
+                message_publications = self._message_publications(message)
+            except Exception as e:
+                logger.error("Error sending message %s: %s", message.get("id"), e)
+                message_publications = None
+            results.append(message_publications is not None)
+            if message_publications:
+                publications.extend(message_publications)
+        
+        if publications:
+            try:
+                await self.message_bus.publish_many_async(publications)
+            except Exception as e:
+                logger.error("Error sending batch of %d messages: %s", len(messages), e)
+                return [False] * len(messages)
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Batch of %d messages sent to %d channels", sum(results), len(publications))
+        return results
     
     async def create_task(self, task_spec: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -286,48 +420,50 @@ class A2AService:
             Created task information
         """
         # Validate task specification
-        required_fields = ["name", "description", "required_capabilities"]
-        for field in required_fields:
-            if field not in task_spec:
-                logger.error(f"Task specification missing required field: {field}")
-                return {"error": f"Missing required field: {field}"}
+        missing = _TASK_REQUIRED_FIELDS.difference(task_spec)
+        if missing:
+            missing_fields = ", ".join(sorted(missing))
+            logger.error("Task specification missing required fields: %s", missing_fields)
+            return {"error": f"Missing required fields: {missing_fields}"}
                 
         # Generate task ID if not provided
-        task_id = task_spec.get("id") or f"task-{uuid.uuid4()}"
+        task_id = task_spec.get("id") or "task-" + uuid.uuid4().hex
+        
+        now = time.time()
         
         # Create task
         task = {
             "id": task_id,
             "spec": task_spec,
             "status": "created",
-            "created_at": time.time(),
-            "updated_at": time.time(),
+            "created_at": now,
+            "updated_at": now,
             "assigned_to": None,
             "result": None,
-            "history": [
+            "history": deque([
                 {
                     "status": "created",
-                    "timestamp": time.time(),
+                    "timestamp": now,
                     "agent_id": None,
                     "message": "Task created"
                 }
-            ]
+            ], maxlen=TASK_HISTORY_SIZE)
         }
         
         # Store task
         self.tasks[task_id] = task
         
         # Publish task creation event
-        await self.message_bus.publish(
+        self._publish_event(
             'a2a.tasks',
             {
                 'type': 'task_created',
                 'task_id': task_id,
-                'task': task
+                'task': {**task, "history": list(task["history"])}
             }
         )
         
-        logger.info(f"Task created: {task_spec['name']} ({task_id})")
+        logger.info("Task created: %s (%s)", task_spec["name"], task_id)
         
         # If preferred agent is specified, try to assign task
         preferred_agent = task_spec.get("preferred_agent")
@@ -351,41 +487,34 @@ class A2AService:
             True if assignment successful
         """
         if task_id not in self.tasks:
-            logger.warning(f"Task not found: {task_id}")
+            logger.warning("Task not found: %s", task_id)
             return False
             
         if agent_id not in self.agents:
-            logger.warning(f"Agent not found: {agent_id}")
+            logger.warning("Agent not found: %s", agent_id)
             return False
             
+        now = time.time()
+        
         task = self.tasks[task_id]
         
         # Update task status
         task["status"] = "assigned"
         task["assigned_to"] = agent_id
-        task["updated_at"] = time.time()
+        task["updated_at"] = now
         task["history"].append({
             "status": "assigned",
-            "timestamp": time.time(),
+            "timestamp": now,
             "agent_id": agent_id,
             "message": f"Task assigned to agent {agent_id}"
         })
         
         # Send task assignment message
         assignment_message = {
-            "id": f"msg-{uuid.uuid4()}",
-            "timestamp": time.time(),
-            "sender": {
-                "id": "hermes.a2a",
-                "name": "Hermes A2A Service",
-                "version": "1.0.0"
-            },
-            "recipients": [
-                {
-                    "id": agent_id,
-                    "type": "direct"
-                }
-            ],
+            "id": "msg-" + uuid.uuid4().hex,
+            "timestamp": now,
+            "sender": _A2A_SENDER,
+            "recipients": ({"id": agent_id, "type": "direct"},),
             "type": "command",
             "intent": "delegate_task",
             "content": {
@@ -394,13 +523,13 @@ class A2AService:
             }
         }
         
-        await self.message_bus.publish(
-            f'agent.{agent_id}',
+        await self.message_bus.publish_async(
+            self._agent_channel[agent_id],
             assignment_message
         )
         
         # Publish task assignment event
-        await self.message_bus.publish(
+        self._publish_event(
             'a2a.tasks',
             {
                 'type': 'task_assigned',
@@ -409,7 +538,7 @@ class A2AService:
             }
         )
         
-        logger.info(f"Task {task_id} assigned to agent {agent_id}")
+        logger.info("Task %s assigned to agent %s", task_id, agent_id)
         return True
     
     async def update_task_status(
@@ -434,14 +563,16 @@ class A2AService:
             True if update successful
         """
         if task_id not in self.tasks:
-            logger.warning(f"Task not found: {task_id}")
+            logger.warning("Task not found: %s", task_id)
             return False
             
+        now = time.time()
+        
         task = self.tasks[task_id]
         
         # Update task
         task["status"] = status
-        task["updated_at"] = time.time()
+        task["updated_at"] = now
         
         if result is not None:
             task["result"] = result
@@ -449,13 +580,13 @@ class A2AService:
         # Add history entry
         task["history"].append({
             "status": status,
-            "timestamp": time.time(),
+            "timestamp": now,
             "agent_id": agent_id,
             "message": message or f"Status changed to {status}"
         })
         
         # Publish task update event
-        await self.message_bus.publish(
+        self._publish_event(
             'a2a.tasks',
             {
                 'type': 'task_status_changed',
@@ -466,7 +597,7 @@ class A2AService:
             }
         )
         
-        logger.info(f"Task {task_id} status updated to {status}")
+        logger.info("Task %s status updated to %s", task_id, status)
         return True
     
     async def start_conversation(
@@ -489,7 +620,9 @@ class A2AService:
             Conversation ID
         """
         # Generate conversation ID if not provided
-        conversation_id = conversation_id or f"conv-{uuid.uuid4()}"
+        conversation_id = conversation_id or "conv-" + uuid.uuid4().hex
+        
+        now = time.time()
         
         # Create conversation
         conversation = {
@@ -497,8 +630,8 @@ class A2AService:
             "participants": participants,
             "topic": topic or "General conversation",
             "context": context or {},
-            "created_at": time.time(),
-            "last_message_at": time.time(),
+            "created_at": now,
+            "last_message_at": now,
             "message_count": 0
         }
         
@@ -506,7 +639,7 @@ class A2AService:
         self.conversations[conversation_id] = conversation
         
         # Publish conversation creation event
-        await self.message_bus.publish(
+        self._publish_event(
             'a2a.conversations',
             {
                 'type': 'conversation_started',
@@ -515,7 +648,7 @@ class A2AService:
             }
         )
         
-        logger.info(f"Conversation started: {conversation_id} with {len(participants)} participants")
+        logger.info("Conversation started: %s with %d participants", conversation_id, len(participants))
         return conversation_id
     
     async def add_to_conversation(
@@ -534,7 +667,7 @@ class A2AService:
             True if message added successfully
         """
         if conversation_id not in self.conversations:
-            logger.warning(f"Conversation not found: {conversation_id}")
+            logger.warning("Conversation not found: %s", conversation_id)
             return False
             
         conversation = self.conversations[conversation_id]
@@ -546,26 +679,19 @@ class A2AService:
         conversation["last_message_at"] = time.time()
         conversation["message_count"] += 1
         
-        # Send message to all participants
-        for participant_id in conversation["participants"]:
-            # Skip sender
-            if participant_id == message.get("sender", {}).get("id"):
-                continue
-                
-            # Add recipient
-            if "recipients" not in message:
-                message["recipients"] = []
-                
-            message["recipients"].append({
-                "id": participant_id,
-                "type": "direct"
-            })
-            
-        # Send the message
+        # Address the message to all participants except the sender
+        sender_id = (message.get("sender") or _EMPTY).get("id")
+        message["recipients"] = message.get("recipients", []) + [
+            {"id": participant_id, "type": "direct"}
+            for participant_id in conversation["participants"]
+            if participant_id != sender_id
+        ]
+        
+        # Send the message; send_message publishes to all recipients in one batch
         await self.send_message(message)
         
         # Publish conversation message event
-        await self.message_bus.publish(
+        self._publish_event(
             'a2a.conversations',
             {
                 'type': 'message_added',
@@ -574,10 +700,10 @@ class A2AService:
             }
         )
         
-        logger.info(f"Message added to conversation {conversation_id}")
+        logger.info("Message added to conversation %s", conversation_id)
         return True
     
-    async def get_agent(self, agent_id: str) -> Optional[Dict[str, Any]]:
+    async def get_agent(self, agent_id: str) -> Optional[Mapping[str, Any]]:
         """
         Get information about an agent.
         
@@ -585,12 +711,13 @@ class A2AService:
             agent_id: Agent ID to retrieve
             
         Returns:
-            Agent information or None if not found
+            Read-only view of the agent information or None if not found;
+            use dict() on it for a mutable copy
         """
         agent = self.agents.get(agent_id)
-        return agent.copy() if agent else None
+        return MappingProxyType(agent) if agent else None
     
-    async def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+    async def get_task(self, task_id: str) -> Optional[Mapping[str, Any]]:
         """
         Get information about a task.
         
@@ -598,12 +725,13 @@ class A2AService:
             task_id: Task ID to retrieve
             
         Returns:
-            Task information or None if not found
+            Read-only view of the task information or None if not found;
+            use dict() on it for a mutable copy
         """
         task = self.tasks.get(task_id)
-        return task.copy() if task else None
+        return MappingProxyType(task) if task else None
     
-    async def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+    async def get_conversation(self, conversation_id: str) -> Optional[Mapping[str, Any]]:
         """
         Get information about a conversation.
         
@@ -611,12 +739,52 @@ class A2AService:
             conversation_id: Conversation ID to retrieve
             
         Returns:
-            Conversation information or None if not found
+            Read-only view of the conversation information or None if not found;
+            use dict() on it for a mutable copy
         """
         conversation = self.conversations.get(conversation_id)
-        return conversation.copy() if conversation else None
+        return MappingProxyType(conversation) if conversation else None
     
-    async def _find_agents_by_capability(self, capability: str) -> List[str]:
+    @staticmethod
+    def _extract_capabilities(agent_card: Dict[str, Any]) -> List[str]:
+        """
+        Flatten the capabilities listed in an agent card.
+        
+        Capabilities are either listed per category or per domain within
+        a category.
+        
+        Args:
+            agent_card: Agent card information
+            
+        Returns:
+            List of capabilities
+        """
+        capabilities = []
+        for category, category_capabilities in (agent_card.get("capabilities") or _EMPTY).items():
+            if isinstance(category_capabilities, list):
+                capabilities.extend(category_capabilities)
+            elif isinstance(category_capabilities, dict):
+                for domain, domain_capabilities in category_capabilities.items():
+                    if isinstance(domain_capabilities, list):
+                        capabilities.extend(domain_capabilities)
+        
+        return capabilities
+    
+    def _unindex_agent(self, agent_id: str) -> None:
+        """
+        Remove an agent from the capability index.
+        
+        Args:
+            agent_id: Agent ID
+        """
+        for capability in self._agent_capabilities.pop(agent_id, ()):
+            agent_ids = self._capability_index.get(capability)
+            if agent_ids is not None:
+                agent_ids.discard(agent_id)
+                if not agent_ids:
+                    del self._capability_index[capability]
+    
+    def _find_agents_by_capability(self, capability: str) -> List[str]:
         """
         Find agents with a specific capability.
         
@@ -626,35 +794,48 @@ class A2AService:
         Returns:
             List of agent IDs
         """
-        matching_agents = []
+        return list(self._capability_index.get(capability, ()))
+    
+    def _publish_event(self, channel: str, event: Dict[str, Any]) -> None:
+        """
+        Publish an event notification without waiting for delivery.
         
-        for agent_id, agent_info in self.agents.items():
-            agent_card = agent_info.get("card", {})
-            capabilities = agent_card.get("capabilities", {})
-            
-            # Check various capability structures
-            found = False
-            
-            # Check top-level capabilities
-            for category, category_capabilities in capabilities.items():
-                if isinstance(category_capabilities, list) and capability in category_capabilities:
-                    matching_agents.append(agent_id)
-                    found = True
-                    break
-                    
-                if isinstance(category_capabilities, dict):
-                    for domain, domain_capabilities in category_capabilities.items():
-                        if isinstance(domain_capabilities, list) and capability in domain_capabilities:
-                            matching_agents.append(agent_id)
-                            found = True
-                            break
-                            
-                if found:
-                    break
-        
-        return matching_agents
+        Events such as task status changes are side-channel notifications,
+        so callers don't need to wait for subscribers to process them.
+        Events on channels without subscribers other than the service itself
+        are dropped.
+        
+        Args:
+            channel: Channel to publish the event on
+            event: Event payload
+        """
+        if not self.message_bus.has_subscribers(channel, exclude=self._own_handlers):
+            return
+        
+        task = asyncio.create_task(self.message_bus.publish_async(channel, event))
+        self._event_tasks.add(task)
+        task.add_done_callback(functools.partial(self._event_published, channel, event))
+    
+    def _event_published(self, channel: str, event: Dict[str, Any], task: asyncio.Task) -> None:
+        """
+        Log the outcome of a background event publication.
+        
+        Args:
+            channel: Channel the event was published on
+            event: Event payload
+            task: Finished publication task
+        """
+        self._event_tasks.discard(task)
+        if task.cancelled():
+            return
+        
+        error = task.exception()
+        if error is not None:
+            logger.error("Error publishing %s to %s: %s", event.get("type", "event"), channel, error)
+        elif not task.result():
+            logger.warning("Failed to publish %s to %s", event.get("type", "event"), channel)
     
-    async def _handle_registration(self, message: Dict[str, Any]):
+    async def _handle_registration(self, message: Dict[str, Any]) -> None:
         """
         Handle agent registration messages.
         
@@ -676,14 +857,15 @@ class A2AService:
                 await self.unregister_agent(agent_id)
                 
         elif message_type == 'heartbeat':
-            # Update agent heartbeat
-            agent_id = message.get('agent_id')
-            if agent_id and agent_id in self.agents:
-                self.agents[agent_id]['last_seen'] = time.time()
+            # Update agent heartbeat; the coarse clock avoids a clock read
+            # per heartbeat and is precise enough for last_seen
+            agent = self.agents.get(message.get('agent_id'))
+            if agent is not None:
+                agent['last_seen'] = clock.now()
     
-    async def _handle_message(self, message: Dict[str, Any]):
+    async def _handle_message(self, message: Dict[str, Any]) -> None:
         """
-        Handle agent messages.
+        Handle agent messages submitted on the inbound message channel.
         
         Args:
             message: Agent message
@@ -695,7 +877,7 @@ class A2AService:
         # Forward message to recipients
         await self.send_message(message)
     
-    async def _handle_task(self, message: Dict[str, Any]):
+    async def _handle_task(self, message: Dict[str, Any]) -> None:
         """
         Handle task management messages.
         
@@ -730,7 +912,7 @@ class A2AService:
                     result=message.get('result')
                 )
     
-    async def _handle_conversation(self, message: Dict[str, Any]):
+    async def _handle_conversation(self, message: Dict[str, Any]) -> None:
         """
         Handle conversation messages.
         
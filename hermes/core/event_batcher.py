@@ -0,0 +1,170 @@
+"""
+Event Batcher - Batched publication of service events to the message bus.
+
+This module provides a queue-based batcher that collects events published
+by Hermes services and hands them to the message bus in batches, so bursts
+of registrations or context updates are not published one call at a time.
+"""
+
+import asyncio
+import contextvars
+import logging
+from typing import Dict, List, Any, Callable, Collection, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Batcher whose worker is running the current code, if any. Subscribers are
+# called from the worker while it publishes a batch, including from tasks the
+# bus spawns for it, which inherit this context.
+_current_worker: contextvars.ContextVar = contextvars.ContextVar("event_batcher_worker", default=None)
+
+
+class EventBatcher:
+    """
+    Batches service events for publication to the message bus.
+
+    Events are queued by `publish` and flushed by a background worker once
+    either `batch_size` events have accumulated or `flush_interval` seconds
+    have passed since the first event of the batch arrived. Events keep the
+    order in which they were queued. Publishing does not wait for the bus to
+    accept the event; failed publications are logged by the worker. Events
+    on channels without subscribers are dropped.
+
+    Subscribers run inside the worker, so events they publish are never
+    waited on from there: `flush` returns immediately, and events that do
+    not fit in a full queue are published directly.
+    """
+
+    def __init__(
+        self,
+        message_bus: Any,
+        batch_size: int = 64,
+        flush_interval: float = 0.005,
+        max_pending: int = 10000,
+        own_handlers: Collection[Callable] = ()
+    ):
+        """
+        Initialize the event batcher.
+
+        Args:
+            message_bus: Message bus the events are published to
+            batch_size: Maximum number of events per batch
+            flush_interval: Maximum time in seconds to wait for a batch to fill
+            max_pending: Maximum number of queued events; publishers wait
+                while the queue is full
+            own_handlers: The publishing service's own subscriptions, which
+                ignore its events and don't count as subscribers
+        """
+        self.message_bus = message_bus
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.own_handlers = frozenset(own_handlers)
+
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background flush worker."""
+        if self._task is not None and not self._task.done():
+            return
+
+        self._task = asyncio.create_task(self.run())
+        logger.info("Event batcher started")
+
+    async def stop(self) -> None:
+        """Publish any queued events and stop the background flush worker."""
+        if self._task is None:
+            return
+
+        await self.flush()
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        logger.info("Event batcher stopped")
+
+    async def publish(self, channel: str, event: Dict[str, Any]) -> None:
+        """
+        Queue an event for batched publication.
+
+        Returns as soon as the event is queued, unless the queue is full.
+
+        Args:
+            channel: Channel to publish the event to
+            event: Event to publish
+        """
+        if not self.message_bus.has_subscribers(channel, exclude=self.own_handlers):
+            return
+
+        # Without a running worker, publish the event directly
+        if self._task is None or self._task.done():
+            await self.message_bus.publish_async(channel, event)
+            return
+
+        if _current_worker.get() is self and self.queue.full():
+            # The worker cannot drain the queue while it waits on itself
+            await self.message_bus.publish_async(channel, event)
+            return
+
+        await self.queue.put((channel, event))
+
+    async def flush(self) -> None:
+        """
+        Wait until every queued event has been published.
+
+        Called from a subscriber while the worker publishes a batch, this
+        returns immediately, since the batch cannot finish before it does.
+        """
+        if self._task is None or self._task.done() or _current_worker.get() is self:
+            return
+
+        await self.queue.join()
+
+    async def run(self) -> None:
+        """Collect queued events into batches and publish them until cancelled."""
+        loop = asyncio.get_running_loop()
+        _current_worker.set(self)
+
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Publish a batch of events.
+
+        Args:
+            batch: List of (channel, event) pairs
+        """
+        try:
+            results = await self.message_bus.publish_many_async(batch)
+            for (channel, event), success in zip(batch, results):
+                if not success:
+                    logger.warning(f"Failed to publish {event.get('type', 'event')} to {channel}")
+        except Exception as e:
+            logger.error(f"Error publishing event batch: {e}")
+        finally:
+            for _ in batch:
+                self.queue.task_done()
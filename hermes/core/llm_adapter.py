@@ -6,13 +6,10 @@ Enhanced with standardized tekton-llm-client integration for consistent LLM acce
 across Tekton components.
 """
 
-import os
-import json
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Tuple, Union, AsyncGenerator, Callable
+from typing import Dict, List, Any, Optional, Tuple, Union, AsyncGenerator, Callable, ClassVar
 
-import aiohttp
 from hermes.core.llm_client import LLMClient
 
 logger = logging.getLogger(__name__)
@@ -25,6 +22,9 @@ class LLMAdapter:
     using the enhanced LLMClient based on tekton-llm-client internally.
     """
     
+    # Process-wide adapter returned by instance()
+    _instance: ClassVar[Optional["LLMAdapter"]] = None
+    
     def __init__(self, adapter_url: Optional[str] = None):
         """
         Initialize the LLM adapter.
@@ -32,30 +32,68 @@ class LLMAdapter:
         Args:
             adapter_url: URL for the LLM adapter service
         """
-        # Default to the environment variable or standard port from the Single Port Architecture
-        rhetor_port = os.environ.get("RHETOR_PORT", "8003")
-        default_adapter_url = f"http://localhost:{rhetor_port}"
+        # Create enhanced LLM client, which resolves the environment defaults
+        self.llm_client = LLMClient(adapter_url=adapter_url)
         
-        self.adapter_url = adapter_url or os.environ.get("LLM_ADAPTER_URL", default_adapter_url)
-        self.default_provider = os.environ.get("LLM_PROVIDER", "anthropic")
-        self.default_model = os.environ.get("LLM_MODEL", "claude-3-haiku-20240307")
+        self.adapter_url = self.llm_client.adapter_url
+        self.default_provider = self.llm_client.provider
+        self.default_model = self.llm_client.model
+    
+    @classmethod
+    def instance(cls, adapter_url: Optional[str] = None) -> "LLMAdapter":
+        """
+        Get the shared adapter, creating it on first use.
         
-        # Create enhanced LLM client
-        self.llm_client = LLMClient(
-            adapter_url=self.adapter_url,
-            model=self.default_model,
-            provider=self.default_provider
-        )
+        Sharing one adapter lets all callers use the same connection pool,
+        analysis caches and concurrency limit.
         
-    async def get_available_providers(self) -> Dict[str, Any]:
+        Args:
+            adapter_url: URL for the LLM adapter service, used only when the
+                shared adapter is created
+            
+        Returns:
+            Shared LLM adapter
+        """
+        if cls._instance is None:
+            cls._instance = cls(adapter_url=adapter_url)
+        return cls._instance
+    
+    async def __aenter__(self) -> "LLMAdapter":
+        """Enter an async context that closes the adapter on exit."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the adapter when leaving the async context."""
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """
+        Close the connections held by the underlying LLM client.
+        """
+        await self.llm_client.close()
+        
+    async def get_available_providers(self, fallback: bool = True) -> Dict[str, Any]:
         """
         Get available LLM providers.
         
+        Args:
+            fallback: Return the default providers if the providers can't be
+                fetched, instead of raising the error
+            
         Returns:
             Dict of available providers and their models
         """
         # Use the enhanced client to get provider information
-        return await self.llm_client.get_available_providers()
+        return await self.llm_client.get_available_providers(fallback=fallback)
+    
+    def get_default_providers(self) -> Dict[str, Any]:
+        """
+        Get the providers assumed when the available ones can't be fetched.
+        
+        Returns:
+            Dict with the current provider and its default models
+        """
+        return self.llm_client.get_default_providers()
     
     def get_current_provider_and_model(self) -> Tuple[str, str]:
         """
@@ -97,6 +135,32 @@ class LLMAdapter:
             message_type=message_type
         )
     
+    async def batch_analyze(self, messages: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Analyze several messages concurrently, with bounded concurrency.
+        
+        Args:
+            messages: List of (message_content, message_type) pairs
+            
+        Returns:
+            Analysis results in the same order as the input
+        """
+        # Forward to the enhanced client
+        return await self.llm_client.batch_analyze(messages)
+    
+    async def batch_analyze_mixed(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Analyze a mix of messages and service registrations concurrently.
+        
+        Args:
+            items: Analysis requests, as accepted by LLMClient.batch_analyze_mixed
+            
+        Returns:
+            Analysis results in the same order as the input
+        """
+        # Forward to the enhanced client
+        return await self.llm_client.batch_analyze_mixed(items)
+    
     async def analyze_service(self, service_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze a service registration using LLM.
@@ -110,13 +174,19 @@ class LLMAdapter:
         # Forward to the enhanced client
         return await self.llm_client.analyze_service(service_data)
     
-    async def chat(self, message: str, chat_history: Optional[List[Dict[str, str]]] = None) -> Dict[str, Any]:
+    async def chat(self,
+                  message: str,
+                  chat_history: Optional[List[Dict[str, str]]] = None,
+                  provider: Optional[str] = None,
+                  model: Optional[str] = None) -> Dict[str, Any]:
         """
         Send a chat message to the LLM.
         
         Args:
             message: User message
             chat_history: Optional chat history for context
+            provider: Optional provider for this call only
+            model: Optional model for this call only
             
         Returns:
             LLM response
@@ -126,14 +196,16 @@ class LLMAdapter:
             message=message,
             chat_history=chat_history,
             system_prompt=None,  # Will use the default system prompt
-            model=self.default_model,
-            provider=self.default_provider
+            model=model or self.default_model,
+            provider=provider or self.default_provider
         )
     
     async def streaming_chat(self, 
                             message: str, 
                             callback: Any,
-                            chat_history: Optional[List[Dict[str, str]]] = None):
+                            chat_history: Optional[List[Dict[str, str]]] = None,
+                            provider: Optional[str] = None,
+                            model: Optional[str] = None):
         """
         Send a chat message to the LLM with streaming response.
         
@@ -141,6 +213,8 @@ class LLMAdapter:
             message: User message
             callback: Callback function to receive streaming chunks
             chat_history: Optional chat history for context
+            provider: Optional provider for this call only
+            model: Optional model for this call only
         """
         # Forward to the enhanced client
         await self.llm_client.streaming_chat(
@@ -148,8 +222,8 @@ class LLMAdapter:
             callback=callback,
             chat_history=chat_history,
             system_prompt=None,  # Will use the default system prompt
-            model=self.default_model,
-            provider=self.default_provider
+            model=model or self.default_model,
+            provider=provider or self.default_provider
         )
     
     # Removed the _parse_analysis_response and _parse_service_analysis_response methods
@@ -7,12 +7,18 @@ all Tekton components.
 """
 
 import os
-import json
+import copy
+import random
+import hashlib
+import functools
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Union, AsyncGenerator, Callable, Tuple
+import inspect
+from typing import Dict, List, Any, Optional, Union, AsyncGenerator, Awaitable, Callable, Tuple, TypeVar
 from pathlib import Path
 
+import orjson
+
 from tekton_llm_client import (
     TektonLLMClient,
     PromptTemplateRegistry, PromptTemplate, load_template,
@@ -22,8 +28,161 @@ from tekton_llm_client import (
     ClientSettings, LLMSettings, get_env
 )
 
+from hermes.utils.cache import TTLCache
+from hermes.utils.semantic_cache import SemanticCache
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Connection defaults, read from the environment once at import
+_DEFAULT_ADAPTER_URL = get_env("LLM_ADAPTER_URL", f"http://localhost:{get_env('RHETOR_PORT', '8003')}")
+_DEFAULT_PROVIDER = get_env("LLM_PROVIDER", "anthropic")
+_DEFAULT_MODEL = get_env("LLM_MODEL", "claude-3-haiku-20240307")
+
+# Models listed after the current one when the providers can't be fetched
+_FALLBACK_MODELS = (
+    ("claude-3-opus-20240229", "Claude 3 Opus"),
+    ("claude-3-sonnet-20240229", "Claude 3 Sonnet"),
+)
+
+# HTTP statuses from the LLM adapter worth retrying
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+# Base delay in seconds before the first retry; doubled on each attempt
+_RETRY_BASE_DELAY = 0.5
+
+# Longest delay in seconds before a retry, whatever Retry-After asks for
+_RETRY_MAX_DELAY = 30.0
+
+# Keywords of the sections that end the summary in a message analysis
+_MESSAGE_SECTION_KEYWORDS = ("purpose", "components", "data", "priority")
+
+# Prefixes of the text generate() and generate_with_template() return on failure
+_GENERATION_ERRORS = ("Error generating response:", "Error generating with template:")
+
+# Output instructions appended to analysis prompts when structured output is enabled
+_MESSAGE_ANALYSIS_FORMAT = (
+    'Respond ONLY with a JSON object of the form {"purpose": string, '
+    '"components": [string], "data_summary": string, "priority": string, '
+    '"summary": string}.'
+)
+_SERVICE_ANALYSIS_FORMAT = (
+    'Respond ONLY with a JSON object of the form {"capabilities": [string], '
+    '"dependencies": [string], "integration_points": [string], '
+    '"use_cases": [string], "summary": string}.'
+)
+
+
+def _retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """
+    Get the delay before retrying a failed LLM request.
+    
+    Args:
+        error: Error raised by the request
+        attempt: Number of the failed attempt, starting at 0
+        
+    Returns:
+        Delay in seconds, or None if the error is not transient
+    """
+    # Imported here so that importing Hermes does not load aiohttp; by the
+    # time a request has failed, tekton-llm-client has already loaded it
+    import aiohttp
+    
+    status = getattr(error, "status", None)
+    if status not in _RETRY_STATUSES and not isinstance(
+        error, (asyncio.TimeoutError, aiohttp.ClientConnectionError, ConnectionError)
+    ):
+        return None
+    
+    delay = _RETRY_BASE_DELAY * 2 ** attempt
+    
+    # Honor the server's Retry-After, given in seconds, up to the maximum delay
+    headers = getattr(error, "headers", None) or {}
+    try:
+        delay = max(delay, float(headers.get("Retry-After", 0)))
+    except (TypeError, ValueError):
+        pass
+    
+    return min(delay, _RETRY_MAX_DELAY) + random.uniform(0, 0.25)
+
+
+def _load_json_object(response: str, keys: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+    """
+    Load a structured analysis from an LLM response.
+    
+    Text around the outermost braces, such as a Markdown code fence, is ignored.
+    
+    Args:
+        response: Raw LLM response
+        keys: Expected keys, at least one of which must be present
+        
+    Returns:
+        JSON object, or None if the response does not contain one
+    """
+    start = response.find("{")
+    end = response.rfind("}")
+    if start == -1 or end < start:
+        return None
+    
+    try:
+        data = orjson.loads(response[start:end + 1])
+    except orjson.JSONDecodeError:
+        return None
+    
+    if not isinstance(data, dict) or not any(key in data for key in keys):
+        return None
+    return data
+
+
+def _json_text(value: Any, default: str) -> str:
+    """
+    Get a text field of a structured analysis.
+    
+    Args:
+        value: Field value
+        default: Text to use if the field is missing or empty
+        
+    Returns:
+        Field text
+    """
+    if isinstance(value, str):
+        value = value.strip()
+    elif value is not None:
+        value = str(value)
+    return value or default
+
+
+def _json_list(value: Any) -> List[str]:
+    """
+    Get a list field of a structured analysis.
+    
+    Args:
+        value: Field value, a list or a comma-separated string
+        
+    Returns:
+        Non-empty list items
+    """
+    if isinstance(value, str):
+        value = value.split(",")
+    elif not isinstance(value, list):
+        return []
+    return [item for item in (str(item).strip() for item in value) if item]
+
+
+async def _invoke_callback(callback: Callable[[Any], Any], chunk: Any) -> None:
+    """
+    Pass a streamed chunk to a callback, awaiting it if it is a coroutine function.
+    
+    Args:
+        callback: Synchronous or asynchronous callback
+        chunk: Chunk to pass to the callback
+    """
+    result = callback(chunk)
+    if inspect.isawaitable(result):
+        await result
+
+
 class LLMClient:
     """
     Enhanced LLM Client for Hermes using the tekton-llm-client library.
@@ -52,13 +211,10 @@ class LLMClient:
             max_tokens: Maximum tokens to generate
             templates_directory: Path to prompt templates directory
         """
-        # Get environment variables or set defaults
-        rhetor_port = get_env("RHETOR_PORT", "8003")
-        default_adapter_url = f"http://localhost:{rhetor_port}"
-        
-        self.adapter_url = adapter_url or get_env("LLM_ADAPTER_URL", default_adapter_url)
-        self.provider = provider or get_env("LLM_PROVIDER", "anthropic")
-        self.model = model or get_env("LLM_MODEL", "claude-3-haiku-20240307")
+        # Use the environment defaults for anything not given
+        self.adapter_url = adapter_url or _DEFAULT_ADAPTER_URL
+        self.provider = provider or _DEFAULT_PROVIDER
+        self.model = model or _DEFAULT_MODEL
         
         # Initialize client settings
         self.client_settings = ClientSettings(
@@ -78,12 +234,36 @@ class LLMClient:
             top_p=0.95
         )
         
-        # Create LLM client (will be initialized on first use)
+        # Create LLM client (will be initialized on first use). The client
+        # owns the HTTP connection pool, so it is shared by all calls.
         self.llm_client = None
+        self._client_lock = asyncio.Lock()
+        
+        # Results of identical analysis requests, so repeats skip the LLM
+        self._analysis_cache = TTLCache(maxsize=1024, ttl=3600)
+        
+        # Retries of LLM requests that fail with a transient error
+        self.max_retries = int(get_env("HERMES_LLM_MAX_RETRIES", "3"))
+        
+        # Bounds the number of analysis requests batch_analyze sends at once
+        self._analyze_semaphore = asyncio.Semaphore(int(get_env("HERMES_LLM_CONCURRENCY", "8")))
+        
+        # Optional semantic cache that also answers near-duplicate messages.
+        # Enabled by naming a sentence-transformers model, loaded on first use.
+        self.semantic_cache_model = get_env("HERMES_SEMANTIC_CACHE_MODEL")
+        self._embedding_model = None
+        self._semantic_caches: Dict[Tuple[Any, ...], SemanticCache] = {}
+        
+        # Ask for analyses as JSON objects, falling back to the text parsers
+        # for responses that are not
+        self.structured_output = get_env("HERMES_LLM_STRUCTURED_OUTPUT", "true").lower() in ("1", "true", "yes")
         
         # Initialize template registry
         self.template_registry = PromptTemplateRegistry(load_defaults=False)
         
+        # Formatted system prompts, with the template each was formatted from
+        self._system_prompts: Dict[str, Tuple[Any, str]] = {}
+        
         # Set templates directory
         self.templates_directory = templates_directory
         
@@ -211,6 +391,31 @@ class LLMClient:
         
         logger.info("Registered default templates for Hermes")
     
+    def _get_system_prompt(self, template_name: str) -> Optional[str]:
+        """
+        Get a formatted system prompt.
+        
+        System prompt templates take no variables, so each is formatted once
+        and reused until a different template is registered under its name.
+        
+        Args:
+            template_name: Name of the system prompt template
+            
+        Returns:
+            Formatted system prompt, or None if the template is not found
+        """
+        template = self.template_registry.get_template(template_name)
+        if not template:
+            return None
+        
+        cached = self._system_prompts.get(template_name)
+        if cached is not None and cached[0] is template:
+            return cached[1]
+        
+        system_prompt = template.format()
+        self._system_prompts[template_name] = (template, system_prompt)
+        return system_prompt
+    
     async def _get_client(self) -> TektonLLMClient:
         """
         Get or initialize the LLM client.
@@ -219,17 +424,68 @@ class LLMClient:
             Initialized TektonLLMClient
         """
         if self.llm_client is None:
-            self.llm_client = TektonLLMClient(
-                settings=self.client_settings,
-                llm_settings=self.llm_settings
-            )
-            await self.llm_client.initialize()
+            async with self._client_lock:
+                # Another caller may have initialized it while we waited
+                if self.llm_client is None:
+                    client = TektonLLMClient(
+                        settings=self.client_settings,
+                        llm_settings=self.llm_settings
+                    )
+                    await client.initialize()
+                    self.llm_client = client
         return self.llm_client
     
-    async def get_available_providers(self) -> Dict[str, Any]:
+    async def close(self) -> None:
+        """
+        Shut down the LLM client and release its connections.
+        
+        A new client is created on the next call.
+        """
+        async with self._client_lock:
+            client, self.llm_client = self.llm_client, None
+        
+        if client is not None:
+            try:
+                await client.shutdown()
+            except Exception as e:
+                logger.error(f"Error shutting down LLM client: {e}")
+    
+    async def _with_retries(self, request: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run an LLM request, retrying it with exponential backoff on transient errors.
+        
+        Rate limiting (429), server errors (5xx), timeouts and connection
+        errors are retried up to max_retries times, waiting at least as long
+        as the server's Retry-After header asks, up to _RETRY_MAX_DELAY
+        seconds. Other errors are raised.
+        
+        Args:
+            request: Function starting the request
+            
+        Returns:
+            Result of the request
+        """
+        attempt = 0
+        while True:
+            try:
+                return await request()
+            except Exception as e:
+                delay = _retry_delay(e, attempt) if attempt < self.max_retries else None
+                if delay is None:
+                    raise
+                
+                logger.warning(f"LLM request failed ({e}), retrying in {delay:.2f}s")
+                attempt += 1
+                await asyncio.sleep(delay)
+    
+    async def get_available_providers(self, fallback: bool = True) -> Dict[str, Any]:
         """
         Get available LLM providers.
         
+        Args:
+            fallback: Return the default providers if the providers can't be
+                fetched, instead of raising the error
+            
         Returns:
             Dict of available providers and their models
         """
@@ -276,19 +532,29 @@ class LLMClient:
             return result
             
         except Exception as e:
+            if not fallback:
+                raise
             logger.error(f"Error getting providers: {e}")
             
             # Return default providers if the API call fails
-            return {
-                self.provider: {
-                    "available": True,
-                    "models": [
-                        {"id": self.model, "name": "Default Model"},
-                        {"id": "claude-3-opus-20240229", "name": "Claude 3 Opus"},
-                        {"id": "claude-3-sonnet-20240229", "name": "Claude 3 Sonnet"},
-                    ]
-                }
+            return self.get_default_providers()
+    
+    def get_default_providers(self) -> Dict[str, Any]:
+        """
+        Get the providers assumed when the available ones can't be fetched.
+        
+        Returns:
+            Dict with the current provider and its default models
+        """
+        return {
+            self.provider: {
+                "available": True,
+                "models": [
+                    {"id": self.model, "name": "Default Model"},
+                    *({"id": model_id, "name": name} for model_id, name in _FALLBACK_MODELS)
+                ]
             }
+        }
     
     def get_current_provider_and_model(self) -> Tuple[str, str]:
         """
@@ -356,20 +622,20 @@ class LLMClient:
             
             # Generate with streaming if requested
             if stream:
-                response_stream = await client.generate_text(
+                response_stream = await self._with_retries(lambda: client.generate_text(
                     prompt=prompt,
                     system_prompt=system_prompt,
                     settings=settings,
                     streaming=True
-                )
+                ))
                 return response_stream
             
             # Regular generation
-            response = await client.generate_text(
+            response = await self._with_retries(lambda: client.generate_text(
                 prompt=prompt,
                 system_prompt=system_prompt,
                 settings=settings
-            )
+            ))
             
             return response.content
             
@@ -392,7 +658,8 @@ class LLMClient:
         max_tokens: Optional[int] = None,
         model: Optional[str] = None,
         provider: Optional[str] = None,
-        stream: bool = False
+        stream: bool = False,
+        instructions: Optional[str] = None
     ) -> Union[str, AsyncGenerator[str, None]]:
         """
         Generate text using a prompt template.
@@ -406,6 +673,7 @@ class LLMClient:
             model: Optional model override
             provider: Optional provider override
             stream: Whether to stream the response
+            instructions: Optional text appended to the formatted prompt
             
         Returns:
             Generated text or async generator for streaming
@@ -418,14 +686,14 @@ class LLMClient:
             
             system_prompt = None
             if system_template_name:
-                system_template = self.template_registry.get_template(system_template_name)
-                if system_template:
-                    system_prompt = system_template.format()
-                else:
+                system_prompt = self._get_system_prompt(system_template_name)
+                if system_prompt is None:
                     logger.warning(f"System template not found: {system_template_name}")
             
             # Format prompt with variables
             prompt = template.format(**variables)
+            if instructions:
+                prompt = f"{prompt}\n\n{instructions}"
             
             # Generate response
             return await self.generate(
@@ -494,20 +762,10 @@ class LLMClient:
             
             # Use default system prompt if not provided
             if not system_prompt:
-                system_template = self.template_registry.get_template("system_hermes_assistant")
-                if system_template:
-                    system_prompt = system_template.format()
-            
-            # Prepare messages
-            messages = []
-            if chat_history:
-                messages.extend(chat_history)
+                system_prompt = self._get_system_prompt("system_hermes_assistant")
             
-            # Add the current user message
-            messages.append({
-                "role": "user",
-                "content": message
-            })
+            # Prepare messages, ending with the current user message
+            messages = [*(chat_history or ()), {"role": "user", "content": message}]
             
             # Generate with streaming if requested
             if stream:
@@ -522,12 +780,12 @@ class LLMClient:
                                 streaming=True
                             ):
                                 if chunk:
-                                    callback(chunk)
+                                    await _invoke_callback(callback, chunk)
                                     yield chunk
                         except Exception as e:
                             error_msg = f"Error in streaming: {str(e)}"
                             logger.error(error_msg)
-                            callback(error_msg)
+                            await _invoke_callback(callback, error_msg)
                             yield error_msg
                     
                     return handle_stream()
@@ -541,11 +799,11 @@ class LLMClient:
                     )
             
             # Regular chat generation
-            response = await client.generate_chat(
+            response = await self._with_retries(lambda: client.generate_chat(
                 messages=messages,
                 system_prompt=system_prompt,
                 settings=settings
-            )
+            ))
             
             return {
                 "message": response.content,
@@ -561,7 +819,7 @@ class LLMClient:
                 async def error_stream():
                     error_msg = f"Error in chat: {str(e)}"
                     if callback:
-                        callback(error_msg)
+                        await _invoke_callback(callback, error_msg)
                     yield error_msg
                 return error_stream()
             
@@ -584,6 +842,11 @@ class LLMClient:
         """
         Send a chat message with streaming response.
         
+        The callback receives {"chunk": text, "done": False} for each piece of
+        the response, then a chunk with "done" set to True. If the stream
+        fails part way, it receives {"error": message, "done": True} instead.
+        Coroutine callbacks are awaited.
+        
         Args:
             message: User message
             callback: Callback function for streaming chunks
@@ -594,7 +857,7 @@ class LLMClient:
             model: Optional model override
             provider: Optional provider override
         """
-        async for chunk in await self.chat(
+        stream = await self.chat(
             message=message,
             chat_history=chat_history,
             system_prompt=system_prompt,
@@ -602,11 +865,26 @@ class LLMClient:
             max_tokens=max_tokens,
             model=model,
             provider=provider,
-            stream=True,
-            callback=callback
-        ):
-            # The streaming is handled by the callback
-            pass
+            stream=True
+        )
+        
+        done = False
+        try:
+            async for chunk in stream:
+                # Streamed chunks are either text or objects carrying it
+                text = getattr(chunk, "chunk", chunk)
+                done = bool(getattr(chunk, "done", False))
+                if text or done:
+                    await _invoke_callback(callback, {"chunk": text or "", "done": done})
+                if done:
+                    break
+        except Exception as e:
+            logger.error(f"Error in streaming: {str(e)}")
+            await _invoke_callback(callback, {"error": f"Error in streaming: {str(e)}", "done": True})
+            return
+        
+        if not done:
+            await _invoke_callback(callback, {"chunk": "", "done": True})
     
     async def analyze_message(
         self, 
@@ -627,6 +905,26 @@ class LLMClient:
         Returns:
             Analysis results
         """
+        cache_key = self._analysis_cache_key(
+            "message", f"{message_type}|{message_content}", temperature, model
+        )
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        # Look for the analysis of a similar message
+        vector = await self._embed(message_content)
+        if vector is not None:
+            # Keep message types apart so a near-duplicate message of another
+            # type is never served that type's analysis
+            semantic_key = (*cache_key[:-1], message_type)
+            semantic_cache = self._semantic_caches.get(semantic_key)
+            if semantic_cache is None:
+                semantic_cache = self._semantic_caches[semantic_key] = SemanticCache()
+            cached = semantic_cache.get(vector)
+            if cached is not None:
+                return copy.deepcopy(cached)
+        
         try:
             # Use template to analyze message
             response = await self.generate_with_template(
@@ -635,11 +933,17 @@ class LLMClient:
                 system_template_name="system_message_analysis",
                 temperature=temperature or 0.3,  # Lower temperature for analysis
                 model=model,
-                stream=False
+                stream=False,
+                instructions=_MESSAGE_ANALYSIS_FORMAT if self.structured_output else None
             )
             
-            # Parse the response
-            return self._parse_message_analysis(response)
+            # Parse the response; failed generations are not cached
+            analysis = self._parse_message_analysis(response)
+            if not response.startswith(_GENERATION_ERRORS):
+                self._analysis_cache.set(cache_key, analysis)
+                if vector is not None:
+                    semantic_cache.set(vector, analysis)
+            return copy.deepcopy(analysis)
             
         except Exception as e:
             logger.error(f"Error analyzing message: {e}")
@@ -652,6 +956,84 @@ class LLMClient:
                 "full_analysis": ""
             }
     
+    async def batch_analyze(
+        self,
+        messages: List[Tuple[str, str]],
+        temperature: Optional[float] = None,
+        model: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze several messages concurrently.
+        
+        At most HERMES_LLM_CONCURRENCY (default 8) analyses are in flight at
+        once, so bursts of messages don't overload the LLM service.
+        
+        Args:
+            messages: List of (message_content, message_type) pairs
+            temperature: Optional temperature override
+            model: Optional model override
+            
+        Returns:
+            Analysis results in the same order as the input
+        """
+        return await self.batch_analyze_mixed(
+            [
+                {"kind": "message", "message_content": message_content, "message_type": message_type}
+                for message_content, message_type in messages
+            ],
+            temperature=temperature,
+            model=model
+        )
+    
+    async def batch_analyze_mixed(
+        self,
+        items: List[Dict[str, Any]],
+        temperature: Optional[float] = None,
+        model: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze a mix of messages and service registrations concurrently.
+        
+        Each item is either {"kind": "message", "message_content": ...,
+        "message_type": ...} or {"kind": "service", "service_data": ...}.
+        The analyses share the client's connection pool and are bounded by
+        HERMES_LLM_CONCURRENCY like batch_analyze.
+        
+        Args:
+            items: Analysis requests
+            temperature: Optional temperature override
+            model: Optional model override
+            
+        Returns:
+            Analysis results in the same order as the input
+            
+        Raises:
+            ValueError: If an item has an unknown kind
+        """
+        requests = []
+        for item in items:
+            kind = item.get("kind")
+            if kind == "message":
+                requests.append(functools.partial(
+                    self.analyze_message,
+                    item["message_content"],
+                    item.get("message_type", "standard"),
+                    temperature=temperature,
+                    model=model
+                ))
+            elif kind == "service":
+                requests.append(functools.partial(
+                    self.analyze_service, item["service_data"], temperature=temperature, model=model
+                ))
+            else:
+                raise ValueError(f"Unknown analysis kind: {kind}")
+        
+        async def analyze(request: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+            async with self._analyze_semaphore:
+                return await request()
+        
+        return list(await asyncio.gather(*[analyze(request) for request in requests]))
+    
     async def analyze_service(
         self, 
         service_data: Dict[str, Any],
@@ -670,8 +1052,16 @@ class LLMClient:
             Analysis results
         """
         try:
-            # Convert service data to JSON string for template
-            service_data_str = json.dumps(service_data, indent=2)
+            # Convert service data to compact, canonical JSON for the template;
+            # the same string identifies the request in the analysis cache
+            service_data_str = orjson.dumps(
+                service_data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            ).decode()
+            
+            cache_key = self._analysis_cache_key("service", service_data_str, temperature, model)
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
             
             # Use template to analyze service
             response = await self.generate_with_template(
@@ -680,11 +1070,15 @@ class LLMClient:
                 system_template_name="system_service_analysis",
                 temperature=temperature or 0.3,  # Lower temperature for analysis
                 model=model,
-                stream=False
+                stream=False,
+                instructions=_SERVICE_ANALYSIS_FORMAT if self.structured_output else None
             )
             
-            # Parse the response
-            return self._parse_service_analysis(response)
+            # Parse the response; failed generations are not cached
+            analysis = self._parse_service_analysis(response)
+            if not response.startswith(_GENERATION_ERRORS):
+                self._analysis_cache.set(cache_key, analysis)
+            return copy.deepcopy(analysis)
             
         except Exception as e:
             logger.error(f"Error analyzing service: {e}")
@@ -697,6 +1091,56 @@ class LLMClient:
                 "full_analysis": ""
             }
     
+    async def _embed(self, text: str) -> Optional[Any]:
+        """
+        Embed text for the semantic analysis cache.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            Embedding vector, or None if the semantic cache is disabled
+        """
+        if not self.semantic_cache_model:
+            return None
+        
+        loop = asyncio.get_running_loop()
+        try:
+            if self._embedding_model is None:
+                from sentence_transformers import SentenceTransformer
+                self._embedding_model = await loop.run_in_executor(
+                    None, SentenceTransformer, self.semantic_cache_model
+                )
+            return await loop.run_in_executor(None, self._embedding_model.encode, text)
+        except ImportError:
+            logger.warning("sentence-transformers is not installed, disabling the semantic analysis cache")
+            self.semantic_cache_model = None
+        except Exception as e:
+            logger.error(f"Error embedding text for the semantic analysis cache: {e}")
+        return None
+    
+    def _analysis_cache_key(
+        self,
+        kind: str,
+        content: str,
+        temperature: Optional[float],
+        model: Optional[str]
+    ) -> Tuple[str, str, str, Optional[float], str]:
+        """
+        Build the cache key for an analysis request.
+        
+        Args:
+            kind: Kind of analysis ("message" or "service")
+            content: Analyzed content, including anything else that affects the prompt
+            temperature: Temperature override
+            model: Model override
+            
+        Returns:
+            Cache key identifying the request and the model that answers it
+        """
+        digest = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+        return (kind, self.provider, model or self.model, temperature, digest)
+    
     def _parse_message_analysis(self, response: str) -> Dict[str, Any]:
         """
         Parse LLM message analysis response.
@@ -707,64 +1151,76 @@ class LLMClient:
         Returns:
             Parsed analysis
         """
-        # Extract key information using basic parsing
-        # More sophisticated implementations could use structured outputs
-        
-        # Extract message purpose
-        purpose = "Unknown"
-        for line in response.split("\n"):
-            if "purpose" in line.lower() or "goal" in line.lower():
-                if ":" in line:
-                    purpose = line.split(":", 1)[1].strip()
-                    break
+        if self.structured_output:
+            data = _load_json_object(
+                response, ("purpose", "components", "data_summary", "priority", "summary")
+            )
+            if data is not None:
+                return {
+                    "purpose": _json_text(data.get("purpose"), "Unknown"),
+                    "components": _json_list(data.get("components")),
+                    "data_summary": _json_text(data.get("data_summary"), "Unknown"),
+                    "priority": _json_text(data.get("priority"), "Unknown"),
+                    "summary": _json_text(data.get("summary"), ""),
+                    "full_analysis": response
+                }
         
-        # Extract components
+        # Extract key information using basic parsing, in a single pass
+        # over the lines
+        purpose = None
+        data_summary = None
+        priority = None
         components = []
         components_section = False
+        summary = ""
+        summary_section = False
+        
         for line in response.split("\n"):
-            if "components" in line.lower() and ":" in line:
-                components_section = True
-                components_text = line.split(":", 1)[1].strip()
-                if components_text:
-                    components = [c.strip() for c in components_text.split(",")]
-                continue
+            stripped = line.strip()
+            
+            # Every keyword check needs a colon, so only such lines are
+            # lowercased and split
+            has_colon = ":" in line
+            lower = line.lower() if has_colon else ""
+            value = line.split(":", 1)[1].strip() if has_colon else ""
+            
+            # Message purpose, data summary and priority come from the first matching line
+            if purpose is None and has_colon and ("purpose" in lower or "goal" in lower):
+                purpose = value
+            if data_summary is None and has_colon and "data" in lower and "content" in lower:
+                data_summary = value
+            if priority is None and has_colon and "priority" in lower:
+                priority = value
             
-            if components_section and line.strip():
-                if ":" in line and not line.strip().startswith("-"):  # New section
+            # Components, listed inline or as "-" items below their heading
+            if "components" in lower and has_colon:
+                components_section = True
+                if value:
+                    components = [c.strip() for c in value.split(",")]
+            elif components_section and stripped:
+                if has_colon and not stripped.startswith("-"):  # New section
                     components_section = False
-                elif line.strip().startswith("-"):
-                    comp = line.strip()[1:].strip()
+                elif stripped.startswith("-"):
+                    comp = stripped[1:].strip()
                     if comp:
                         components.append(comp)
-        
-        # Extract data summary
-        data_summary = "Unknown"
-        for line in response.split("\n"):
-            if "data" in line.lower() and "content" in line.lower() and ":" in line:
-                data_summary = line.split(":", 1)[1].strip()
-                break
-        
-        # Extract priority
-        priority = "Unknown"
-        for line in response.split("\n"):
-            if "priority" in line.lower() and ":" in line:
-                priority = line.split(":", 1)[1].strip()
-                break
-        
-        # Extract summary
-        summary = ""
-        summary_section = False
-        for line in response.split("\n"):
-            if "summary" in line.lower() and ":" in line:
-                summary_section = True
-                summary = line.split(":", 1)[1].strip()
-                continue
             
-            if summary_section and line.strip():
-                if ":" in line and any(kw in line.lower() for kw in ["purpose", "components", "data", "priority"]):
+            # Summary, continued on following lines until the next section
+            if "summary" in lower and has_colon:
+                summary_section = True
+                summary = value
+            elif summary_section and stripped:
+                if has_colon and any(kw in lower for kw in _MESSAGE_SECTION_KEYWORDS):
                     summary_section = False
                 else:
-                    summary += " " + line.strip()
+                    summary += " " + stripped
+        
+        if purpose is None:
+            purpose = "Unknown"
+        if data_summary is None:
+            data_summary = "Unknown"
+        if priority is None:
+            priority = "Unknown"
         
         if not summary:
             # If we couldn't find an explicit summary, use the last paragraph
@@ -791,6 +1247,20 @@ class LLMClient:
         Returns:
             Parsed analysis
         """
+        if self.structured_output:
+            data = _load_json_object(
+                response, ("capabilities", "dependencies", "integration_points", "use_cases", "summary")
+            )
+            if data is not None:
+                return {
+                    "capabilities": _json_list(data.get("capabilities")),
+                    "dependencies": _json_list(data.get("dependencies")),
+                    "integration_points": _json_list(data.get("integration_points")),
+                    "use_cases": _json_list(data.get("use_cases")),
+                    "summary": _json_text(data.get("summary"), ""),
+                    "full_analysis": response
+                }
+        
         # Extract capabilities, dependencies, etc. using basic parsing
         capabilities = []
         dependencies = []
@@ -805,19 +1275,22 @@ class LLMClient:
             if not line:
                 continue
             
-            if "capabilities" in line.lower() and ":" in line:
+            has_colon = ":" in line
+            lower = line.lower() if has_colon else ""
+            
+            if has_colon and "capabilities" in lower:
                 current_section = "capabilities"
                 continue
-            elif "dependencies" in line.lower() and ":" in line:
+            elif has_colon and "dependencies" in lower:
                 current_section = "dependencies"
                 continue
-            elif "integration" in line.lower() and ":" in line:
+            elif has_colon and "integration" in lower:
                 current_section = "integration_points"
                 continue
-            elif "use case" in line.lower() and ":" in line:
+            elif has_colon and "use case" in lower:
                 current_section = "use_cases"
                 continue
-            elif "summary" in line.lower() and ":" in line:
+            elif has_colon and "summary" in lower:
                 current_section = "summary"
                 summary = line.split(":", 1)[1].strip()
                 continue
@@ -5,18 +5,38 @@ This module provides a service for multimodal information processing,
 enabling components to handle and process multimodal content.
 """
 
+import os
+import copy
 import time
 import uuid
+import itertools
+from collections import OrderedDict, deque
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Callable, Union, Set
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Callable, Union, Set, Tuple, Mapping
 
 from hermes.core.service_discovery import ServiceRegistry
 from hermes.core.message_bus import MessageBus
+from hermes.core.event_batcher import EventBatcher
 from hermes.core.registration import RegistrationManager
+from hermes.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Number of operations kept in a context's history. The history is a ring
+# buffer, so long-lived contexts keep only their most recent operations.
+CONTEXT_HISTORY_SIZE = 256
+
+# Default number of contexts kept in memory; the least recently used
+# context is evicted when a new one is created beyond this limit
+MAX_CONTEXTS = int(os.environ.get("HERMES_MCP_MAX_CONTEXTS", "10000"))
+
+# Fields that must be present in tool and processor specifications and messages
+_TOOL_REQUIRED_FIELDS = frozenset(("name", "description", "schema"))
+_PROCESSOR_REQUIRED_FIELDS = frozenset(("name", "description", "capabilities"))
+_MESSAGE_REQUIRED_FIELDS = frozenset(("id", "version", "source", "content"))
+
 class MCPService:
     """
     Service for multimodal information processing in Hermes.
@@ -29,7 +49,8 @@ class MCPService:
         self,
         service_registry: ServiceRegistry,
         message_bus: MessageBus,
-        registration_manager: Optional[RegistrationManager] = None
+        registration_manager: Optional[RegistrationManager] = None,
+        max_contexts: int = MAX_CONTEXTS
     ):
         """
         Initialize the MCP service.
@@ -38,6 +59,7 @@ class MCPService:
             service_registry: Service registry to use
             message_bus: Message bus to use
             registration_manager: Optional registration manager to use
+            max_contexts: Maximum number of contexts kept in memory
         """
         self.service_registry = service_registry
         self.message_bus = message_bus
@@ -45,9 +67,50 @@ class MCPService:
         
         # Internal state
         self.tools: Dict[str, Dict[str, Any]] = {}
-        self.contexts: Dict[str, Dict[str, Any]] = {}
+        self.contexts: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.max_contexts = max_contexts
         self.processors: Dict[str, Dict[str, Any]] = {}
         
+        # Capability index: capability -> processor IDs, in registration order
+        self._processor_capabilities: Dict[str, List[str]] = {}
+        self._capability_index: Dict[str, Dict[str, None]] = {}
+        
+        # Matching processors by required capabilities; cleared when processors change
+        self._match_cache = TTLCache(maxsize=512, ttl=3600)
+        
+        # Generated IDs are a per-service prefix, unique across processes,
+        # and a counter. They are unique but not unguessable.
+        self._id_prefix = f"{os.getpid():x}{uuid.uuid4().hex[:8]}"
+        self._id_counter = itertools.count(1)
+        
+        # Channel message handlers, keyed by message type
+        self._tool_handlers = {
+            'register_tool': self._on_register_tool,
+            'unregister_tool': self._on_unregister_tool,
+            'execute_tool': self._on_execute_tool
+        }
+        self._context_handlers = {
+            'create_context': self._on_create_context,
+            'update_context': self._on_update_context
+        }
+        self._processor_handlers = {
+            'register_processor': self._on_register_processor,
+            'unregister_processor': self._on_unregister_processor,
+            'process_message': self._on_process_message
+        }
+        
+        # Events are published to the message bus in batches. The service's
+        # own channel handlers only act on requests, so they don't count as
+        # subscribers to its events.
+        self._events = EventBatcher(
+            message_bus,
+            own_handlers=(
+                self._handle_tool_message,
+                self._handle_context_message,
+                self._handle_processor_message
+            )
+        )
+        
         # Initialize channels
         self._channels_initialized = False
         
@@ -58,43 +121,33 @@ class MCPService:
         if self._channels_initialized:
             return
             
-        # Create tools channel
-        await self.message_bus.create_channel(
-            'mcp.tools',
-            description='Channel for MCP tools'
-        )
-        
-        # Create context channel
-        await self.message_bus.create_channel(
-            'mcp.contexts',
-            description='Channel for MCP contexts'
-        )
-        
-        # Create processor channel
-        await self.message_bus.create_channel(
-            'mcp.processors',
-            description='Channel for MCP processors'
-        )
+        # Create channels and subscribe to them, each set in one round
+        channels = {
+            'mcp.tools': ('Channel for MCP tools', self._handle_tool_message),
+            'mcp.contexts': ('Channel for MCP contexts', self._handle_context_message),
+            'mcp.processors': ('Channel for MCP processors', self._handle_processor_message)
+        }
         
-        # Subscribe to channels
-        await self.message_bus.subscribe_async(
-            'mcp.tools',
-            self._handle_tool_message
-        )
+        await asyncio.gather(*(
+            self.message_bus.create_channel(channel, description=description)
+            for channel, (description, _) in channels.items()
+        ))
         
-        await self.message_bus.subscribe_async(
-            'mcp.contexts',
-            self._handle_context_message
-        )
+        await asyncio.gather(*(
+            self.message_bus.subscribe_async(channel, handler)
+            for channel, (_, handler) in channels.items()
+        ))
         
-        await self.message_bus.subscribe_async(
-            'mcp.processors',
-            self._handle_processor_message
-        )
+        # Start batched publication of MCP events
+        self._events.start()
         
         self._channels_initialized = True
         logger.info("MCP service channels initialized")
     
+    async def close(self) -> None:
+        """Publish any queued events and stop the event batcher."""
+        await self._events.stop()
+    
     async def register_tool(self, tool_spec: Dict[str, Any]) -> str:
         """
         Register a tool with the MCP service.
@@ -106,14 +159,13 @@ class MCPService:
             Tool ID
         """
         # Validate tool specification
-        required_fields = ["name", "description", "schema"]
-        for field in required_fields:
-            if field not in tool_spec:
-                logger.error(f"Tool specification missing required field: {field}")
-                return ""
+        missing = _TOOL_REQUIRED_FIELDS.difference(tool_spec)
+        if missing:
+            logger.error(f"Tool specification missing required fields: {', '.join(sorted(missing))}")
+            return ""
         
         # Generate tool ID if not provided
-        tool_id = tool_spec.get("id") or f"tool-{uuid.uuid4()}"
+        tool_id = tool_spec.get("id") or self._new_id("tool")
         
         # Add registration metadata
         tool_spec["id"] = tool_id
@@ -122,7 +174,8 @@ class MCPService:
         # Store tool
         self.tools[tool_id] = tool_spec
         
-        # Register with service registry if available
+        # Register with service registry if available; the registry only
+        # keeps the ID, get_tool returns the spec
         if self.registration_manager:
             self.registration_manager.register_component(
                 component_id=f"mcp.tool.{tool_id}",
@@ -133,23 +186,36 @@ class MCPService:
                 capabilities=tool_spec.get("tags", []),
                 metadata={
                     "mcp_tool": True,
-                    "tool_spec": tool_spec
+                    "tool_id": tool_id
                 }
             )
         
-        # Publish tool registration event
-        await self.message_bus.publish(
+        # Publish tool registration event; subscribers fetch the spec with get_tool
+        await self._events.publish(
             'mcp.tools',
             {
                 'type': 'tool_registered',
-                'tool_id': tool_id,
-                'tool_spec': tool_spec
+                'tool_id': tool_id
             }
         )
         
         logger.info(f"Tool registered: {tool_spec['name']} ({tool_id})")
         return tool_id
     
+    async def register_tools(self, tool_specs: List[Dict[str, Any]]) -> List[str]:
+        """
+        Register several tools with the MCP service.
+        
+        The registration events are published together in batches.
+        
+        Args:
+            tool_specs: Tool specifications
+            
+        Returns:
+            Tool IDs in the same order as the input, with "" for invalid specifications
+        """
+        return [await self.register_tool(tool_spec) for tool_spec in tool_specs]
+    
     async def unregister_tool(self, tool_id: str) -> bool:
         """
         Unregister a tool from the MCP service.
@@ -175,7 +241,7 @@ class MCPService:
             )
         
         # Publish tool unregistration event
-        await self.message_bus.publish(
+        await self._events.publish(
             'mcp.tools',
             {
                 'type': 'tool_unregistered',
@@ -183,6 +249,9 @@ class MCPService:
             }
         )
         
+        # Subscribers see the unregistration before the caller continues
+        await self._events.flush()
+        
         logger.info(f"Tool unregistered: {tool_id}")
         return True
     
@@ -197,23 +266,30 @@ class MCPService:
             Processor ID
         """
         # Validate processor specification
-        required_fields = ["name", "description", "capabilities"]
-        for field in required_fields:
-            if field not in processor_spec:
-                logger.error(f"Processor specification missing required field: {field}")
-                return ""
+        missing = _PROCESSOR_REQUIRED_FIELDS.difference(processor_spec)
+        if missing:
+            logger.error(f"Processor specification missing required fields: {', '.join(sorted(missing))}")
+            return ""
         
         # Generate processor ID if not provided
-        processor_id = processor_spec.get("id") or f"processor-{uuid.uuid4()}"
+        processor_id = processor_spec.get("id") or self._new_id("processor")
         
         # Add registration metadata
         processor_spec["id"] = processor_id
         processor_spec["registered_at"] = time.time()
         
-        # Store processor
+        # Store processor, replacing the indexed capabilities of an earlier registration
+        self._unindex_processor(processor_id)
+        self._match_cache.clear()
         self.processors[processor_id] = processor_spec
         
-        # Register with service registry if available
+        capabilities = list(dict.fromkeys(processor_spec.get("capabilities", [])))
+        self._processor_capabilities[processor_id] = capabilities
+        for capability in capabilities:
+            self._capability_index.setdefault(capability, {})[processor_id] = None
+        
+        # Register with service registry if available; the registry only
+        # keeps the ID, get_processor returns the spec
         if self.registration_manager:
             self.registration_manager.register_component(
                 component_id=f"mcp.processor.{processor_id}",
@@ -224,23 +300,60 @@ class MCPService:
                 capabilities=processor_spec.get("capabilities", []),
                 metadata={
                     "mcp_processor": True,
-                    "processor_spec": processor_spec
+                    "processor_id": processor_id
                 }
             )
         
-        # Publish processor registration event
-        await self.message_bus.publish(
+        # Publish processor registration event; subscribers fetch the spec with get_processor
+        await self._events.publish(
             'mcp.processors',
             {
                 'type': 'processor_registered',
-                'processor_id': processor_id,
-                'processor_spec': processor_spec
+                'processor_id': processor_id
             }
         )
         
         logger.info(f"Processor registered: {processor_spec['name']} ({processor_id})")
         return processor_id
     
+    async def unregister_processor(self, processor_id: str) -> bool:
+        """
+        Unregister a processor from the MCP service.
+        
+        Args:
+            processor_id: Processor ID to unregister
+            
+        Returns:
+            True if unregistration successful
+        """
+        if processor_id not in self.processors:
+            logger.warning(f"Processor not found: {processor_id}")
+            return False
+            
+        # Remove processor
+        del self.processors[processor_id]
+        self._unindex_processor(processor_id)
+        self._match_cache.clear()
+        
+        # Unregister from service registry if available
+        if self.registration_manager:
+            self.registration_manager.unregister_component(
+                component_id=f"mcp.processor.{processor_id}",
+                token_str=""  # Token not used here
+            )
+        
+        # Publish processor unregistration event
+        await self._events.publish(
+            'mcp.processors',
+            {
+                'type': 'processor_unregistered',
+                'processor_id': processor_id
+            }
+        )
+        
+        logger.info(f"Processor unregistered: {processor_id}")
+        return True
+    
     async def create_context(
         self,
         data: Dict[str, Any],
@@ -250,6 +363,9 @@ class MCPService:
         """
         Create a new context.
         
+        The context keeps a reference to data, which later updates modify
+        in place.
+        
         Args:
             data: Context data
             source: Context source information
@@ -259,34 +375,50 @@ class MCPService:
             Context ID
         """
         # Generate context ID if not provided
-        context_id = context_id or f"ctx-{uuid.uuid4()}"
+        context_id = context_id or self._new_id("ctx")
         
         # Create context
+        now = time.time()
         context = {
             "id": context_id,
             "data": data,
             "source": source,
-            "created_at": time.time(),
-            "updated_at": time.time(),
-            "history": [
+            "created_at": now,
+            "updated_at": now,
+            "history": deque([
                 {
                     "operation": "created",
-                    "timestamp": time.time(),
+                    "timestamp": now,
                     "source": source
                 }
-            ]
+            ], maxlen=CONTEXT_HISTORY_SIZE)
         }
         
+        # Evict the least recently used context to make room
+        evicted_id = None
+        if context_id not in self.contexts and len(self.contexts) >= self.max_contexts:
+            evicted_id, _ = self.contexts.popitem(last=False)
+            
         # Store context
         self.contexts[context_id] = context
+        self.contexts.move_to_end(context_id)
         
-        # Publish context creation event
-        await self.message_bus.publish(
+        if evicted_id is not None:
+            await self._events.publish(
+                'mcp.contexts',
+                {
+                    'type': 'context_evicted',
+                    'context_id': evicted_id
+                }
+            )
+            logger.info(f"Context evicted: {evicted_id}")
+        
+        # Publish context creation event; subscribers fetch the context with get_context
+        await self._events.publish(
             'mcp.contexts',
             {
                 'type': 'context_created',
-                'context_id': context_id,
-                'context': context
+                'context_id': context_id
             }
         )
         
@@ -317,26 +449,29 @@ class MCPService:
             return False
             
         context = self.contexts[context_id]
+        self.contexts.move_to_end(context_id)
         
         # Deep merge updates into context data
-        context["data"] = self._deep_merge(context["data"], updates)
-        context["updated_at"] = time.time()
+        self._deep_merge_inplace(context["data"], updates)
+        now = time.time()
+        context["updated_at"] = now
         
         # Add history entry
+        keys = list(updates)
         context["history"].append({
             "operation": operation,
-            "timestamp": time.time(),
+            "timestamp": now,
             "source": source,
-            "keys": list(updates.keys())
+            "keys": keys
         })
         
         # Publish context update event
-        await self.message_bus.publish(
+        await self._events.publish(
             'mcp.contexts',
             {
                 'type': 'context_updated',
                 'context_id': context_id,
-                'updates': updates,
+                'keys': keys,
                 'operation': operation
             }
         )
@@ -344,6 +479,30 @@ class MCPService:
         logger.info(f"Context updated: {context_id}")
         return True
     
+    async def update_contexts(self, updates: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Apply several context updates.
+        
+        Each update has the "context_id", "updates" and "source" keys and an
+        optional "operation". The update events are published together in
+        batches.
+        
+        Args:
+            updates: Context updates to apply, in order
+            
+        Returns:
+            Per-update success flags, in the same order as the input
+        """
+        return [
+            await self.update_context(
+                context_id=update["context_id"],
+                updates=update["updates"],
+                source=update["source"],
+                operation=update.get("operation", "update")
+            )
+            for update in updates
+        ]
+    
     async def process_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process an MCP message.
@@ -355,13 +514,13 @@ class MCPService:
             Processing result
         """
         # Validate message
-        required_fields = ["id", "version", "source", "content"]
-        for field in required_fields:
-            if field not in message:
-                logger.error(f"MCP message missing required field: {field}")
-                return {
-                    "error": f"Missing required field: {field}"
-                }
+        missing = _MESSAGE_REQUIRED_FIELDS.difference(message)
+        if missing:
+            missing_fields = ", ".join(sorted(missing))
+            logger.error(f"MCP message missing required fields: {missing_fields}")
+            return {
+                "error": f"Missing required fields: {missing_fields}"
+            }
         
         # Find appropriate processor
         processors = await self._find_processors_for_message(message)
@@ -372,9 +531,43 @@ class MCPService:
                 "error": "No suitable processor found for message"
             }
             
+        # Fan out to every matching processor only when the message asks for it
+        if len(processors) > 1 and message.get("processing", {}).get("fanout"):
+            results = await asyncio.gather(
+                *(self._dispatch_to(processor_id, message) for processor_id in processors),
+                return_exceptions=True
+            )
+            
+            responses = []
+            for processor_id, result in zip(processors, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Processor {processor_id} failed to process message {message['id']}: {result}")
+                    result = {"error": f"Processor {processor_id} failed: {result}"}
+                responses.append(result)
+            
+            return {
+                "id": f"response-{message['id']}",
+                "results": responses,
+                "processed_by": [
+                    response["processed_by"] for response in responses if "processed_by" in response
+                ]
+            }
+            
         # Select first processor (in a more sophisticated implementation,
         # we would select based on capabilities, load, etc.)
-        processor_id = processors[0]
+        return await self._dispatch_to(processors[0], message)
+    
+    async def _dispatch_to(self, processor_id: str, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send an MCP message to a processor.
+        
+        Args:
+            processor_id: ID of the processor
+            message: Validated MCP message
+            
+        Returns:
+            Processing result
+        """
         processor = self.processors[processor_id]
         
         # Check if processor has an endpoint
@@ -466,7 +659,7 @@ class MCPService:
         }
         
         # Publish tool execution event
-        await self.message_bus.publish(
+        await self._events.publish(
             'mcp.tools',
             {
                 'type': 'tool_executed',
@@ -479,7 +672,7 @@ class MCPService:
         logger.info(f"Tool executed: {tool_id}")
         return result
     
-    async def get_tool(self, tool_id: str) -> Optional[Dict[str, Any]]:
+    async def get_tool(self, tool_id: str) -> Optional[Mapping[str, Any]]:
         """
         Get information about a tool.
         
@@ -487,12 +680,25 @@ class MCPService:
             tool_id: Tool ID to retrieve
             
         Returns:
-            Tool information or None if not found
+            Read-only view of the tool information, or None if not found
         """
         tool = self.tools.get(tool_id)
-        return tool.copy() if tool else None
+        return MappingProxyType(tool) if tool else None
     
-    async def get_processor(self, processor_id: str) -> Optional[Dict[str, Any]]:
+    async def clone_tool(self, tool_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a copy of a tool's information that the caller may modify.
+        
+        Args:
+            tool_id: Tool ID to retrieve
+            
+        Returns:
+            Deep copy of the tool information, or None if not found
+        """
+        tool = self.tools.get(tool_id)
+        return copy.deepcopy(tool) if tool else None
+    
+    async def get_processor(self, processor_id: str) -> Optional[Mapping[str, Any]]:
         """
         Get information about a processor.
         
@@ -500,12 +706,12 @@ class MCPService:
             processor_id: Processor ID to retrieve
             
         Returns:
-            Processor information or None if not found
+            Read-only view of the processor information, or None if not found
         """
         processor = self.processors.get(processor_id)
-        return processor.copy() if processor else None
+        return MappingProxyType(processor) if processor else None
     
-    async def get_context(self, context_id: str) -> Optional[Dict[str, Any]]:
+    async def get_context(self, context_id: str) -> Optional[Mapping[str, Any]]:
         """
         Get a context.
         
@@ -513,10 +719,14 @@ class MCPService:
             context_id: Context ID to retrieve
             
         Returns:
-            Context or None if not found
+            Read-only view of the context, or None if not found
         """
         context = self.contexts.get(context_id)
-        return context.copy() if context else None
+        if not context:
+            return None
+            
+        self.contexts.move_to_end(context_id)
+        return MappingProxyType(context)
     
     async def _find_processors_for_message(self, message: Dict[str, Any]) -> List[str]:
         """
@@ -528,59 +738,100 @@ class MCPService:
         Returns:
             List of processor IDs
         """
-        matching_processors = []
+        # Processors must support every content type and requested capability
+        required = {
+            content_item.get("type")
+            for content_item in message.get("content", [])
+            if content_item.get("type")
+        }
+        required.update(message.get("processing", {}).get("capabilities_required", []))
+        required = frozenset(required)
         
-        # Get message content types
-        content_types = set()
-        for content_item in message.get("content", []):
-            content_type = content_item.get("type")
-            if content_type:
-                content_types.add(content_type)
-                
-        # Get requested capabilities
-        requested_capabilities = message.get("processing", {}).get("capabilities_required", [])
+        # Messages of the same shape get the same processors
+        matches = self._match_cache.get(required)
+        if matches is None:
+            matches = self._match_processors(required)
+            self._match_cache.set(required, matches)
         
-        # Find processors with matching capabilities
-        for processor_id, processor in self.processors.items():
-            capabilities = processor.get("capabilities", [])
-            
-            # Check if processor supports all required content types
-            supports_content_types = all(
-                content_type in capabilities for content_type in content_types
-            )
+        return list(matches)
+    
+    def _match_processors(self, required: frozenset) -> Tuple[str, ...]:
+        """
+        Find the processors that have all required capabilities.
+        
+        Args:
+            required: Required content types and capabilities
             
-            # Check if processor has all requested capabilities
-            has_capabilities = all(
-                capability in capabilities for capability in requested_capabilities
-            )
+        Returns:
+            Processor IDs, in registration order
+        """
+        if not required:
+            return tuple(self.processors)
+        
+        # Intersect the capability buckets, starting from the smallest
+        buckets = sorted(
+            (self._capability_index.get(capability, {}) for capability in required),
+            key=len
+        )
+        smallest, others = buckets[0], buckets[1:]
+        return tuple(
+            processor_id for processor_id in smallest
+            if all(processor_id in bucket for bucket in others)
+        )
+    
+    def _new_id(self, kind: str) -> str:
+        """
+        Generate an ID for a tool, processor or context.
+        
+        Args:
+            kind: ID prefix naming the kind of object
             
-            if supports_content_types and has_capabilities:
-                matching_processors.append(processor_id)
+        Returns:
+            New ID
+        """
+        return f"{kind}-{self._id_prefix}-{next(self._id_counter):x}"
+    
+    def _unindex_processor(self, processor_id: str) -> None:
+        """
+        Remove a processor from the capability index.
         
-        return matching_processors
+        Args:
+            processor_id: Processor ID to remove
+        """
+        for capability in self._processor_capabilities.pop(processor_id, ()):
+            processor_ids = self._capability_index.get(capability)
+            if processor_ids is not None:
+                processor_ids.pop(processor_id, None)
+                if not processor_ids:
+                    del self._capability_index[capability]
     
-    def _deep_merge(self, base: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
+    def _deep_merge_inplace(self, base: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Deep merge two dictionaries.
+        Deep merge updates into a dictionary, modifying it in place.
+        
+        Only the keys present in updates are visited. Nested dictionaries
+        taken from updates are copied, so later merges don't modify the
+        caller's updates.
         
         Args:
-            base: Base dictionary
+            base: Dictionary to update
             updates: Updates to apply
             
         Returns:
-            Merged dictionary
+            The updated base dictionary
         """
-        result = base.copy()
-        
         for key, value in updates.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                # Recursively merge nested dictionaries
-                result[key] = self._deep_merge(result[key], value)
+            if isinstance(value, dict):
+                current = base.get(key)
+                if not isinstance(current, dict):
+                    # Replace or add a copy of the nested dictionary
+                    current = base[key] = {}
+                self._deep_merge_inplace(current, value)
             else:
                 # Replace or add value
-                result[key] = value
+                base[key] = value
                 
-        return result
+        return base
     
     async def _handle_tool_message(self, message: Dict[str, Any]):
         """
@@ -589,26 +840,9 @@ class MCPService:
         Args:
             message: Tool message
         """
-        message_type = message.get('type')
-        
-        if message_type == 'register_tool':
-            # Register tool
-            tool_spec = message.get('tool_spec')
-            if tool_spec:
-                await self.register_tool(tool_spec)
-                
-        elif message_type == 'unregister_tool':
-            # Unregister tool
-            tool_id = message.get('tool_id')
-            if tool_id:
-                await self.unregister_tool(tool_id)
-                
-        elif message_type == 'execute_tool':
-            # Execute tool
-            tool_id = message.get('tool_id')
-            parameters = message.get('parameters')
-            if tool_id and parameters:
-                await self.execute_tool(tool_id, parameters, message.get('context'))
+        handler = self._tool_handlers.get(message.get('type'))
+        if handler:
+            await handler(message)
     
     async def _handle_context_message(self, message: Dict[str, Any]):
         """
@@ -617,31 +851,9 @@ class MCPService:
         Args:
             message: Context message
         """
-        message_type = message.get('type')
-        
-        if message_type == 'create_context':
-            # Create context
-            data = message.get('data')
-            source = message.get('source')
-            if data and source:
-                await self.create_context(
-                    data=data,
-                    source=source,
-                    context_id=message.get('context_id')
-                )
-                
-        elif message_type == 'update_context':
-            # Update context
-            context_id = message.get('context_id')
-            updates = message.get('updates')
-            source = message.get('source')
-            if context_id and updates and source:
-                await self.update_context(
-                    context_id=context_id,
-                    updates=updates,
-                    source=source,
-                    operation=message.get('operation', 'update')
-                )
+        handler = self._context_handlers.get(message.get('type'))
+        if handler:
+            await handler(message)
     
     async def _handle_processor_message(self, message: Dict[str, Any]):
         """
@@ -650,26 +862,77 @@ class MCPService:
         Args:
             message: Processor message
         """
-        message_type = message.get('type')
-        
-        if message_type == 'register_processor':
-            # Register processor
-            processor_spec = message.get('processor_spec')
-            if processor_spec:
-                await self.register_processor(processor_spec)
-                
-        elif message_type == 'process_message':
-            # Process message
-            mcp_message = message.get('message')
-            if mcp_message:
-                result = await self.process_message(mcp_message)
-                
-                # Publish processing result
-                await self.message_bus.publish(
-                    'mcp.processors',
-                    {
-                        'type': 'message_processed',
-                        'message_id': mcp_message.get('id'),
-                        'result': result
-                    }
-                )
\ No newline at end of file
+        handler = self._processor_handlers.get(message.get('type'))
+        if handler:
+            await handler(message)
+    
+    async def _on_register_tool(self, message: Dict[str, Any]):
+        """Handle a register_tool message."""
+        tool_spec = message.get('tool_spec')
+        if tool_spec:
+            await self.register_tool(tool_spec)
+    
+    async def _on_unregister_tool(self, message: Dict[str, Any]):
+        """Handle an unregister_tool message."""
+        tool_id = message.get('tool_id')
+        if tool_id:
+            await self.unregister_tool(tool_id)
+    
+    async def _on_execute_tool(self, message: Dict[str, Any]):
+        """Handle an execute_tool message."""
+        tool_id = message.get('tool_id')
+        parameters = message.get('parameters')
+        if tool_id and parameters:
+            await self.execute_tool(tool_id, parameters, message.get('context'))
+    
+    async def _on_create_context(self, message: Dict[str, Any]):
+        """Handle a create_context message."""
+        data = message.get('data')
+        source = message.get('source')
+        if data and source:
+            await self.create_context(
+                data=data,
+                source=source,
+                context_id=message.get('context_id')
+            )
+    
+    async def _on_update_context(self, message: Dict[str, Any]):
+        """Handle an update_context message."""
+        context_id = message.get('context_id')
+        updates = message.get('updates')
+        source = message.get('source')
+        if context_id and updates and source:
+            await self.update_context(
+                context_id=context_id,
+                updates=updates,
+                source=source,
+                operation=message.get('operation', 'update')
+            )
+    
+    async def _on_register_processor(self, message: Dict[str, Any]):
+        """Handle a register_processor message."""
+        processor_spec = message.get('processor_spec')
+        if processor_spec:
+            await self.register_processor(processor_spec)
+    
+    async def _on_unregister_processor(self, message: Dict[str, Any]):
+        """Handle an unregister_processor message."""
+        processor_id = message.get('processor_id')
+        if processor_id:
+            await self.unregister_processor(processor_id)
+    
+    async def _on_process_message(self, message: Dict[str, Any]):
+        """Handle a process_message message and publish the result."""
+        mcp_message = message.get('message')
+        if mcp_message:
+            result = await self.process_message(mcp_message)
+            
+            # Publish processing result
+            await self._events.publish(
+                'mcp.processors',
+                {
+                    'type': 'message_processed',
+                    'message_id': mcp_message.get('id'),
+                    'result': result
+                }
+            )
@@ -0,0 +1,165 @@
+"""
+Message Batcher - Batched delivery of outgoing A2A messages.
+
+This module provides a queue-based batcher that collects outgoing A2A
+messages and hands them to the A2A service in batches, amortizing the
+per-message delivery overhead across many requests.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Queued by stop() to make the worker flush its current batch and exit
+_STOP = object()
+
+
+class MessageBatcher:
+    """
+    Batches outgoing A2A messages for delivery.
+
+    Messages are enqueued by callers and flushed by a background worker
+    once either `batch_size` messages have accumulated or `flush_interval`
+    seconds have passed since the first message of the batch arrived.
+    """
+
+    def __init__(
+        self,
+        a2a_service: Any,
+        batch_size: int = 50,
+        flush_interval: float = 0.005
+    ):
+        """
+        Initialize the message batcher.
+
+        Args:
+            a2a_service: A2A service used to deliver message batches
+            batch_size: Maximum number of messages per batch
+            flush_interval: Maximum time in seconds to wait for a batch to fill
+        """
+        self.a2a_service = a2a_service
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background flush worker."""
+        if self._task is not None and not self._task.done():
+            return
+
+        self._task = asyncio.create_task(self.run())
+        logger.info("Message batcher started")
+
+    async def stop(self) -> None:
+        """Stop the background flush worker, delivering any queued messages."""
+        if self._task is None:
+            return
+
+        # The worker delivers everything queued before the sentinel, including
+        # the batch it is working on, then exits
+        self.queue.put_nowait(_STOP)
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        # Deliver messages enqueued while the worker was stopping
+        pending = []
+        while not self.queue.empty():
+            item = self.queue.get_nowait()
+            if item is not _STOP:
+                pending.append(item)
+        if pending:
+            await self._flush(pending)
+
+        logger.info("Message batcher stopped")
+
+    async def enqueue(self, message: Dict[str, Any]) -> bool:
+        """
+        Enqueue a message for batched delivery.
+
+        Args:
+            message: A2A message to send
+
+        Returns:
+            True if the message was sent successfully
+        """
+        # Without a running worker, deliver the message directly
+        if self._task is None or self._task.done():
+            return await self.a2a_service.send_message(message)
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((message, future))
+        return await future
+
+    async def run(self) -> None:
+        """Collect queued messages into batches and flush them until stopped."""
+        loop = asyncio.get_running_loop()
+        batch: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+
+        try:
+            while True:
+                item = await self.queue.get()
+                if item is _STOP:
+                    return
+
+                batch = [item]
+                deadline = loop.time() + self.flush_interval
+                stopping = False
+
+                while len(batch) < self.batch_size:
+                    try:
+                        item = self.queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        timeout = deadline - loop.time()
+                        if timeout <= 0:
+                            break
+
+                        try:
+                            item = await asyncio.wait_for(self.queue.get(), timeout)
+                        except asyncio.TimeoutError:
+                            break
+
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+
+                await self._flush(batch)
+                batch = []
+
+                if stopping:
+                    return
+        finally:
+            # Don't leave callers waiting on messages the worker dropped,
+            # e.g. when it was cancelled in the middle of a batch
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    async def _flush(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """
+        Deliver a batch of messages and resolve their futures.
+
+        Args:
+            batch: List of (message, future) pairs
+        """
+        messages = [message for message, _ in batch]
+
+        try:
+            results = await self.a2a_service.send_messages_batch(messages)
+        except Exception as e:
+            logger.error(f"Error sending message batch: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
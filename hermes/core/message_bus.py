@@ -6,15 +6,32 @@ and subscribing to events across Tekton components.
 """
 
 import logging
-import json
 import asyncio
 import time
-from typing import Dict, List, Any, Optional, Union, Callable, Set
+from typing import Dict, List, Any, Optional, Union, Callable, Collection, Set, Tuple
+
+import orjson
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
 
+def encode_payload(message: Any) -> bytes:
+    """
+    Serialize a message payload to JSON.
+    
+    Args:
+        message: Message payload
+        
+    Returns:
+        JSON-encoded payload
+        
+    Raises:
+        TypeError: If the payload cannot be serialized
+    """
+    return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+
+
 class MessageBus:
     """
     Main interface for inter-component messaging.
@@ -65,7 +82,8 @@ class MessageBus:
     def publish(self, 
                topic: str, 
                message: Any,
-               headers: Optional[Dict[str, Any]] = None) -> bool:
+               headers: Optional[Dict[str, Any]] = None,
+               encoded: Optional[bytes] = None) -> bool:
         """
         Publish a message to a topic.
         
@@ -73,6 +91,8 @@ class MessageBus:
             topic: Topic to publish to
             message: Message to publish (will be serialized)
             headers: Optional message headers
+            encoded: The message already serialized with encode_payload, so
+                it is not serialized again
             
         Returns:
             True if publication successful
@@ -87,12 +107,13 @@ class MessageBus:
             "payload": message
         }
         
-        # Serialize to JSON
-        try:
-            message_json = json.dumps(envelope)
-        except TypeError:
-            logger.error(f"Cannot serialize message for topic {topic}")
-            return False
+        # Check that the payload can be serialized
+        if encoded is None:
+            try:
+                encode_payload(message)
+            except TypeError:
+                logger.error(f"Cannot serialize message for topic {topic}")
+                return False
         
         # TODO: Implement actual message publication
         logger.info(f"Publishing message to topic {topic}")
@@ -185,6 +206,34 @@ class MessageBus:
                         except Exception as e:
                             logger.error(f"Error in wildcard subscriber callback for topic {topic}: {e}")
     
+    def has_subscribers(self, topic: str, exclude: Collection[Callable] = ()) -> bool:
+        """
+        Check whether a message published to a topic would reach any subscriber.
+        
+        Publishers can use this to skip building and publishing notifications
+        nobody listens to.
+        
+        Args:
+            topic: Topic to check
+            exclude: Callbacks that don't count as subscribers, such as the
+                publisher's own handlers for the topic
+            
+        Returns:
+            True if the topic has exact or wildcard subscribers
+        """
+        callbacks = self.subscriptions.get(topic)
+        if callbacks and (not exclude or not callbacks.issubset(exclude)):
+            return True
+        
+        for subscription_topic, callbacks in self.subscriptions.items():
+            if callbacks and "*" in subscription_topic:
+                pattern = subscription_topic.replace("*", "")
+                if (topic.startswith(pattern) or topic.endswith(pattern)) and \
+                        (not exclude or not callbacks.issubset(exclude)):
+                    return True
+        
+        return False
+    
     def get_history(self, 
                    topic: str, 
                    limit: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -261,7 +310,8 @@ class MessageBus:
     async def publish_async(self, 
                     topic: str, 
                     message: Any,
-                    headers: Optional[Dict[str, Any]] = None) -> bool:
+                    headers: Optional[Dict[str, Any]] = None,
+                    encoded: Optional[bytes] = None) -> bool:
         """
         Publish a message to a topic (async version).
         
@@ -269,6 +319,8 @@ class MessageBus:
             topic: Topic to publish to
             message: Message to publish (will be serialized)
             headers: Optional message headers
+            encoded: The message already serialized with encode_payload, so
+                it is not serialized again
             
         Returns:
             True if publication successful
@@ -283,12 +335,13 @@ class MessageBus:
             "payload": message
         }
         
-        # Serialize to JSON
-        try:
-            message_json = json.dumps(envelope)
-        except TypeError:
-            logger.error(f"Cannot serialize message for topic {topic}")
-            return False
+        # Check that the payload can be serialized
+        if encoded is None:
+            try:
+                encode_payload(message)
+            except TypeError:
+                logger.error(f"Cannot serialize message for topic {topic}")
+                return False
         
         # TODO: Implement actual message publication
         logger.info(f"Publishing message to topic {topic} (async)")
@@ -309,6 +362,52 @@ class MessageBus:
         
         return True
         
+    async def publish_many_async(self,
+                         messages: List[Tuple[str, Any]],
+                         headers: Optional[Dict[str, Any]] = None) -> List[bool]:
+        """
+        Publish several messages at once (async version).
+        
+        The messages are published concurrently, so slow subscribers of one
+        topic do not hold up delivery to the others. A message published to
+        several topics is serialized only once.
+        
+        Args:
+            messages: List of (topic, message) pairs
+            headers: Optional headers added to every message
+            
+        Returns:
+            List of per-message success flags, in the same order as the input
+        """
+        encoded = self._encode_payloads(messages)
+        return list(await asyncio.gather(*[
+            self.publish_async(topic, message, dict(headers) if headers else None, encoded[i])
+            for i, (topic, message) in enumerate(messages)
+        ]))
+    
+    def _encode_payloads(self, messages: List[Tuple[str, Any]]) -> List[Optional[bytes]]:
+        """
+        Serialize the payloads of several messages, once per distinct payload.
+        
+        Args:
+            messages: List of (topic, message) pairs
+            
+        Returns:
+            Encoded payloads in the same order as the input, with None for
+            payloads that cannot be serialized
+        """
+        by_id: Dict[int, Optional[bytes]] = {}
+        encoded = []
+        for _, message in messages:
+            key = id(message)
+            if key not in by_id:
+                try:
+                    by_id[key] = encode_payload(message)
+                except TypeError:
+                    by_id[key] = None
+            encoded.append(by_id[key])
+        return encoded
+        
     async def _deliver_to_subscribers_async(self, topic: str, message: Dict[str, Any]) -> None:
         """
         Deliver a message to all subscribers of a topic (async version).
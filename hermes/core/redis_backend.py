@@ -0,0 +1,578 @@
+"""
+Redis Backend - Shared registry and message bus state for Hermes workers.
+
+This module provides Redis-backed variants of the service registry and the
+message bus. Several Hermes worker processes configured with the same Redis
+server share service registrations and receive each other's messages, while
+reads and local delivery keep using the in-process structures.
+"""
+
+import uuid
+import asyncio
+import logging
+from typing import Dict, List, Any, Optional, Callable, Collection, Coroutine, Set, Tuple
+
+import orjson
+import redis.asyncio as redis
+
+from hermes.core.service_discovery import ServiceRegistry
+from hermes.core.message_bus import MessageBus, encode_payload
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Redis keys and channels
+REGISTRY_KEY = "hermes:services"
+REGISTRY_CHANNEL = "hermes:registry"
+BUS_CHANNEL_PREFIX = "hermes:bus:"
+
+# Registration control topics are handled by the worker that receives them.
+# Every worker's RegistrationManager subscribes to them, so relaying them
+# would register a component, and issue a token, once per worker. The
+# resulting registry changes are shared through RedisServiceRegistry.
+LOCAL_TOPICS = frozenset((
+    "tekton.registration.request",
+    "tekton.registration.revoke",
+    "tekton.registration.heartbeat"
+))
+
+# Relayed messages at least this large are decoded in a worker thread, so
+# a large payload does not stall other tasks on the event loop
+OFFLOAD_DECODE_SIZE = 256 * 1024
+
+
+def create_connection_pool(url: str, max_connections: int = 64) -> redis.ConnectionPool:
+    """
+    Create the Redis connection pool shared by the Redis-backed components.
+
+    Args:
+        url: Redis URL (e.g. "redis://localhost:6379/0")
+        max_connections: Maximum number of pooled connections
+
+    Returns:
+        Redis connection pool
+    """
+    return redis.ConnectionPool.from_url(url, max_connections=max_connections)
+
+
+class _RedisSync:
+    """
+    Mixin handling the Redis client and background tasks of a component.
+
+    Writes originate from synchronous methods, possibly on worker threads,
+    so they are scheduled onto the event loop captured when connecting.
+    """
+
+    def _init_redis(self, connection_pool: redis.ConnectionPool) -> None:
+        """
+        Set up Redis state.
+
+        Args:
+            connection_pool: Shared Redis connection pool
+        """
+        self.client = redis.Redis(connection_pool=connection_pool)
+        self.instance_id = uuid.uuid4().hex
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pubsub = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self._pending: Set[asyncio.Future] = set()
+
+    def _schedule(self, coro: Coroutine) -> None:
+        """
+        Run a coroutine on the connected event loop without waiting for it.
+
+        Args:
+            coro: Coroutine to run
+        """
+        if self._loop is None or self._loop.is_closed():
+            # Not connected; the state is pushed to Redis on connect
+            coro.close()
+            return
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self._loop:
+            future = self._loop.create_task(coro)
+        else:
+            future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+
+    async def _start_listener(self, handler: Callable, channel: str, pattern: bool = False) -> None:
+        """
+        Subscribe to a Redis channel and feed its messages to a handler.
+
+        Args:
+            handler: Coroutine function called with (channel, data)
+            channel: Channel name or pattern
+            pattern: Whether channel is a pattern
+        """
+        self._loop = asyncio.get_running_loop()
+        self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+
+        if pattern:
+            await self._pubsub.psubscribe(channel)
+        else:
+            await self._pubsub.subscribe(channel)
+
+        self._listener_task = asyncio.create_task(self._listen(handler))
+
+    async def _listen(self, handler: Callable) -> None:
+        """
+        Dispatch Redis pub/sub messages until cancelled.
+
+        Args:
+            handler: Coroutine function called with (channel, data)
+        """
+        async for message in self._pubsub.listen():
+            try:
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                await handler(channel, await self._decode(message["data"]))
+            except Exception as e:
+                logger.error(f"Error handling Redis message: {e}")
+
+    async def _decode(self, data: Any) -> Any:
+        """
+        Decode a JSON pub/sub message.
+
+        Args:
+            data: Raw message data
+
+        Returns:
+            Decoded message
+        """
+        if len(data) < OFFLOAD_DECODE_SIZE:
+            return orjson.loads(data)
+        return await self._loop.run_in_executor(None, orjson.loads, data)
+
+    async def _stop_listener(self) -> None:
+        """Stop the listener and wait for scheduled writes to finish."""
+        if self._pending:
+            await asyncio.gather(
+                *[asyncio.wrap_future(future) for future in list(self._pending)],
+                return_exceptions=True
+            )
+
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+
+        self._loop = None
+
+
+class RedisServiceRegistry(_RedisSync, ServiceRegistry):
+    """
+    Service registry whose registrations are shared through Redis.
+
+    Registrations are kept in a Redis hash and changes are announced on a
+    pub/sub channel, so every worker's local registry stays in sync. Health
+    check callables cannot be shared and remain local to the registering
+    worker.
+    """
+
+    def __init__(self,
+                connection_pool: redis.ConnectionPool,
+                check_interval: int = 30,
+                timeout: int = 10):
+        """
+        Initialize the Redis-backed service registry.
+
+        Args:
+            connection_pool: Shared Redis connection pool
+            check_interval: Interval in seconds between health checks
+            timeout: Timeout in seconds for health check responses
+        """
+        super().__init__(check_interval=check_interval, timeout=timeout)
+        self._init_redis(connection_pool)
+
+    async def connect_redis(self) -> None:
+        """Load shared registrations and start following registry changes."""
+        # Publish registrations made before connecting
+        for service_id in list(self.services):
+            await self._store(service_id)
+
+        for service_id, data in (await self.client.hgetall(REGISTRY_KEY)).items():
+            service_id = service_id.decode() if isinstance(service_id, bytes) else service_id
+            if service_id not in self.services:
+                self._apply(service_id, orjson.loads(data))
+
+        await self._start_listener(self._handle_registry_event, REGISTRY_CHANNEL)
+        logger.info(f"Service registry connected to Redis ({len(self.services)} services)")
+
+    async def close_redis(self) -> None:
+        """Stop following registry changes."""
+        await self._stop_listener()
+        logger.info("Service registry disconnected from Redis")
+
+    def register(self,
+                service_id: str,
+                name: str,
+                version: str,
+                endpoint: str,
+                capabilities: List[str],
+                health_check: Optional[Callable[[], bool]] = None,
+                metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Register a service locally and in Redis.
+
+        Args:
+            service_id: Unique identifier for the service
+            name: Human-readable name
+            version: Service version
+            endpoint: Service endpoint (URL or connection string)
+            capabilities: List of service capabilities
+            health_check: Optional function to check service health
+            metadata: Additional service metadata
+
+        Returns:
+            True if registration successful
+        """
+        success = super().register(
+            service_id=service_id,
+            name=name,
+            version=version,
+            endpoint=endpoint,
+            capabilities=capabilities,
+            health_check=health_check,
+            metadata=metadata
+        )
+
+        if success:
+            self._schedule(self._store(service_id))
+        return success
+
+    def unregister(self, service_id: str) -> bool:
+        """
+        Unregister a service locally and in Redis.
+
+        Args:
+            service_id: Service ID to unregister
+
+        Returns:
+            True if unregistration successful
+        """
+        success = super().unregister(service_id)
+
+        if success:
+            self._schedule(self._delete(service_id))
+        return success
+
+    async def _store(self, service_id: str) -> None:
+        """
+        Write a registration to Redis and announce it.
+
+        Args:
+            service_id: Service ID to store
+        """
+        service = self.services.get(service_id)
+        if service is None:
+            return
+
+        data = {key: value for key, value in service.items() if key != "health_check"}
+
+        try:
+            # Encode the registration once; the announcement embeds the same bytes
+            encoded = encode_payload(data)
+            event = orjson.dumps({
+                "origin": self.instance_id,
+                "action": "register",
+                "service_id": service_id
+            })
+
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.hset(REGISTRY_KEY, service_id, encoded)
+                pipe.publish(REGISTRY_CHANNEL, event[:-1] + b',"service":' + encoded + b'}')
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error storing service {service_id} in Redis: {e}")
+
+    async def _delete(self, service_id: str) -> None:
+        """
+        Remove a registration from Redis and announce it.
+
+        Args:
+            service_id: Service ID to remove
+        """
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.hdel(REGISTRY_KEY, service_id)
+                pipe.publish(REGISTRY_CHANNEL, orjson.dumps({
+                    "origin": self.instance_id,
+                    "action": "unregister",
+                    "service_id": service_id
+                }))
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error removing service {service_id} from Redis: {e}")
+
+    async def _handle_registry_event(self, channel: str, event: Dict[str, Any]) -> None:
+        """
+        Apply a registry change announced by another worker.
+
+        Args:
+            channel: Redis channel the event arrived on
+            event: Registry event
+        """
+        if event.get("origin") == self.instance_id:
+            return
+
+        service_id = event["service_id"]
+
+        if event.get("action") == "register":
+            self._apply(service_id, event["service"])
+        elif event.get("action") == "unregister":
+            self._remove(service_id)
+
+    def _apply(self, service_id: str, data: Dict[str, Any]) -> None:
+        """
+        Store a registration received from Redis in the local registry.
+
+        Args:
+            service_id: Service ID
+            data: Serialized service information
+        """
+        self._unindex(service_id)
+        self.services[service_id] = {**data, "health_check": None}
+        self.health.setdefault(service_id, None)
+        self._index(service_id)
+
+
+class RedisMessageBus(_RedisSync, MessageBus):
+    """
+    Message bus that also relays messages between workers through Redis.
+
+    Messages are delivered to local subscribers as before and published on a
+    Redis channel per topic; messages published by other workers are
+    delivered to the local subscribers of the same topic. Messages on
+    LOCAL_TOPICS are not relayed.
+    """
+
+    def __init__(self,
+                connection_pool: redis.ConnectionPool,
+                host: str = "localhost",
+                port: int = 5555,
+                config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the Redis-backed message bus.
+
+        Args:
+            connection_pool: Shared Redis connection pool
+            host: Hostname for the message bus
+            port: Port for the message bus
+            config: Additional configuration options
+        """
+        super().__init__(host=host, port=port, config=config)
+        self._init_redis(connection_pool)
+
+    async def connect_redis(self) -> None:
+        """Start receiving messages published by other workers."""
+        await self._start_listener(self._handle_remote_message, f"{BUS_CHANNEL_PREFIX}*", pattern=True)
+        logger.info("Message bus connected to Redis")
+
+    async def close_redis(self) -> None:
+        """Stop receiving messages published by other workers."""
+        await self._stop_listener()
+        logger.info("Message bus disconnected from Redis")
+
+    def has_subscribers(self, topic: str, exclude: Collection[Callable] = ()) -> bool:
+        """
+        Check whether a message published to a topic could reach any subscriber.
+
+        Subscribers of the other workers are not known locally, so every topic
+        counts as subscribed while messages are relayed through Redis.
+
+        Args:
+            topic: Topic to check
+            exclude: Local callbacks that don't count as subscribers
+
+        Returns:
+            True if the topic has local subscribers or messages are relayed
+        """
+        return self._loop is not None or super().has_subscribers(topic, exclude)
+
+    def publish(self,
+               topic: str,
+               message: Any,
+               headers: Optional[Dict[str, Any]] = None,
+               encoded: Optional[bytes] = None) -> bool:
+        """
+        Publish a message locally and to the other workers.
+
+        Args:
+            topic: Topic to publish to
+            message: Message to publish (will be serialized)
+            headers: Optional message headers
+            encoded: The message already serialized with encode_payload, so
+                it is not serialized again
+
+        Returns:
+            True if publication successful
+        """
+        headers = {**(headers or {}), "origin": self.instance_id}
+
+        if encoded is None:
+            try:
+                encoded = encode_payload(message)
+            except TypeError:
+                logger.error(f"Cannot serialize message for topic {topic}")
+                return False
+
+        if not super().publish(topic, message, headers, encoded):
+            return False
+
+        if topic not in LOCAL_TOPICS:
+            self._schedule(self._publish_remote(topic, headers, encoded))
+        return True
+
+    async def publish_async(self,
+                    topic: str,
+                    message: Any,
+                    headers: Optional[Dict[str, Any]] = None,
+                    encoded: Optional[bytes] = None) -> bool:
+        """
+        Publish a message locally and to the other workers (async version).
+
+        Args:
+            topic: Topic to publish to
+            message: Message to publish (will be serialized)
+            headers: Optional message headers
+            encoded: The message already serialized with encode_payload, so
+                it is not serialized again
+
+        Returns:
+            True if publication successful
+        """
+        headers = {**(headers or {}), "origin": self.instance_id}
+
+        if encoded is None:
+            try:
+                encoded = encode_payload(message)
+            except TypeError:
+                logger.error(f"Cannot serialize message for topic {topic}")
+                return False
+
+        if not await super().publish_async(topic, message, headers, encoded):
+            return False
+
+        if self._loop is not None and topic not in LOCAL_TOPICS:
+            await self._publish_remote(topic, headers, encoded)
+        return True
+
+    async def publish_many_async(self,
+                         messages: List[Tuple[str, Any]],
+                         headers: Optional[Dict[str, Any]] = None) -> List[bool]:
+        """
+        Publish several messages locally and to the other workers at once.
+        
+        The relayed messages are sent to Redis in a single pipeline, and a
+        message published to several topics is serialized only once.
+        
+        Args:
+            messages: List of (topic, message) pairs
+            headers: Optional headers added to every message
+            
+        Returns:
+            List of per-message success flags, in the same order as the input
+        """
+        message_headers = [{**(headers or {}), "origin": self.instance_id} for _ in messages]
+        encoded = self._encode_payloads(messages)
+        
+        publish_local = super().publish_async
+        results = list(await asyncio.gather(*[
+            publish_local(topic, message, message_headers[i], encoded[i])
+            for i, (topic, message) in enumerate(messages)
+        ]))
+        
+        if self._loop is not None:
+            await self._publish_remote_many([
+                (topic, message_headers[i], encoded[i])
+                for i, (topic, _) in enumerate(messages)
+                if results[i] and topic not in LOCAL_TOPICS
+            ])
+        return results
+    
+    @staticmethod
+    def _encode_envelope(headers: Dict[str, Any], payload: bytes) -> bytes:
+        """
+        Build a serialized message envelope around an encoded payload.
+        
+        Args:
+            headers: Message headers
+            payload: Payload serialized with encode_payload
+            
+        Returns:
+            JSON-encoded envelope
+        """
+        return b'{"headers":' + orjson.dumps(headers) + b',"payload":' + payload + b'}'
+    
+    async def _publish_remote_many(self, messages: List[Tuple[str, Dict[str, Any], bytes]]) -> None:
+        """
+        Publish messages on their topics' Redis channels in one pipeline.
+        
+        Args:
+            messages: List of (topic, headers, encoded payload) tuples
+        """
+        if not messages:
+            return
+        
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for topic, headers, payload in messages:
+                    pipe.publish(f"{BUS_CHANNEL_PREFIX}{topic}", self._encode_envelope(headers, payload))
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error relaying {len(messages)} messages to Redis: {e}")
+    
+    async def _publish_remote(self, topic: str, headers: Dict[str, Any], payload: bytes) -> None:
+        """
+        Publish a message on the topic's Redis channel.
+
+        Args:
+            topic: Topic the message was published to
+            headers: Message headers
+            payload: Payload serialized with encode_payload
+        """
+        try:
+            await self.client.publish(f"{BUS_CHANNEL_PREFIX}{topic}", self._encode_envelope(headers, payload))
+        except Exception as e:
+            logger.error(f"Error relaying message for topic {topic} to Redis: {e}")
+
+    async def _handle_remote_message(self, channel: str, envelope: Dict[str, Any]) -> None:
+        """
+        Deliver a message published by another worker to local subscribers.
+
+        Args:
+            channel: Redis channel the message arrived on
+            envelope: Message envelope
+        """
+        if envelope.get("headers", {}).get("origin") == self.instance_id:
+            return
+
+        topic = channel[len(BUS_CHANNEL_PREFIX):]
+        if topic in LOCAL_TOPICS:
+            # Registration control messages are only handled where published
+            return
+
+        # Store in history if enabled
+        if self.history_size > 0:
+            history = self.history.setdefault(topic, [])
+            history.append(envelope)
+            if len(history) > self.history_size:
+                self.history[topic] = history[-self.history_size:]
+
+        await self._deliver_to_subscribers_async(topic, envelope)
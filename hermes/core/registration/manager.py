@@ -12,6 +12,7 @@ from typing import Dict, List, Any, Optional, Callable, Tuple
 from hermes.core.service_discovery import ServiceRegistry
 from hermes.core.message_bus import MessageBus
 from hermes.core.registration.tokens import RegistrationToken
+from hermes.utils.cache import TTLCache
 from hermes.core.registration.handlers import (
     handle_registration_request,
     handle_revocation_request,
@@ -51,6 +52,10 @@ class RegistrationManager:
         # Dictionary to store active tokens
         self.active_tokens: Dict[str, Dict[str, Any]] = {}
         
+        # Payloads of recently verified tokens, keyed by (component_id, token_str),
+        # so repeated heartbeats skip the signature check until the token expires
+        self._token_cache = TTLCache(maxsize=10000, ttl=token_expiration)
+        
         # Set up message bus subscriptions for registration events
         self._setup_subscriptions()
         
@@ -103,39 +108,20 @@ class RegistrationManager:
         Returns:
             Tuple of (success, token_string)
         """
-        # Register with service registry
-        registry_success = self.service_registry.register(
-            service_id=component_id,
+        token_str = self._register_and_issue_token(
+            component_id=component_id,
             name=name,
             version=version,
+            component_type=component_type,
             endpoint=endpoint,
             capabilities=capabilities,
             health_check=health_check,
-            metadata={
-                "type": component_type,
-                **(metadata or {})
-            }
+            metadata=metadata
         )
         
-        if not registry_success:
-            logger.error(f"Failed to register component {component_id} with service registry")
+        if token_str is None:
             return False, None
         
-        # Generate registration token
-        token = RegistrationToken(
-            component_id=component_id,
-            secret_key=self.secret_key,
-            expiration=self.token_expiration
-        )
-        token_str = token.generate()
-        
-        # Store token information
-        self.active_tokens[token.token_id] = {
-            "component_id": component_id,
-            "issued_at": token.issued_at,
-            "expires_at": token.expires_at
-        }
-        
         # Publish registration event - we'll use the non-async version
         # since this method is not async
         try:
@@ -161,6 +147,163 @@ class RegistrationManager:
         logger.info(f"Component {component_id} ({name}) registered successfully")
         return True, token_str
     
+    def register_components_bulk(self,
+                               components: List[Dict[str, Any]]) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Register several components with the Tekton ecosystem at once.
+        
+        Each component is registered as with register_component, but a single
+        aggregated registration event is published for the whole batch.
+        
+        Args:
+            components: List of component specifications, each holding the
+                keyword arguments accepted by register_component
+            
+        Returns:
+            List of (success, token_string) tuples in the order given
+        """
+        results: List[Tuple[bool, Optional[str]]] = []
+        registered: List[Dict[str, Any]] = []
+        registered_at = time.time()
+        
+        for spec in components:
+            token_str = self._register_and_issue_token(
+                component_id=spec["component_id"],
+                name=spec["name"],
+                version=spec["version"],
+                component_type=spec["component_type"],
+                endpoint=spec["endpoint"],
+                capabilities=spec["capabilities"],
+                health_check=spec.get("health_check"),
+                metadata=spec.get("metadata")
+            )
+            
+            if token_str is None:
+                results.append((False, None))
+                continue
+            
+            results.append((True, token_str))
+            registered.append({
+                "component_id": spec["component_id"],
+                "name": spec["name"],
+                "type": spec["component_type"],
+                "version": spec["version"],
+                "capabilities": spec["capabilities"],
+                "registered_at": registered_at
+            })
+        
+        if not registered:
+            return results
+        
+        # Publish one registration event for the whole batch
+        try:
+            self.message_bus.publish(
+                topic="tekton.registration.completed",
+                message={
+                    "components": registered,
+                    "registered_at": registered_at
+                },
+                headers={
+                    "event_type": "component_registration_bulk",
+                    "component_ids": [c["component_id"] for c in registered]
+                }
+            )
+        except Exception as e:
+            logger.error(f"Error publishing bulk registration event: {e}")
+            # Continue execution even if publishing fails
+        
+        logger.info(f"Registered {len(registered)} of {len(components)} components in bulk")
+        return results
+    
+    def _register_and_issue_token(self,
+                                component_id: str,
+                                name: str,
+                                version: str,
+                                component_type: str,
+                                endpoint: str,
+                                capabilities: List[str],
+                                health_check: Optional[Callable[[], bool]] = None,
+                                metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Add a component to the service registry and issue its token.
+        
+        Args:
+            component_id: Unique identifier for the component
+            name: Human-readable name
+            version: Component version
+            component_type: Type of component
+            endpoint: Component endpoint (URL or connection string)
+            capabilities: List of component capabilities
+            health_check: Optional function to check component health
+            metadata: Additional component metadata
+            
+        Returns:
+            Token string, or None if the registry rejected the component
+        """
+        # Register with service registry
+        registry_success = self.service_registry.register(
+            service_id=component_id,
+            name=name,
+            version=version,
+            endpoint=endpoint,
+            capabilities=capabilities,
+            health_check=health_check,
+            metadata={
+                "type": component_type,
+                **(metadata or {})
+            }
+        )
+        
+        if not registry_success:
+            logger.error(f"Failed to register component {component_id} with service registry")
+            return None
+        
+        # Generate registration token
+        token = RegistrationToken(
+            component_id=component_id,
+            secret_key=self.secret_key,
+            expiration=self.token_expiration
+        )
+        token_str = token.generate()
+        
+        # Store token information
+        self.active_tokens[token.token_id] = {
+            "component_id": component_id,
+            "issued_at": token.issued_at,
+            "expires_at": token.expires_at
+        }
+        
+        return token_str
+    
+    def _verify_token(self, component_id: str, token_str: str) -> Optional[Dict[str, Any]]:
+        """
+        Verify that a token is valid and was issued to a component.
+        
+        Verified tokens are cached until they expire, so repeated checks of
+        the same token are a dictionary lookup instead of an HMAC computation.
+        
+        Args:
+            component_id: Component ID the token must belong to
+            token_str: Registration token
+            
+        Returns:
+            Token payload if valid, None otherwise
+        """
+        key = (component_id, token_str)
+        token_payload = self._token_cache.get(key)
+        if token_payload is not None:
+            return token_payload
+        
+        token_payload = RegistrationToken.validate(token_str, self.secret_key)
+        if not token_payload or token_payload["component_id"] != component_id:
+            return None
+        
+        ttl = token_payload["exp"] - time.time()
+        if ttl > 0:
+            self._token_cache.set(key, token_payload, ttl=ttl)
+        
+        return token_payload
+    
     def unregister_component(self, 
                            component_id: str,
                            token_str: str) -> bool:
@@ -175,8 +318,8 @@ class RegistrationManager:
             True if unregistration successful
         """
         # Validate token
-        token_payload = RegistrationToken.validate(token_str, self.secret_key)
-        if not token_payload or token_payload["component_id"] != component_id:
+        token_payload = self._verify_token(component_id, token_str)
+        if not token_payload:
             logger.warning(f"Invalid token for component {component_id}")
             return False
         
@@ -191,6 +334,7 @@ class RegistrationManager:
         token_id = token_payload["token_id"]
         if token_id in self.active_tokens:
             del self.active_tokens[token_id]
+        self._token_cache.pop((component_id, token_str))
         
         # Publish unregistration event
         self.message_bus.publish(
@@ -222,8 +366,8 @@ class RegistrationManager:
             True if component is validly registered
         """
         # Validate token
-        token_payload = RegistrationToken.validate(token_str, self.secret_key)
-        if not token_payload or token_payload["component_id"] != component_id:
+        token_payload = self._verify_token(component_id, token_str)
+        if not token_payload:
             logger.warning(f"Invalid token for component {component_id}")
             return False
         
@@ -252,8 +396,8 @@ class RegistrationManager:
             True if heartbeat was processed successfully
         """
         # Validate token
-        token_payload = RegistrationToken.validate(token_str, self.secret_key)
-        if not token_payload or token_payload["component_id"] != component_id:
+        token_payload = self._verify_token(component_id, token_str)
+        if not token_payload:
             logger.warning(f"Invalid token for component {component_id} heartbeat")
             return False
         
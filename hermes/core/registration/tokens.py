@@ -102,7 +102,9 @@ class RegistrationToken:
                 hashlib.sha256
             ).hexdigest()
             
-            if signature != expected_signature:
+            if not hmac.compare_digest(
+                str(signature).encode(), expected_signature.encode()
+            ):
                 logger.warning("Invalid token signature")
                 return None
             
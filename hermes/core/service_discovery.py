@@ -7,7 +7,7 @@ for Tekton components.
 
 import logging
 import time
-from typing import Dict, List, Any, Optional, Set, Callable
+from typing import Dict, List, Any, Optional, Set, Callable, Iterator, Tuple
 import threading
 import asyncio
 
@@ -42,6 +42,11 @@ class ServiceRegistry:
         # Dictionary to store last health check results
         self.health: Dict[str, bool] = {}
         
+        # Secondary indexes used by query()
+        self._by_capability: Dict[str, Set[str]] = {}
+        self._by_type: Dict[str, Set[str]] = {}
+        self._healthy: Set[str] = set()
+        
         # Health check thread
         self.health_check_thread = None
         self.running = False
@@ -84,6 +89,7 @@ class ServiceRegistry:
         """
         if service_id in self.services:
             logger.warning(f"Service {service_id} already registered, updating registration")
+            self._unindex(service_id)
         
         self.services[service_id] = {
             "name": name,
@@ -97,6 +103,7 @@ class ServiceRegistry:
         
         # Initialize health as unknown
         self.health[service_id] = None
+        self._index(service_id)
         
         logger.info(f"Registered service {service_id} ({name} v{version})")
         return True
@@ -112,11 +119,7 @@ class ServiceRegistry:
             True if unregistration successful
         """
         if service_id in self.services:
-            del self.services[service_id]
-            
-            if service_id in self.health:
-                del self.health[service_id]
-                
+            self._remove(service_id)
             logger.info(f"Unregistered service {service_id}")
             return True
         
@@ -145,17 +148,144 @@ class ServiceRegistry:
         Returns:
             List of services with the requested capability
         """
-        matching_services = []
+        return self.query(capability=capability)
+    
+    def query(self,
+             capability: Optional[str] = None,
+             component_type: Optional[str] = None,
+             healthy_only: bool = False) -> List[Dict[str, Any]]:
+        """
+        Find services matching all of the given criteria.
         
-        for service_id, service in self.services.items():
-            if capability in service["capabilities"]:
-                # Include service ID in the result
-                result = service.copy()
-                result["id"] = service_id
-                result["healthy"] = self.health.get(service_id, None)
-                matching_services.append(result)
+        Args:
+            capability: Capability the service must provide
+            component_type: Component type from the service metadata
+            healthy_only: Only include services whose last health check passed
+            
+        Returns:
+            List of matching services, each including its ID and health
+        """
+        return [
+            {**service, "id": service_id, "healthy": healthy}
+            for service_id, service, healthy in self.iter_services(
+                capability=capability,
+                component_type=component_type,
+                healthy_only=healthy_only
+            )
+        ]
+    
+    def iter_services(self,
+                     capability: Optional[str] = None,
+                     component_type: Optional[str] = None,
+                     healthy_only: bool = False) -> Iterator[Tuple[str, Dict[str, Any], Optional[bool]]]:
+        """
+        Iterate over the services matching all of the given criteria.
+        
+        Matching services are looked up in the registry's indexes, so the
+        cost depends on the number of candidate services rather than on
+        the size of the registry. The matching IDs are copied when iteration
+        starts, so the registry may change while the caller iterates;
+        services removed in the meantime are skipped. Service information is
+        not copied and must not be modified by the caller.
+        
+        Args:
+            capability: Capability the service must provide
+            component_type: Component type from the service metadata
+            healthy_only: Only include services whose last health check passed
+            
+        Yields:
+            Tuples of (service_id, service information, health)
+        """
+        candidates = []
+        if capability:
+            candidates.append(self._by_capability.get(capability, set()))
+        if component_type:
+            candidates.append(self._by_type.get(component_type, set()))
+        if healthy_only:
+            candidates.append(self._healthy)
+        
+        if candidates:
+            candidates.sort(key=len)
+            service_ids = candidates[0].intersection(*candidates[1:])
+        else:
+            service_ids = list(self.services)
+        
+        for service_id in service_ids:
+            service = self.services.get(service_id)
+            if service is not None:
+                yield service_id, service, self.health.get(service_id)
+    
+    def set_health(self, service_id: str, healthy: Optional[bool]) -> None:
+        """
+        Record the health of a service.
+        
+        Args:
+            service_id: Service ID
+            healthy: Health check result, or None if unknown
+        """
+        self.health[service_id] = healthy
         
-        return matching_services
+        if healthy:
+            self._healthy.add(service_id)
+        else:
+            self._healthy.discard(service_id)
+    
+    def _index(self, service_id: str) -> None:
+        """
+        Add a service to the secondary indexes.
+        
+        Args:
+            service_id: Service ID to index
+        """
+        service = self.services[service_id]
+        
+        for capability in service.get("capabilities") or []:
+            self._by_capability.setdefault(capability, set()).add(service_id)
+        
+        component_type = (service.get("metadata") or {}).get("type")
+        if component_type is not None:
+            self._by_type.setdefault(component_type, set()).add(service_id)
+        
+        if self.health.get(service_id):
+            self._healthy.add(service_id)
+    
+    def _unindex(self, service_id: str) -> None:
+        """
+        Remove a service from the secondary indexes.
+        
+        Args:
+            service_id: Service ID to remove
+        """
+        service = self.services.get(service_id)
+        if service is None:
+            return
+        
+        for capability in service.get("capabilities") or []:
+            service_ids = self._by_capability.get(capability)
+            if service_ids is not None:
+                service_ids.discard(service_id)
+                if not service_ids:
+                    del self._by_capability[capability]
+        
+        component_type = (service.get("metadata") or {}).get("type")
+        service_ids = self._by_type.get(component_type)
+        if service_ids is not None:
+            service_ids.discard(service_id)
+            if not service_ids:
+                del self._by_type[component_type]
+        
+        self._healthy.discard(service_id)
+    
+    def _remove(self, service_id: str) -> None:
+        """
+        Remove a service and its health information from the registry.
+        
+        Args:
+            service_id: Service ID to remove
+        """
+        self._unindex(service_id)
+        self.services.pop(service_id, None)
+        self.health.pop(service_id, None)
     
     def get_all_services(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -181,21 +311,21 @@ class ServiceRegistry:
         the health of all registered services.
         """
         while self.running:
-            for service_id, service in self.services.items():
+            for service_id, service in list(self.services.items()):
                 try:
                     # Check if service has a health check function
                     health_check = service.get("health_check")
                     if health_check and callable(health_check):
                         # Call the health check function
                         healthy = health_check()
-                        self.health[service_id] = healthy
+                        self.set_health(service_id, healthy)
                         
                         if not healthy:
                             logger.warning(f"Service {service_id} is unhealthy")
                     
                 except Exception as e:
                     logger.error(f"Error checking health of service {service_id}: {e}")
-                    self.health[service_id] = False
+                    self.set_health(service_id, False)
             
             # Sleep until next check interval
             time.sleep(self.check_interval)
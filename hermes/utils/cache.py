@@ -0,0 +1,97 @@
+"""
+Cache utilities for Hermes.
+
+This module provides small in-memory caches used to keep frequently read,
+slowly changing data off the hot path.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+# Sentinel for distinguishing missing entries from cached None values
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded in-memory cache whose entries expire after a time-to-live.
+
+    Expired entries are dropped lazily when they are read. When the cache
+    is full, the least recently inserted entry is evicted.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 10.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+            ttl: Default time-to-live in seconds for new entries
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value to return if the key is missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Optional time-to-live override in seconds
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+
+        self._entries.pop(key, None)
+        self._entries[key] = (expires_at, value)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove a value from the cache.
+
+        Args:
+            key: Cache key
+            default: Value to return if the key is missing
+
+        Returns:
+            Removed value or default
+        """
+        entry = self._entries.pop(key, None)
+        return entry[1] if entry is not None else default
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._entries)
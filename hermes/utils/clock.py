@@ -0,0 +1,40 @@
+"""
+Coarse clock for Hermes.
+
+This module provides a wall-clock timestamp that is refreshed by a
+background task, so request handlers can stamp responses without reading
+the system clock on every call.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+# Cached wall-clock time, or None while the clock task is not running
+_now: Optional[float] = None
+
+
+def now() -> float:
+    """
+    Get the current wall-clock time, to within the clock interval.
+    
+    Returns:
+        Seconds since the epoch; exact time.time() while the clock is not running
+    """
+    return _now if _now is not None else time.time()
+
+
+async def run_clock(interval: float = 0.05) -> None:
+    """
+    Refresh the cached time until cancelled.
+    
+    Args:
+        interval: Seconds between refreshes
+    """
+    global _now
+    try:
+        while True:
+            _now = time.time()
+            await asyncio.sleep(interval)
+    finally:
+        _now = None
@@ -0,0 +1,22 @@
+"""
+ID utilities for Hermes.
+
+This module provides generators for identifiers assigned to messages
+that arrive without one.
+"""
+
+import itertools
+import time
+
+# Process-wide counter that keeps IDs unique within the same nanosecond
+_MSG_COUNTER = itertools.count()
+
+
+def new_message_id() -> str:
+    """
+    Generate a unique, arrival-ordered message ID.
+
+    Returns:
+        Message ID of the form "msg-<time_ns>-<counter>"
+    """
+    return f"msg-{time.time_ns()}-{next(_MSG_COUNTER)}"
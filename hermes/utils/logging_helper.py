@@ -7,7 +7,10 @@ easily integrate with the Centralized Logging System.
 
 import os
 import sys
+import queue
+import atexit
 import logging
+import logging.handlers
 import time
 import traceback
 from typing import Dict, Any, Optional, Union, List, Callable
@@ -205,4 +208,44 @@ def create_correlation_context() -> str:
         Correlation ID string
     """
     import uuid
-    return str(uuid.uuid4())
\ No newline at end of file
+    return str(uuid.uuid4())
+
+
+def setup_queue_logging(
+    level: int = logging.INFO,
+    fmt: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+) -> logging.handlers.QueueListener:
+    """
+    Configure stdlib logging to write through a background thread.
+    
+    The root logger gets a QueueHandler, so logging calls only enqueue the
+    record; a QueueListener thread formats it and writes it to stderr.
+    This keeps console I/O off the event loop.
+    
+    Args:
+        level: Root logger level
+        fmt: Log record format
+        
+    Returns:
+        The running QueueListener (stopped automatically at exit)
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(fmt))
+    
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    
+    # The listener's handler applies the real format; the queue handler
+    # only needs to merge the message arguments
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    logging.basicConfig(level=level, handlers=[queue_handler], force=True)
+    
+    listener.start()
+    atexit.register(listener.stop)
+    
+    return listener
@@ -0,0 +1,111 @@
+"""
+Semantic cache for Hermes.
+
+This module provides a bounded cache that returns values stored for
+similar, rather than identical, inputs, using the cosine similarity of
+their embeddings.
+"""
+
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    Bounded cache of values keyed by embedding vectors.
+
+    A lookup returns the value stored for the most similar vector, if its
+    cosine similarity reaches the threshold. When the cache is full, the
+    oldest entry is overwritten.
+    """
+
+    def __init__(self, maxsize: int = 4096, threshold: float = 0.92):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+            threshold: Minimum cosine similarity for a lookup to match
+        """
+        self.maxsize = maxsize
+        self.threshold = threshold
+
+        # Unit-length vectors, allocated once the dimension is known
+        self._vectors: Optional[np.ndarray] = None
+        self._values: List[Any] = [None] * maxsize
+        self._size = 0
+        self._next = 0
+
+    def get(self, vector: Sequence[float], default: Any = None) -> Any:
+        """
+        Get the value stored for the most similar vector.
+
+        Args:
+            vector: Embedding of the input to look up
+            default: Value to return if no stored vector is similar enough
+
+        Returns:
+            Cached value or default
+        """
+        query = self._normalize(vector)
+        if query is None or self._size == 0 or query.shape[0] != self._vectors.shape[1]:
+            return default
+
+        scores = self._vectors[:self._size] @ query
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return default
+
+        return self._values[best]
+
+    def set(self, vector: Sequence[float], value: Any) -> None:
+        """
+        Store a value for a vector.
+
+        Args:
+            vector: Embedding of the input
+            value: Value to store
+        """
+        normalized = self._normalize(vector)
+        if normalized is None:
+            return
+
+        if self._vectors is None or normalized.shape[0] != self._vectors.shape[1]:
+            # First entry, or the embedding model changed
+            self._vectors = np.zeros((self.maxsize, normalized.shape[0]), dtype=np.float32)
+            self._values = [None] * self.maxsize
+            self._size = 0
+            self._next = 0
+
+        self._vectors[self._next] = normalized
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self.maxsize
+        self._size = min(self._size + 1, self.maxsize)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._vectors = None
+        self._values = [None] * self.maxsize
+        self._size = 0
+        self._next = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> Optional[np.ndarray]:
+        """
+        Scale a vector to unit length.
+
+        Args:
+            vector: Vector to normalize
+
+        Returns:
+            Unit-length float32 vector, or None for a zero vector
+        """
+        array = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(array))
+        if norm == 0.0:
+            return None
+        return array / norm
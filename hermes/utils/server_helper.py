@@ -0,0 +1,35 @@
+"""
+Server utilities for Hermes.
+
+This module provides helpers shared by the Hermes ASGI server entry points.
+"""
+
+import logging
+from typing import Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def get_server_backends() -> Tuple[str, str]:
+    """
+    Choose the uvicorn event loop and HTTP parser implementations.
+    
+    uvloop and httptools are preferred when they are installed; otherwise
+    uvicorn's pure-Python asyncio loop and h11 parser are used.
+    
+    Returns:
+        Tuple of (loop, http) names for uvicorn
+    """
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+    
+    return loop, http
@@ -15,6 +15,7 @@ setup(
         "pyzmq>=23.0.0",
         "fastapi>=0.68.0",
         "pydantic>=1.9.0",
+        "orjson>=3.8.0",
     ],
     extras_require={
         "gpu": [
@@ -24,9 +25,14 @@ setup(
         "lancedb": [
             "lancedb>=0.1.0",
         ],
+        "speedups": [
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+            "httptools>=0.6.0",
+        ],
         "dev": [
             "pytest>=6.0.0",
             "pytest-cov>=2.12.0",
+            "fakeredis>=2.30.0",
             "black>=21.5b2",
             "flake8>=3.9.0",
             "mypy>=0.812",
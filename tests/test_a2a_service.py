@@ -0,0 +1,292 @@
+"""
+Tests for the A2A service and outgoing message batching.
+"""
+
+import unittest
+import asyncio
+from unittest.mock import patch
+
+from hermes.core.service_discovery import ServiceRegistry
+from hermes.core.message_bus import MessageBus
+from hermes.core.a2a_service import A2AService, TASK_HISTORY_SIZE
+from hermes.core.message_batcher import MessageBatcher
+
+
+def make_agent_card(agent_id, capabilities=None):
+    """Build a minimal agent card for tests."""
+    return {
+        "agent_id": agent_id,
+        "name": f"Agent {agent_id}",
+        "version": "1.0.0",
+        "capabilities": capabilities or {"general": ["chat"]}
+    }
+
+
+def make_message(recipients, message_id="msg-test"):
+    """Build a minimal A2A message for tests."""
+    return {
+        "id": message_id,
+        "sender": {"id": "sender"},
+        "recipients": recipients,
+        "type": "notification",
+        "content": {"text": "hello"}
+    }
+
+
+class TestA2AService(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the A2AService class."""
+
+    async def asyncSetUp(self):
+        """Set up test environment."""
+        self.message_bus = MessageBus()
+        self.service = A2AService(
+            service_registry=ServiceRegistry(),
+            message_bus=self.message_bus
+        )
+        await self.service.initialize()
+
+    async def test_initialize_is_idempotent(self):
+        """Test that concurrent initialization sets up channels once."""
+        service = A2AService(
+            service_registry=ServiceRegistry(),
+            message_bus=self.message_bus
+        )
+        await asyncio.gather(service.initialize(), service.initialize())
+
+        self.assertTrue(service._channels_initialized)
+
+    async def test_send_message_direct(self):
+        """Test sending a direct message to a registered agent."""
+        await self.service.register_agent(make_agent_card("agent-1"))
+
+        success = await self.service.send_message(
+            make_message([{"type": "direct", "id": "agent-1"}])
+        )
+
+        self.assertTrue(success)
+        self.assertEqual(len(self.message_bus.get_history("agent.agent-1")), 1)
+
+    async def test_outbound_copy_requires_subscriber(self):
+        """Test that the outbound message copy is only published when subscribed."""
+        await self.service.register_agent(make_agent_card("agent-1"))
+        message = make_message([{"type": "direct", "id": "agent-1"}])
+
+        await self.service.send_message(message)
+        self.assertEqual(self.message_bus.get_history("a2a.messages.out"), [])
+
+        await self.message_bus.subscribe_async("a2a.*", lambda envelope: None)
+        await self.service.send_message(message)
+        self.assertEqual(len(self.message_bus.get_history("a2a.messages.out")), 1)
+
+    async def test_send_message_without_recipients_fails(self):
+        """Test that a message without valid recipients is rejected."""
+        success = await self.service.send_message(
+            make_message([{"type": "direct", "id": "missing"}])
+        )
+
+        self.assertFalse(success)
+
+    async def test_capability_index(self):
+        """Test that capability lookups follow registration changes."""
+        await self.service.register_agent(make_agent_card("agent-1", {"general": ["chat"], "tools": {"search": ["web"]}}))
+        await self.service.register_agent(make_agent_card("agent-2", {"general": ["chat"]}))
+
+        self.assertEqual(sorted(self.service._find_agents_by_capability("chat")), ["agent-1", "agent-2"])
+        self.assertEqual(self.service._find_agents_by_capability("web"), ["agent-1"])
+
+        # Re-registration replaces the indexed capabilities
+        await self.service.register_agent(make_agent_card("agent-1", {"general": ["code"]}))
+        self.assertEqual(self.service._find_agents_by_capability("web"), [])
+        self.assertEqual(self.service._find_agents_by_capability("code"), ["agent-1"])
+
+        await self.service.unregister_agent("agent-2")
+        self.assertEqual(self.service._find_agents_by_capability("chat"), [])
+
+    async def test_task_history_is_bounded(self):
+        """Test that task history keeps only the most recent entries."""
+        created = await self.service.create_task({
+            "name": "task",
+            "description": "test task",
+            "required_capabilities": []
+        })
+        task_id = created["task_id"]
+
+        for i in range(TASK_HISTORY_SIZE + 10):
+            await self.service.update_task_status(task_id, "in_progress", message=f"step {i}")
+
+        history = (await self.service.get_task(task_id))["history"]
+        self.assertEqual(len(history), TASK_HISTORY_SIZE)
+        self.assertEqual(history[-1]["message"], f"step {TASK_HISTORY_SIZE + 9}")
+
+    async def test_task_events_published_in_background(self):
+        """Test that task events are published after the call returns."""
+        await self.message_bus.subscribe_async("a2a.tasks", lambda envelope: None)
+        created = await self.service.create_task({
+            "name": "task",
+            "description": "test task",
+            "required_capabilities": []
+        })
+
+        self.assertEqual(self.message_bus.get_history("a2a.tasks"), [])
+
+        await asyncio.gather(*self.service._event_tasks)
+        history = self.message_bus.get_history("a2a.tasks")
+        self.assertEqual(history[-1]["payload"]["task_id"], created["task_id"])
+
+    async def test_events_without_other_subscribers_are_dropped(self):
+        """Test that events only the service itself listens to are not published."""
+        task_spec = {"name": "task", "description": "test task", "required_capabilities": []}
+
+        await self.service.create_task(task_spec)
+        await asyncio.gather(*self.service._event_tasks)
+        self.assertEqual(self.message_bus.get_history("a2a.tasks"), [])
+
+        await self.message_bus.subscribe_async("a2a.tasks", lambda envelope: None)
+        await self.service.create_task(task_spec)
+        await asyncio.gather(*self.service._event_tasks)
+        self.assertEqual(len(self.message_bus.get_history("a2a.tasks")), 1)
+
+    async def test_failed_event_publication_is_logged(self):
+        """Test that events the message bus fails to publish are logged."""
+        await self.message_bus.subscribe_async("a2a.tasks", lambda envelope: None)
+
+        with self.assertLogs("hermes.core.a2a_service", level="WARNING") as logs:
+            self.service._publish_event("a2a.tasks", {"type": "task_created", "data": object()})
+            await asyncio.gather(*self.service._event_tasks)
+            await asyncio.sleep(0)
+
+        self.assertIn("Failed to publish task_created to a2a.tasks", logs.output[0])
+        self.assertEqual(self.service._event_tasks, set())
+
+    async def test_send_messages_batch(self):
+        """Test that batch sending reports per-message results in order."""
+        await self.service.register_agent(make_agent_card("agent-1"))
+
+        results = await self.service.send_messages_batch([
+            make_message([{"type": "direct", "id": "agent-1"}], "msg-1"),
+            make_message([{"type": "direct", "id": "missing"}], "msg-2"),
+            make_message([{"type": "broadcast"}], "msg-3")
+        ])
+
+        self.assertEqual(results, [True, False, True])
+
+    async def test_send_messages_batch_publishes_once(self):
+        """Test that a batch is published with a single message bus call."""
+        await self.service.register_agent(make_agent_card("agent-1"))
+        await self.service.register_agent(make_agent_card("agent-2"))
+
+        with patch.object(self.message_bus, "publish_many_async",
+                          wraps=self.message_bus.publish_many_async) as publish:
+            results = await self.service.send_messages_batch([
+                make_message([{"type": "direct", "id": "agent-1"}], "msg-1"),
+                make_message([{"type": "direct", "id": "agent-2"}], "msg-2")
+            ])
+
+        self.assertEqual(results, [True, True])
+        publish.assert_called_once()
+        self.assertEqual(len(publish.call_args.args[0]), 2)
+
+
+class TestMessageBatcher(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the MessageBatcher class."""
+
+    async def asyncSetUp(self):
+        """Set up test environment."""
+        self.service = A2AService(
+            service_registry=ServiceRegistry(),
+            message_bus=MessageBus()
+        )
+        await self.service.initialize()
+        await self.service.register_agent(make_agent_card("agent-1"))
+
+    async def test_enqueue_without_worker_sends_directly(self):
+        """Test that enqueue falls back to direct delivery when not started."""
+        batcher = MessageBatcher(self.service)
+
+        success = await batcher.enqueue(
+            make_message([{"type": "direct", "id": "agent-1"}])
+        )
+
+        self.assertTrue(success)
+
+    async def test_enqueue_batches_concurrent_messages(self):
+        """Test that concurrently enqueued messages are flushed together."""
+        batch_sizes = []
+        send_messages_batch = A2AService.send_messages_batch
+
+        async def record_batch(service, messages):
+            batch_sizes.append(len(messages))
+            return await send_messages_batch(service, messages)
+
+        # A2AService instances have no __dict__, so patch the class
+        patcher = patch.object(A2AService, "send_messages_batch", record_batch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        batcher = MessageBatcher(self.service, batch_size=10, flush_interval=0.05)
+        batcher.start()
+        try:
+            results = await asyncio.gather(*[
+                batcher.enqueue(
+                    make_message([{"type": "direct", "id": "agent-1"}], f"msg-{i}")
+                )
+                for i in range(5)
+            ])
+        finally:
+            await batcher.stop()
+
+        self.assertEqual(results, [True] * 5)
+        self.assertEqual(batch_sizes, [5])
+
+
+    async def test_stop_delivers_batch_in_flight(self):
+        """Test that stopping the batcher resolves messages it is delivering."""
+        in_flight = asyncio.Event()
+        send_messages_batch = A2AService.send_messages_batch
+
+        async def slow_batch(service, messages):
+            in_flight.set()
+            await asyncio.sleep(0.05)
+            return await send_messages_batch(service, messages)
+
+        patcher = patch.object(A2AService, "send_messages_batch", slow_batch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        batcher = MessageBatcher(self.service, flush_interval=0)
+        batcher.start()
+        sending = asyncio.ensure_future(
+            batcher.enqueue(make_message([{"type": "direct", "id": "agent-1"}]))
+        )
+        await in_flight.wait()
+
+        await asyncio.wait_for(batcher.stop(), timeout=1)
+
+        self.assertTrue(await asyncio.wait_for(sending, timeout=1))
+
+    async def test_cancelled_worker_fails_pending_messages(self):
+        """Test that messages dropped by a cancelled worker don't hang their callers."""
+        in_flight = asyncio.Event()
+
+        async def hanging_batch(service, messages):
+            in_flight.set()
+            await asyncio.Event().wait()
+
+        patcher = patch.object(A2AService, "send_messages_batch", hanging_batch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        batcher = MessageBatcher(self.service, flush_interval=0)
+        batcher.start()
+        sending = asyncio.ensure_future(
+            batcher.enqueue(make_message([{"type": "direct", "id": "agent-1"}]))
+        )
+        await in_flight.wait()
+        batcher._task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await asyncio.wait_for(sending, timeout=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
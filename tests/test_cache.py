@@ -0,0 +1,79 @@
+"""
+Tests for the in-memory cache utilities.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from hermes.utils.cache import TTLCache
+from hermes.utils.semantic_cache import SemanticCache
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test cases for the TTLCache class."""
+
+    def test_get_set_pop(self):
+        """Test basic storage, retrieval and removal."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIn("a", cache)
+        self.assertEqual(cache.pop("a"), 1)
+        self.assertIsNone(cache.get("a"))
+
+    def test_expiry(self):
+        """Test that entries expire after their TTL."""
+        cache = TTLCache(maxsize=10, ttl=5)
+
+        with patch("hermes.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("default", 1)
+            cache.set("short", 2, ttl=1)
+
+        with patch("hermes.utils.cache.time.monotonic", return_value=102.0):
+            self.assertEqual(cache.get("default"), 1)
+            self.assertIsNone(cache.get("short"))
+
+        with patch("hermes.utils.cache.time.monotonic", return_value=106.0):
+            self.assertIsNone(cache.get("default"))
+
+    def test_maxsize_evicts_oldest(self):
+        """Test that the oldest entry is evicted when the cache is full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.get("c"), 3)
+
+
+
+class TestSemanticCache(unittest.TestCase):
+    """Test cases for the SemanticCache class."""
+
+    def test_similar_vectors_match(self):
+        """Test that lookups match vectors above the similarity threshold."""
+        cache = SemanticCache(maxsize=10, threshold=0.9)
+        cache.set([1.0, 0.0], "x")
+        cache.set([0.0, 1.0], "y")
+
+        self.assertEqual(cache.get([2.0, 0.1]), "x")
+        self.assertEqual(cache.get([0.1, 1.0]), "y")
+        self.assertIsNone(cache.get([1.0, 1.0]))
+        self.assertIsNone(cache.get([0.0, 0.0]))
+
+    def test_maxsize_overwrites_oldest(self):
+        """Test that the oldest entry is replaced when the cache is full."""
+        cache = SemanticCache(maxsize=2)
+        cache.set([1.0, 0.0, 0.0], "a")
+        cache.set([0.0, 1.0, 0.0], "b")
+        cache.set([0.0, 0.0, 1.0], "c")
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get([1.0, 0.0, 0.0]))
+        self.assertEqual(cache.get([0.0, 0.0, 1.0]), "c")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Tests for the Hermes LLM client.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from hermes.core.llm_client import (
+    LLMClient, _RETRY_MAX_DELAY, _load_json_object, _json_text, _json_list
+)
+
+
+class HTTPError(Exception):
+    """Error carrying an HTTP status and headers, like aiohttp's response errors."""
+
+    def __init__(self, status, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.headers = headers or {}
+
+
+class TestAnalysisCache(unittest.IsolatedAsyncioTestCase):
+    """Test cases for cached analysis results."""
+
+    async def test_cached_analysis_is_not_shared(self):
+        """Test that modifying a returned analysis does not change later hits."""
+        client = LLMClient()
+        client.generate_with_template = AsyncMock(
+            return_value='{"purpose": "p", "components": ["a", "b"], "summary": "s"}'
+        )
+
+        first = await client.analyze_message("content")
+        first["components"].append("c")
+        second = await client.analyze_message("content")
+
+        client.generate_with_template.assert_awaited_once()
+        self.assertEqual(second["components"], ["a", "b"])
+
+
+class TestRetries(unittest.IsolatedAsyncioTestCase):
+    """Test cases for retrying failed LLM requests."""
+
+    async def asyncSetUp(self):
+        """Set up a client with sleeps patched out."""
+        self.client = LLMClient()
+        self.client.max_retries = 3
+
+        patcher = patch("hermes.core.llm_client.asyncio.sleep", new_callable=AsyncMock)
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_transient_errors_are_retried(self):
+        """Test that rate limiting, server errors and timeouts are retried."""
+        request = AsyncMock(side_effect=[HTTPError(429), HTTPError(503), asyncio.TimeoutError(), "ok"])
+
+        self.assertEqual(await self.client._with_retries(request), "ok")
+        self.assertEqual(request.await_count, 4)
+        self.assertEqual(self.sleep.await_count, 3)
+
+    async def test_client_errors_are_not_retried(self):
+        """Test that other HTTP errors are raised immediately."""
+        request = AsyncMock(side_effect=HTTPError(400))
+
+        with self.assertRaises(HTTPError):
+            await self.client._with_retries(request)
+        self.assertEqual(request.await_count, 1)
+        self.sleep.assert_not_awaited()
+
+    async def test_retries_are_limited(self):
+        """Test that the last error is raised once max_retries is used up."""
+        request = AsyncMock(side_effect=HTTPError(500))
+
+        with self.assertRaises(HTTPError):
+            await self.client._with_retries(request)
+        self.assertEqual(request.await_count, self.client.max_retries + 1)
+
+    async def test_retry_after_is_honored_and_clamped(self):
+        """Test that Retry-After lengthens the delay, up to the maximum."""
+        request = AsyncMock(side_effect=[
+            HTTPError(429, {"Retry-After": "7"}),
+            HTTPError(429, {"Retry-After": "86400"}),
+            HTTPError(429, {"Retry-After": "soon"}),
+            "ok"
+        ])
+
+        await self.client._with_retries(request)
+        delays = [call.args[0] for call in self.sleep.await_args_list]
+
+        self.assertGreaterEqual(delays[0], 7)
+        self.assertLess(delays[0], 7.5)
+        self.assertGreaterEqual(delays[1], _RETRY_MAX_DELAY)
+        self.assertLessEqual(delays[1], _RETRY_MAX_DELAY + 0.25)
+        self.assertLess(delays[2], 7)
+
+
+
+class TestStructuredOutput(unittest.TestCase):
+    """Test cases for parsing analyses returned as JSON objects."""
+
+    def test_load_json_object(self):
+        """Test loading fenced, unexpected and malformed JSON responses."""
+        fenced = 'Here you go:\n```json\n{"purpose": "Routing", "components": []}\n```'
+
+        self.assertEqual(_load_json_object(fenced, ("purpose",)), {"purpose": "Routing", "components": []})
+        self.assertIsNone(_load_json_object('{"answer": 42}', ("purpose", "summary")))
+        self.assertIsNone(_load_json_object('{"purpose": "Routing",', ("purpose",)))
+        self.assertIsNone(_load_json_object("No JSON here", ("purpose",)))
+
+    def test_json_fields(self):
+        """Test that list fields accept lists and comma-separated strings."""
+        self.assertEqual(_json_list(["a", " b ", ""]), ["a", "b"])
+        self.assertEqual(_json_list("a, b,,c"), ["a", "b", "c"])
+        self.assertEqual(_json_list(None), [])
+        self.assertEqual(_json_text("  text ", "Unknown"), "text")
+        self.assertEqual(_json_text("", "Unknown"), "Unknown")
+        self.assertEqual(_json_text(3, "Unknown"), "3")
+
+    def test_parsers_fall_back_to_text(self):
+        """Test that responses without a usable JSON object are parsed as text."""
+        client = LLMClient()
+
+        analysis = client._parse_message_analysis(
+            '```json\n{"purpose": "Routing", "components": "engram, ergon", "priority": "high"}\n```'
+        )
+        self.assertEqual(analysis["purpose"], "Routing")
+        self.assertEqual(analysis["components"], ["engram", "ergon"])
+        self.assertEqual(analysis["data_summary"], "Unknown")
+
+        analysis = client._parse_message_analysis('Purpose: Routing text\n{"purpose": ')
+        self.assertEqual(analysis["purpose"], "Routing text")
+
+        analysis = client._parse_service_analysis('{"capabilities": ["search", "index"]}')
+        self.assertEqual(analysis["capabilities"], ["search", "index"])
+        self.assertEqual(analysis["dependencies"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+"""
+Tests for the MCP service and batched event publication.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from hermes.core.service_discovery import ServiceRegistry
+from hermes.core.message_bus import MessageBus
+from hermes.core.mcp_service import MCPService, CONTEXT_HISTORY_SIZE
+
+
+def make_tool_spec(name):
+    """Build a minimal tool specification for tests."""
+    return {
+        "name": name,
+        "description": f"Tool {name}",
+        "schema": {"type": "object"}
+    }
+
+
+class TestMCPService(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the MCPService class."""
+
+    async def asyncSetUp(self):
+        """Set up test environment."""
+        self.message_bus = MessageBus()
+        self.service = MCPService(
+            service_registry=ServiceRegistry(),
+            message_bus=self.message_bus
+        )
+        await self.service.initialize()
+        self.addAsyncCleanup(self.service.close)
+
+        # Events are only published while someone besides the service listens
+        self.message_bus.subscribe("mcp.*", lambda envelope: None)
+
+    async def test_register_tools_publishes_one_batch(self):
+        """Test that bulk tool registration publishes its events together."""
+        with patch.object(self.message_bus, "publish_many_async",
+                          wraps=self.message_bus.publish_many_async) as publish_many:
+            tool_ids = await self.service.register_tools(
+                [make_tool_spec("a"), make_tool_spec("b"), {"name": "invalid"}]
+            )
+            await self.service._events.flush()
+
+        self.assertEqual(tool_ids[2], "")
+        publish_many.assert_called_once()
+        history = self.message_bus.get_history("mcp.tools")
+        self.assertEqual([e["payload"]["tool_id"] for e in history], tool_ids[:2])
+
+    async def test_unregister_tool_publishes_before_returning(self):
+        """Test that unregistering a tool flushes the queued events."""
+        tool_id = await self.service.register_tool(make_tool_spec("a"))
+
+        self.assertTrue(await self.service.unregister_tool(tool_id))
+        history = self.message_bus.get_history("mcp.tools")
+        self.assertEqual(
+            [e["payload"]["type"] for e in history],
+            ["tool_registered", "tool_unregistered"]
+        )
+
+    async def test_subscriber_can_unregister_tool(self):
+        """Test that a subscriber unregistering a tool does not stall the batcher."""
+        async def unregister_on_registration(envelope):
+            event = envelope["payload"]
+            if event["type"] == "tool_registered":
+                await self.service.unregister_tool(event["tool_id"])
+
+        await self.message_bus.subscribe_async("mcp.tools", unregister_on_registration)
+        tool_id = await self.service.register_tool(make_tool_spec("a"))
+        await asyncio.wait_for(self.service._events.flush(), timeout=1)
+
+        self.assertNotIn(tool_id, self.service.tools)
+        history = self.message_bus.get_history("mcp.tools")
+        self.assertEqual(
+            [e["payload"]["type"] for e in history],
+            ["tool_registered", "tool_unregistered"]
+        )
+
+    async def test_failed_publication_is_logged(self):
+        """Test that events the bus rejects are logged by the worker."""
+        await self.service.register_tool(make_tool_spec("a"))
+        tool_id = await self.service.register_tool(make_tool_spec("b"))
+        self.service.tools[tool_id]["endpoint"] = "http://tool"
+
+        # Sets are not serializable, so the bus rejects the event
+        with self.assertLogs("hermes.core.event_batcher", "WARNING") as logs:
+            await self.service.execute_tool(tool_id, {"values": {1, 2}})
+            await self.service._events.flush()
+
+        self.assertIn("tool_executed", logs.output[0])
+
+    async def test_events_without_subscribers_are_dropped(self):
+        """Test that events are not published when only the service itself listens."""
+        message_bus = MessageBus()
+        service = MCPService(service_registry=ServiceRegistry(), message_bus=message_bus)
+        await service.initialize()
+        self.addAsyncCleanup(service.close)
+
+        await service.create_context({}, {"id": "test"})
+        await service._events.flush()
+        self.assertEqual(message_bus.get_history("mcp.contexts"), [])
+
+        message_bus.subscribe("mcp.contexts", lambda envelope: None)
+        await service.create_context({}, {"id": "test"})
+        await service._events.flush()
+        self.assertEqual(len(message_bus.get_history("mcp.contexts")), 1)
+
+    async def test_find_processors_for_message(self):
+        """Test that processor matching follows registration changes."""
+        for processor_id, capabilities in [("p1", ["text", "summarize"]), ("p2", ["text"]), ("p3", ["image"])]:
+            await self.service.register_processor({
+                "id": processor_id,
+                "name": processor_id,
+                "description": "test processor",
+                "capabilities": capabilities
+            })
+        message = {"content": [{"type": "text"}]}
+
+        self.assertEqual(await self.service._find_processors_for_message(message), ["p1", "p2"])
+        self.assertEqual(
+            await self.service._find_processors_for_message(
+                {**message, "processing": {"capabilities_required": ["summarize"]}}
+            ),
+            ["p1"]
+        )
+        self.assertEqual(await self.service._find_processors_for_message({}), ["p1", "p2", "p3"])
+
+        await self.service.unregister_processor("p1")
+        self.assertEqual(await self.service._find_processors_for_message(message), ["p2"])
+
+    async def test_handle_tool_message_dispatches_by_type(self):
+        """Test that channel messages reach the handler for their type."""
+        await self.service._handle_tool_message({"type": "register_tool", "tool_spec": make_tool_spec("a")})
+        await self.service._handle_tool_message({"type": "unknown"})
+
+        self.assertEqual([tool["name"] for tool in self.service.tools.values()], ["a"])
+
+    async def test_process_message_fanout(self):
+        """Test that fan-out messages are processed by every matching processor."""
+        for processor_id, endpoint in [("p1", "http://p1"), ("p2", None)]:
+            await self.service.register_processor({
+                "id": processor_id,
+                "name": processor_id,
+                "description": "test processor",
+                "capabilities": ["text"],
+                "endpoint": endpoint
+            })
+        message = {
+            "id": "m1",
+            "version": "1.0",
+            "source": {"component": "test"},
+            "content": [{"type": "text"}]
+        }
+
+        self.assertEqual((await self.service.process_message(message))["processed_by"], "p1")
+
+        result = await self.service.process_message({**message, "processing": {"fanout": True}})
+        self.assertEqual(result["processed_by"], ["p1"])
+        self.assertEqual(len(result["results"]), 2)
+        self.assertIn("error", result["results"][1])
+
+    async def test_context_history_is_bounded(self):
+        """Test that context history keeps only the most recent operations."""
+        context_id = await self.service.create_context({}, {"id": "test"})
+
+        for i in range(CONTEXT_HISTORY_SIZE + 10):
+            await self.service.update_context(context_id, {"step": i}, {"id": "test"})
+
+        history = (await self.service.get_context(context_id))["history"]
+        self.assertEqual(len(history), CONTEXT_HISTORY_SIZE)
+        self.assertEqual(history[-1]["operation"], "update")
+
+    async def test_least_recently_used_context_is_evicted(self):
+        """Test that creating contexts beyond the limit evicts the least recently used one."""
+        self.service.max_contexts = 2
+        first = await self.service.create_context({}, {"id": "test"})
+        second = await self.service.create_context({}, {"id": "test"})
+
+        await self.service.get_context(first)
+        third = await self.service.create_context({}, {"id": "test"})
+        await self.service._events.flush()
+
+        self.assertEqual(list(self.service.contexts), [first, third])
+        history = self.message_bus.get_history("mcp.contexts")
+        self.assertEqual(history[-2]["payload"], {"type": "context_evicted", "context_id": second})
+
+    async def test_update_contexts(self):
+        """Test that bulk context updates report per-update results."""
+        context_id = await self.service.create_context({"a": 1}, {"id": "test"})
+
+        results = await self.service.update_contexts([
+            {"context_id": context_id, "updates": {"b": 2}, "source": {"id": "test"}},
+            {"context_id": "missing", "updates": {"b": 2}, "source": {"id": "test"}}
+        ])
+
+        self.assertEqual(results, [True, False])
+        self.assertEqual((await self.service.get_context(context_id))["data"], {"a": 1, "b": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
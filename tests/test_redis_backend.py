@@ -0,0 +1,152 @@
+"""
+Tests for the Redis-backed service registry and message bus.
+"""
+
+import asyncio
+import unittest
+
+import fakeredis
+import redis.asyncio as redis
+
+from hermes.core.redis_backend import RedisServiceRegistry, RedisMessageBus
+
+
+async def wait_until(predicate, timeout=1.0):
+    """Wait until a predicate holds, failing the test after a timeout."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            raise AssertionError("Condition not met before timeout")
+        await asyncio.sleep(0.01)
+
+
+class RedisTestCase(unittest.IsolatedAsyncioTestCase):
+    """Base class providing a connection pool to a fresh fake Redis server."""
+
+    async def asyncSetUp(self):
+        """Set up a fake Redis server."""
+        self.pool = redis.ConnectionPool(
+            connection_class=fakeredis.aioredis.FakeAsyncRedisConnection,
+            server=fakeredis.FakeServer()
+        )
+        self.addAsyncCleanup(self.pool.aclose)
+
+
+class TestRedisServiceRegistry(RedisTestCase):
+    """Test cases for the RedisServiceRegistry class."""
+
+    async def asyncSetUp(self):
+        """Set up two connected registries sharing one Redis server."""
+        await super().asyncSetUp()
+        self.first = RedisServiceRegistry(self.pool)
+        self.second = RedisServiceRegistry(self.pool)
+        for registry in (self.first, self.second):
+            await registry.connect_redis()
+            self.addAsyncCleanup(registry.close_redis)
+
+    async def test_registrations_are_replicated(self):
+        """Test that registrations and unregistrations reach the other registry."""
+        self.first.register("a", "A", "1.0", "http://a", ["x"], metadata={"type": "engine"})
+        await wait_until(lambda: "a" in self.second.services)
+
+        self.assertEqual(self.second.services["a"]["capabilities"], ["x"])
+        self.assertEqual([service["id"] for service in self.second.query(capability="x")], ["a"])
+
+        self.first.unregister("a")
+        await wait_until(lambda: "a" not in self.second.services)
+
+    async def test_connect_loads_existing_registrations(self):
+        """Test that a registry connecting later loads the shared registrations."""
+        self.first.register("a", "A", "1.0", "http://a", ["x"])
+        await wait_until(lambda: "a" in self.second.services)
+
+        late = RedisServiceRegistry(self.pool)
+        await late.connect_redis()
+        self.addAsyncCleanup(late.close_redis)
+
+        self.assertIn("a", late.services)
+
+
+class TestRedisMessageBus(RedisTestCase):
+    """Test cases for the RedisMessageBus class."""
+
+    async def asyncSetUp(self):
+        """Set up two connected message buses sharing one Redis server."""
+        await super().asyncSetUp()
+        self.first = RedisMessageBus(self.pool)
+        self.second = RedisMessageBus(self.pool)
+        for bus in (self.first, self.second):
+            await bus.connect_redis()
+            self.addAsyncCleanup(bus.close_redis)
+
+    def _collect(self, bus, topic):
+        """Subscribe to a topic and return the list of received payloads."""
+        received = []
+        bus.subscribe(topic, lambda envelope: received.append(envelope["payload"]))
+        return received
+
+    async def test_own_messages_are_not_delivered_twice(self):
+        """Test that a bus ignores its own messages echoed back by Redis."""
+        local = self._collect(self.first, "events")
+        remote = self._collect(self.second, "events")
+
+        self.assertTrue(await self.first.publish_async("events", {"n": 1}))
+        await wait_until(lambda: remote)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(local, [{"n": 1}])
+        self.assertEqual(remote, [{"n": 1}])
+
+    async def test_publish_many_keeps_order(self):
+        """Test that messages published together are relayed in order."""
+        remote = self._collect(self.second, "events")
+
+        await self.first.publish_many_async([("events", {"n": i}) for i in range(20)])
+        await wait_until(lambda: len(remote) == 20)
+
+        self.assertEqual(remote, [{"n": i} for i in range(20)])
+
+    async def test_sync_publish_is_relayed(self):
+        """Test that messages published synchronously are relayed."""
+        remote = self._collect(self.second, "events")
+
+        self.assertTrue(self.first.publish("events", {"n": 1}))
+        await wait_until(lambda: remote)
+
+        self.assertEqual(remote, [{"n": 1}])
+
+    async def test_sync_publish_reuses_encoded_payload(self):
+        """Test that a payload serialized by the caller is relayed as given."""
+        remote = self._collect(self.second, "events")
+
+        self.assertTrue(self.first.publish("events", {"n": 1}, encoded=b'{"n":2}'))
+        await wait_until(lambda: remote)
+
+        self.assertEqual(remote, [{"n": 2}])
+
+    async def test_registration_requests_stay_local(self):
+        """Test that registration control topics are not relayed."""
+        remote = self._collect(self.second, "tekton.registration.request")
+        remote_events = self._collect(self.second, "events")
+
+        await self.first.publish_async("tekton.registration.request", {"component_id": "c"})
+        await self.first.publish_async("events", {"n": 1})
+        await wait_until(lambda: remote_events)
+
+        self.assertEqual(remote, [])
+
+    async def test_close_stops_listener(self):
+        """Test that a closed bus no longer receives relayed messages."""
+        remote = self._collect(self.second, "events")
+
+        await self.second.close_redis()
+        await self.first.publish_async("events", {"n": 1})
+        await asyncio.sleep(0.05)
+
+        self.assertIsNone(self.second._listener_task)
+        self.assertEqual(remote, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@
 Tests for the Unified Registration Protocol implementation.
 """
 
+import json
 import unittest
 import asyncio
 import time
@@ -58,6 +59,16 @@ class TestRegistrationToken(unittest.TestCase):
         payload = RegistrationToken.validate(token_str, secret_key)
         self.assertIsNone(payload)
 
+    def test_non_ascii_signature(self):
+        """Test that a non-ASCII signature is rejected rather than raising."""
+        secret_key = "test_secret"
+        token = RegistrationToken(component_id="test_component", secret_key=secret_key)
+        token_dict = json.loads(token.generate())
+        token_dict["signature"] = "sig\u00e9nature"
+
+        payload = RegistrationToken.validate(json.dumps(token_dict), secret_key)
+        self.assertIsNone(payload)
+
 
 class TestRegistrationManager(unittest.TestCase):
     """Test cases for the RegistrationManager class."""
@@ -118,6 +129,40 @@ class TestRegistrationManager(unittest.TestCase):
         args, kwargs = self.message_bus.publish.call_args
         self.assertEqual(kwargs["topic"], "tekton.registration.completed")
     
+    def test_register_components_bulk(self):
+        """Test registering several components with one event."""
+        # Reject the second component
+        self.service_registry.register.side_effect = [True, False, True]
+        
+        components = [
+            {
+                "component_id": f"test_component_{i}",
+                "name": f"Test Component {i}",
+                "version": "1.0.0",
+                "component_type": "test",
+                "endpoint": "localhost:1234",
+                "capabilities": ["test.capability"]
+            }
+            for i in range(3)
+        ]
+        
+        results = self.manager.register_components_bulk(components)
+        
+        # Check results
+        self.assertEqual([success for success, _ in results], [True, False, True])
+        self.assertIsNotNone(results[0][1])
+        self.assertIsNone(results[1][1])
+        self.assertEqual(self.service_registry.register.call_count, 3)
+        
+        # Verify a single aggregated event was published
+        self.message_bus.publish.assert_called_once()
+        args, kwargs = self.message_bus.publish.call_args
+        self.assertEqual(kwargs["topic"], "tekton.registration.completed")
+        self.assertEqual(
+            [c["component_id"] for c in kwargs["message"]["components"]],
+            ["test_component_0", "test_component_2"]
+        )
+    
     def test_unregister_component(self):
         """Test unregistering a component."""
         # Register a component first
@@ -155,6 +200,26 @@ class TestRegistrationManager(unittest.TestCase):
         self.message_bus.publish.assert_called_once()
         args, kwargs = self.message_bus.publish.call_args
         self.assertEqual(kwargs["topic"], "tekton.registration.revoked")
+    
+    def test_heartbeat_token_cache(self):
+        """Test that repeated heartbeats reuse the verified token."""
+        self.service_registry.register.return_value = True
+        success, token_str = self.manager.register_component(
+            component_id="test_component",
+            name="Test Component",
+            version="1.0.0",
+            component_type="test",
+            endpoint="localhost:1234",
+            capabilities=[]
+        )
+        
+        with patch.object(RegistrationToken, "validate", wraps=RegistrationToken.validate) as validate:
+            self.assertTrue(self.manager.send_heartbeat("test_component", token_str))
+            self.assertTrue(self.manager.send_heartbeat("test_component", token_str))
+            self.assertEqual(validate.call_count, 1)
+            
+            # A valid token is still rejected for another component
+            self.assertFalse(self.manager.send_heartbeat("other_component", token_str))
 
 
 class TestRegistrationClient(unittest.TestCase):
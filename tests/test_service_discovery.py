@@ -0,0 +1,67 @@
+"""
+Tests for the service registry.
+"""
+
+import unittest
+
+from hermes.core.service_discovery import ServiceRegistry
+
+
+class TestServiceRegistryQuery(unittest.TestCase):
+    """Test cases for indexed service queries."""
+
+    def setUp(self):
+        """Set up a registry with a few services."""
+        self.registry = ServiceRegistry()
+        self.registry.register("a", "A", "1.0", "http://a", ["x", "y"], metadata={"type": "engine"})
+        self.registry.register("b", "B", "1.0", "http://b", ["x"], metadata={"type": "client"})
+        self.registry.register("c", "C", "1.0", "http://c", ["y"])
+
+    def _ids(self, services):
+        """Return the sorted IDs of a list of services."""
+        return sorted(service["id"] for service in services)
+
+    def test_query_criteria(self):
+        """Test filtering by capability, type and health."""
+        self.registry.set_health("a", True)
+        self.registry.set_health("b", False)
+
+        self.assertEqual(self._ids(self.registry.query()), ["a", "b", "c"])
+        self.assertEqual(self._ids(self.registry.query(capability="x")), ["a", "b"])
+        self.assertEqual(self._ids(self.registry.query(component_type="client")), ["b"])
+        self.assertEqual(self._ids(self.registry.query(capability="y", healthy_only=True)), ["a"])
+        self.assertEqual(self.registry.query(capability="missing"), [])
+
+    def test_empty_criteria_do_not_filter(self):
+        """Test that empty capability and type strings match every service."""
+        self.assertEqual(self._ids(self.registry.query(capability="")), ["a", "b", "c"])
+        self.assertEqual(self._ids(self.registry.query(component_type="")), ["a", "b", "c"])
+
+    def test_iteration_survives_registry_changes(self):
+        """Test that services can change while matches are being iterated."""
+        matches = self.registry.iter_services(capability="x")
+        first_id = next(matches)[0]
+
+        self.registry.register("d", "D", "1.0", "http://d", ["x"])
+        for service_id in ("a", "b"):
+            if service_id != first_id:
+                self.registry.unregister(service_id)
+
+        self.assertEqual(list(matches), [])
+
+    def test_indexes_follow_updates(self):
+        """Test that re-registration and unregistration update the indexes."""
+        self.registry.set_health("a", True)
+        self.registry.register("a", "A", "2.0", "http://a", ["z"])
+
+        self.assertEqual(self._ids(self.registry.query(capability="x")), ["b"])
+        self.assertEqual(self._ids(self.registry.query(capability="z")), ["a"])
+        self.assertEqual(self.registry.query(component_type="engine"), [])
+        self.assertEqual(self.registry.query(healthy_only=True), [])
+
+        self.registry.unregister("b")
+        self.assertEqual(self.registry.query(capability="x"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()